@@ -1,5 +1,17 @@
 from django.contrib import admin
 from .models import Word, Language
+from .pagination import EstimatedCountPaginator
+
+
+@admin.register(Word)
+class WordAdmin(admin.ModelAdmin):
+    list_display = ('word', 'translation', 'language', 'user', 'core', 'added_at')
+    list_filter = ('language', 'core')
+    list_select_related = ('language', 'user')
+    raw_id_fields = ('user', 'lexeme')
+    # The words table is large: estimate the count, never run a second unfiltered COUNT(*)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
 
-admin.site.register(Word)
 admin.site.register(Language)
@@ -1,6 +1,157 @@
+import re
 import django_filters
+from django.db import connection
 from .models import Word, ReadingContent
-from django.db.models import Q
+from .services.word_index import word_suggestion_index
+from .utils.text import normalize_text, to_hiragana
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+
+def word_search_query(terms, language_code=None):
+    """
+    Build a prefix-matching tsquery for ``Word.search_vector``.
+
+    Every term must match (AND), and the last characters of each term may be
+    still being typed, so each one is a prefix match. The normalized spelling
+    of the terms is tried as well, against the normalized search keys in the
+    vector. Returns None when the input has no searchable characters.
+    """
+    if isinstance(terms, str):
+        terms = [terms]
+    tokens = [token for term in terms for token in re.findall(r'\w+', term)]
+    if not tokens:
+        return None
+    config = Word.SEARCH_CONFIGS.get(language_code, Word.DEFAULT_SEARCH_CONFIG)
+    raw = ' & '.join(f"{token}:*" for token in tokens)
+    normalized_tokens = [token for term in terms for token in re.findall(r'\w+', normalize_text(term))]
+    if normalized_tokens and normalized_tokens != [token.lower() for token in tokens]:
+        raw = f"({raw}) | ({' & '.join(f'{token}:*' for token in normalized_tokens)})"
+    return SearchQuery(raw, search_type='raw', config=config)
+
+
+# Facet name -> expression, counted by word_facet_counts()
+WORD_FACETS = {
+    'language': F('language__code'),
+    'category': F('category'),
+    'difficulty_level': F('difficulty_level'),
+    'gender': F('gender'),
+    'part_of_speech': F('part_of_speech'),
+}
+
+
+def word_facet_counts(queryset):
+    """
+    Count the words of ``queryset`` per value of every WORD_FACETS entry in
+    one pass: the filtered rows are grouped by GROUPING SETS, one set per
+    facet plus the empty set for the total.
+    """
+    names = list(WORD_FACETS)
+    columns = queryset.order_by().values(**{f'facet_{name}': WORD_FACETS[name] for name in names})
+    inner_sql, params = columns.query.sql_with_params()
+    facet_columns = ', '.join(f'facet_{name}' for name in names)
+    sql = (
+        f"SELECT {facet_columns}, GROUPING({facet_columns}), COUNT(*) "
+        f"FROM ({inner_sql}) AS words "
+        f"GROUP BY GROUPING SETS ({', '.join(f'(facet_{name})' for name in names)}, ())"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    # GROUPING() sets the bit of every column left out of a row's set; the
+    # first column is the most significant bit
+    all_bits = (1 << len(names)) - 1
+    set_names = {all_bits ^ (1 << (len(names) - 1 - i)): name for i, name in enumerate(names)}
+    total = 0
+    facets = {name: [] for name in names}
+    for row in rows:
+        values, grouping, count = row[:len(names)], row[-2], row[-1]
+        if grouping == all_bits:
+            total = count
+        else:
+            name = set_names[grouping]
+            facets[name].append({'value': values[names.index(name)], 'count': count})
+    for counts in facets.values():
+        counts.sort(key=lambda facet: (-facet['count'], facet['value'] or ''))
+    return {'total': total, 'facets': facets}
+
+
+class WordSearchFilter(filters.SearchFilter):
+    """
+    Full-text ``search`` over the trigger-maintained ``Word.search_vector``
+    (GIN indexed), ordered by rank unless the client passed ``ordering``.
+
+    With ``fuzzy=true`` the search text may be misspelled instead: the
+    in-process spelling index turns it into the known words and
+    translations within a small edit distance, closest first.
+    """
+    # Most spelling candidates a fuzzy search matches against
+    fuzzy_max_terms = 20
+    # Candidates fetched from the all-users spelling index before keeping
+    # the closest ones the caller's words actually contain
+    fuzzy_candidate_terms = 500
+
+    def filter_queryset(self, request, queryset, view):
+        if request.query_params.get('fuzzy') == 'true':
+            return self.filter_fuzzy(request, queryset)
+
+        query = word_search_query(
+            self.get_search_terms(request),
+            request.query_params.get('language'),
+        )
+        if query is None:
+            return queryset
+
+        queryset = queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query)
+        )
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by('-rank', '-added_at')
+        return queryset
+
+    def filter_fuzzy(self, request, queryset):
+        text = ' '.join(self.get_search_terms(request))
+        if not text:
+            return queryset
+        matches = word_suggestion_index.fuzzy_terms(
+            text, request.query_params.get('language'), self.fuzzy_candidate_terms
+        )
+        distances = {}
+        for term, distance, _ in matches:
+            distances.setdefault(term, distance)
+
+        # Other users' words must not crowd out the caller's: keep the
+        # closest candidates that occur in this queryset
+        matching = Q(word_normalized__in=distances) | Q(translation_normalized__in=distances)
+        present = set()
+        for pair in (
+            queryset.filter(matching).order_by()
+            .values_list('word_normalized', 'translation_normalized')
+            .distinct()[:self.fuzzy_candidate_terms]
+        ):
+            present.update(term for term in pair if term in distances)
+        terms = sorted(present, key=lambda term: (distances[term], term))[:self.fuzzy_max_terms]
+        if not terms:
+            return queryset.none()
+
+        queryset = queryset.filter(Q(word_normalized__in=terms) | Q(translation_normalized__in=terms))
+
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.annotate(
+                distance=Case(
+                    *[
+                        When(Q(word_normalized=term) | Q(translation_normalized=term), then=Value(distances[term]))
+                        for term in terms
+                    ],
+                    # Farther than any candidate
+                    default=Value(max(distances.values()) + 1),
+                    output_field=IntegerField(),
+                )
+            ).order_by('distance', '-added_at')
+        return queryset
 
 class WordFilter(django_filters.FilterSet):
     word = django_filters.CharFilter(method='filter_search_fields')
@@ -9,17 +160,33 @@ class WordFilter(django_filters.FilterSet):
     gender = django_filters.CharFilter(field_name="gender", lookup_expr="iexact")
     category = django_filters.CharFilter(field_name="category", lookup_expr="iexact")
     difficulty_level = django_filters.CharFilter(field_name="difficulty_level", lookup_expr="iexact")
+    reading = django_filters.CharFilter(method='filter_reading')
+
+    # Filters that also match anywhere inside the normalized search key
+    normalized_fields = {'word': 'word_normalized', 'translation': 'translation_normalized'}
 
     def filter_search_fields(self, queryset, name, value):
-        return queryset.filter(
-            Q(word__icontains=value) |
-            Q(translation__icontains=value) |
-            Q(example_sentence__icontains=value)
+        query = word_search_query(value, self.data.get('language'))
+        if query is None:
+            return queryset
+        match = Q(search_vector=query)
+        if name in self.normalized_fields:
+            match |= Q(**{f'{self.normalized_fields[name]}__contains': normalize_text(value)})
+        return queryset.filter(match)
+
+    def filter_reading(self, queryset, name, value):
+        """Japanese words whose reading starts with the given kana or romaji"""
+        value = value.strip()
+        if not value:
+            return queryset
+        # Repeats the partial index condition so the planner can use it
+        return queryset.exclude(reading_kana='').filter(
+            Q(reading_kana__startswith=to_hiragana(value)) | Q(reading_romaji__startswith=value.lower())
         )
 
     class Meta:
         model = Word
-        fields = ["word", "translation", "example_sentence", "gender", "category", "difficulty_level"]
+        fields = ["word", "translation", "example_sentence", "gender", "category", "difficulty_level", "reading"]
 
 
 class ReadingContentFilter(django_filters.FilterSet):
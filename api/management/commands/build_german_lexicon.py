@@ -0,0 +1,37 @@
+import csv
+import io
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from api.services.german_lexicon import GENDER_BITS, GermanLexicon
+
+class Command(BaseCommand):
+    help = 'Build the memory-mapped German noun lexicon from a TSV of word, articles and plurals'
+    # Runs at image build time, before the app is configured
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default=str(settings.BASE_DIR / 'api' / 'data' / 'german_nouns.tsv'),
+                            help='TSV file: word, comma separated articles, comma separated plurals or -')
+        parser.add_argument('--output', default=settings.GERMAN_LEXICON_PATH, help='Lexicon file to write')
+
+    def read_entries(self, path):
+        with io.open(path, encoding='utf-8', newline='') as stream:
+            for line_number, row in enumerate(csv.reader(stream, delimiter='\t'), 1):
+                if not row or row[0].startswith('#'):
+                    continue
+                if len(row) != 3:
+                    raise CommandError(f"{path}:{line_number}: expected 3 columns, got {len(row)}")
+                word, genders, plurals = (column.strip() for column in row)
+                genders = [gender.strip() for gender in genders.split(',') if gender.strip()]
+                unknown = set(genders) - set(GENDER_BITS)
+                if unknown:
+                    raise CommandError(f"{path}:{line_number}: unknown article {', '.join(sorted(unknown))}")
+                plurals = [plural.strip() for plural in plurals.split(',') if plural.strip() not in ('', '-')]
+                yield word, genders, plurals
+
+    def handle(self, *args, **options):
+        try:
+            count = GermanLexicon.write(options['output'], self.read_entries(options['path']))
+        except OSError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} nouns to {options['output']}"))
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max, Min
+from api.models import Word
+
+# The oldest copy of each (language, word) in the batch seeds its lexeme
+CREATE_LEXEMES = """
+INSERT INTO api_lexeme (language_id, normalized_word, word, translation, plural_form,
+                        part_of_speech, example_sentence, gender, category,
+                        difficulty_level, source)
+SELECT DISTINCT ON (language_id, word_normalized)
+       language_id, word_normalized, word, translation, plural_form,
+       part_of_speech, example_sentence, gender, category,
+       difficulty_level, 'word'
+  FROM api_word
+ WHERE id >= %(start)s AND id < %(end)s AND lexeme_id IS NULL
+ ORDER BY language_id, word_normalized, id
+    ON CONFLICT ON CONSTRAINT unique_lexeme_per_language DO NOTHING
+"""
+
+# Link words and set the columns that repeat the lexeme to NULL ("inherited");
+# differing values, and values the user left blank, stay the user's own
+LINK_WORDS = """
+UPDATE api_word w
+   SET lexeme_id = l.id,
+       translation = CASE WHEN w.translation = l.translation AND w.translation <> '' THEN NULL ELSE w.translation END,
+       plural_form = CASE WHEN w.plural_form = l.plural_form AND w.plural_form <> '' THEN NULL ELSE w.plural_form END,
+       example_sentence = CASE WHEN w.example_sentence = l.example_sentence AND w.example_sentence <> '' THEN NULL ELSE w.example_sentence END
+  FROM api_lexeme l
+ WHERE w.id >= %(start)s AND w.id < %(end)s
+   AND w.lexeme_id IS NULL
+   AND l.language_id = w.language_id
+   AND l.normalized_word = w.word_normalized
+"""
+
+class Command(BaseCommand):
+    help = 'Move shared linguistic data of words into lexemes, one id range at a time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        bounds = Word.objects.filter(lexeme__isnull=True).aggregate(first=Min('id'), last=Max('id'))
+        if bounds['first'] is None:
+            self.stdout.write(self.style.SUCCESS('All words are linked to lexemes'))
+            return
+
+        linked = 0
+        for start in range(bounds['first'], bounds['last'] + 1, batch_size):
+            params = {'start': start, 'end': start + batch_size}
+            # Short transactions keep row locks brief while the app is running
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(CREATE_LEXEMES, params)
+                cursor.execute(LINK_WORDS, params)
+                linked += cursor.rowcount
+            self.stdout.write(f'Linked words up to id {start + batch_size - 1}')
+
+        self.stdout.write(self.style.SUCCESS(f'Linked {linked} words to lexemes'))
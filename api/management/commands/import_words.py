@@ -0,0 +1,38 @@
+import io
+import os
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from api.services.word_import import FILE_FORMATS, WordImporter
+
+class Command(BaseCommand):
+    help = 'Import a CSV, JSON lines or JSON array vocabulary file into a user\'s words'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import')
+        parser.add_argument('--user', required=True, help='Username of the owner of the imported words')
+        parser.add_argument('--language', help='Language code for rows without one')
+        parser.add_argument('--format', dest='file_format', choices=FILE_FORMATS,
+                            help='File format; guessed from the extension by default')
+        parser.add_argument('--enforce-quota', action='store_true',
+                            help='Stop at the user\'s words limit per language')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist")
+
+        file_format = options['file_format'] or os.path.splitext(options['path'])[1].lstrip('.').lower()
+        if file_format not in FILE_FORMATS:
+            raise CommandError(f"Cannot tell the format of '{options['path']}', use --format")
+
+        importer = WordImporter(user, default_language=options['language'], enforce_quota=options['enforce_quota'])
+        with io.open(options['path'], encoding='utf-8-sig', newline='') as stream:
+            try:
+                result = importer.run(stream, file_format)
+            except ValueError as e:
+                raise CommandError(f"Could not read '{options['path']}': {str(e)}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['inserted']} words, skipped {result['skipped']}, invalid {result['invalid']}"
+        ))
@@ -0,0 +1,89 @@
+import io
+import os
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from api.models import Language, StarterPack, StarterPackWord, Word
+from api.services.word_import import FILE_FORMATS, STAGED_COLUMNS, WordImporter
+
+PACK_COLUMNS = [column for column in STAGED_COLUMNS if column != 'core']
+
+class Command(BaseCommand):
+    help = 'Create or replace starter packs from a vocabulary file, or from the core words of each language'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', help='CSV, JSON lines or JSON array file, e.g. japanese_words.json')
+        parser.add_argument('--slug', help='Pack slug; defaults to the file name')
+        parser.add_argument('--name', help='Pack name; defaults to the slug')
+        parser.add_argument('--description', default='', help='Pack description')
+        parser.add_argument('--language', help='Pack language code; rows in other languages are skipped')
+        parser.add_argument('--format', dest='file_format', choices=FILE_FORMATS,
+                            help='File format; guessed from the extension by default')
+        parser.add_argument('--core', action='store_true',
+                            help='Build a "core-<code>" pack per language from core words')
+
+    def handle(self, *args, **options):
+        if options['core']:
+            for language in Language.objects.all():
+                self.load_core_pack(language)
+        elif options['path']:
+            self.load_file_pack(options)
+        else:
+            raise CommandError('Pass a vocabulary file or --core')
+
+    def load_file_pack(self, options):
+        path = options['path']
+        file_format = options['file_format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        if file_format not in FILE_FORMATS:
+            raise CommandError(f"Cannot tell the format of '{path}', use --format")
+
+        # Rows are validated exactly like a vocabulary import
+        reader = WordImporter(None, default_language=options['language'], enforce_quota=False)
+        with io.open(path, encoding='utf-8-sig', newline='') as stream:
+            try:
+                rows = [row for row in map(reader.clean, reader.read_items(stream, file_format)) if row]
+            except ValueError as e:
+                raise CommandError(f"Could not read '{path}': {str(e)}")
+        if not rows:
+            raise CommandError(f"No valid words in '{path}'")
+
+        language_id = reader.languages.get(options['language']) if options['language'] else rows[0][0]
+        if language_id is None:
+            raise CommandError(f"Language with code '{options['language']}' does not exist")
+        words = [dict(zip(STAGED_COLUMNS, row[1:])) for row in rows if row[0] == language_id]
+
+        slug = options['slug'] or os.path.splitext(os.path.basename(path))[0].replace('_', '-')
+        self.replace_pack(
+            slug, options['name'] or slug, Language.objects.get(pk=language_id), words, options['description']
+        )
+
+    def load_core_pack(self, language):
+        core_words = (
+            Word.objects.filter(language=language, core=True)
+            .select_related('lexeme')
+            .order_by('added_at', 'id')
+        )
+        words = []
+        for word in core_words.iterator(chunk_size=2000):
+            values = {column: getattr(word, column) for column in STAGED_COLUMNS}
+            for field in Word.LEXEME_FIELDS:
+                values[field] = word.lexeme_value(field)
+            words.append(values)
+        if words:
+            self.replace_pack(f"core-{language.code}", f"{language.name} core words", language, words)
+
+    def replace_pack(self, slug, name, language, words, description=''):
+        pack_words = {}
+        for values in words:
+            # The first occurrence of a word wins
+            pack_words.setdefault(values['word'], values)
+
+        with transaction.atomic():
+            pack, _ = StarterPack.objects.update_or_create(
+                slug=slug, defaults={'name': name, 'language': language, 'description': description}
+            )
+            pack.words.all().delete()
+            StarterPackWord.objects.bulk_create([
+                StarterPackWord(pack=pack, position=position, **{column: values[column] for column in PACK_COLUMNS})
+                for position, values in enumerate(pack_words.values())
+            ])
+        self.stdout.write(self.style.SUCCESS(f"Loaded {len(pack_words)} words into starter pack '{slug}'"))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models import Word
+from api.utils.text import normalize_text
+
+class Command(BaseCommand):
+    help = 'Recompute the normalized search keys of words, one id range at a time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--missing', action='store_true',
+                            help='Only words whose word_normalized is still empty')
+
+    def handle(self, *args, **options):
+        words = Word.objects.order_by('id')
+        if options['missing']:
+            words = words.filter(word_normalized='')
+
+        updated = 0
+        last_id = 0
+        while True:
+            rows = list(
+                words.filter(id__gt=last_id)
+                .values_list('id', 'word', 'translation', 'lexeme__translation')[:options['batch_size']]
+            )
+            if not rows:
+                break
+            changed = [
+                Word(
+                    id=pk,
+                    word_normalized=normalize_text(word),
+                    translation_normalized=normalize_text(lexeme_translation if translation is None else translation),
+                )
+                for pk, word, translation, lexeme_translation in rows
+            ]
+            with transaction.atomic():
+                Word.objects.bulk_update(changed, ['word_normalized', 'translation_normalized'])
+            updated += len(changed)
+            last_id = rows[-1][0]
+            self.stdout.write(f'Normalized words up to id {last_id}')
+
+        self.stdout.write(self.style.SUCCESS(f'Normalized {updated} words'))
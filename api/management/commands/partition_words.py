@@ -0,0 +1,313 @@
+import json
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max, Min
+from api.models import Word
+
+TABLE = 'api_word'
+NEW_TABLE = 'api_word_partitioned'
+OLD_TABLE = 'api_word_unpartitioned'
+NEW_SEQUENCE = 'api_word_partitioned_id_seq'
+# Index and key names of the new table until the swap gives it the real ones
+NEW_SUFFIX = '_part'
+OLD_SUFFIX = '_unpart'
+
+PHASES = ('prepare', 'copy', 'swap', 'verify', 'drop-old', 'abort')
+
+# Keeps the new table current while rows are copied over: every write to
+# api_word is replayed on api_word_partitioned. An update is a delete plus
+# an insert, so a changed user_id lands in the right partition.
+MIRROR_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION api_word_mirror() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM {NEW_TABLE} WHERE id = OLD.id AND user_id = OLD.user_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO {NEW_TABLE} SELECT (NEW).*;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER api_word_mirror_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON {TABLE}
+    FOR EACH ROW EXECUTE FUNCTION api_word_mirror();
+"""
+
+DROP_MIRROR_TRIGGER = f"""
+DROP TRIGGER IF EXISTS api_word_mirror_trigger ON {TABLE};
+DROP FUNCTION IF EXISTS api_word_mirror();
+"""
+
+# FOR SHARE makes a concurrent delete or update of a row in the batch wait
+# for this batch to commit, so the mirror trigger always runs after the copy
+# and a deleted row cannot be copied back in from an older snapshot.
+COPY_BATCH = f"""
+INSERT INTO {NEW_TABLE}
+SELECT * FROM {TABLE} WHERE id >= %s AND id < %s FOR SHARE
+    ON CONFLICT DO NOTHING
+"""
+
+
+def renamed(name, suffix):
+    """name with a suffix, cut to fit PostgreSQL's 63 character identifiers"""
+    return name[:63 - len(suffix)] + suffix
+
+
+def rewrite_index_definition(definition, name, table):
+    """A pg_get_indexdef() statement recreated as ``name`` on ``table``"""
+    return re.sub(
+        r'^CREATE (UNIQUE )?INDEX \S+ ON (ONLY )?\S+ ',
+        lambda match: f"CREATE {match.group(1) or ''}INDEX {connection.ops.quote_name(name)} ON {table} ",
+        definition,
+    )
+
+
+def rewrite_trigger_definition(definition, table):
+    """A pg_get_triggerdef() statement recreated on ``table``"""
+    return re.sub(r' ON (\S+\.)?api_word ', f' ON {table} ', definition, count=1)
+
+
+def plan_relations(plan):
+    """Names of the tables an EXPLAIN (FORMAT JSON) plan node and its children scan"""
+    found = {plan['Relation Name']} if 'Relation Name' in plan else set()
+    for child in plan.get('Plans', []):
+        found |= plan_relations(child)
+    return found
+
+
+class Command(BaseCommand):
+    help = (
+        'Move api_word to a table hash-partitioned by user_id without downtime: '
+        'prepare, copy, swap, verify, then drop-old (or abort before the swap)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('phase', choices=PHASES)
+        parser.add_argument('--partitions', type=int, default=16, help='Number of hash partitions (prepare)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Ids copied per transaction (copy)')
+        parser.add_argument('--start-id', type=int, help='Resume the copy from this id (copy)')
+        parser.add_argument('--user', type=int, help='User id whose queries are explained (verify)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql' or connection.pg_version < 130000:
+            raise CommandError('Partitioning api_word needs PostgreSQL 13 or later')
+        getattr(self, options['phase'].replace('-', '_'))(options)
+
+    # Catalog helpers
+
+    def fetch(self, cursor, sql, params=None):
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+    def table_exists(self, cursor, name):
+        return self.fetch(cursor, "SELECT to_regclass(%s) IS NOT NULL", [name])[0][0]
+
+    def is_partitioned(self, cursor, name=TABLE):
+        return bool(self.fetch(cursor, "SELECT 1 FROM pg_class WHERE oid = to_regclass(%s) AND relkind = 'p'", [name]))
+
+    def constraints(self, cursor, table, kinds):
+        return self.fetch(cursor, """
+            SELECT conname, contype, pg_get_constraintdef(oid)
+              FROM pg_constraint
+             WHERE conrelid = %s::regclass AND contype = ANY(%s)
+             ORDER BY conname
+        """, [table, list(kinds)])
+
+    def plain_indexes(self, cursor, table):
+        """Indexes of a table that do not back a primary key or unique constraint"""
+        return self.fetch(cursor, """
+            SELECT c.relname, pg_get_indexdef(i.indexrelid), i.indisunique
+              FROM pg_index i
+              JOIN pg_class c ON c.oid = i.indexrelid
+             WHERE i.indrelid = %s::regclass
+               AND NOT EXISTS (SELECT 1 FROM pg_constraint k WHERE k.conindid = i.indexrelid)
+             ORDER BY c.relname
+        """, [table])
+
+    def index_names(self, cursor, table):
+        return [row[0] for row in self.fetch(cursor, """
+            SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+             WHERE i.indrelid = %s::regclass
+        """, [table])]
+
+    # Phases
+
+    def prepare(self, options):
+        partitions = options['partitions']
+        quote = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            if self.is_partitioned(cursor):
+                raise CommandError(f'{TABLE} is already partitioned')
+            if self.table_exists(cursor, NEW_TABLE):
+                raise CommandError(f'{NEW_TABLE} already exists; run "abort" to start over')
+
+            referencing = self.fetch(cursor, """
+                SELECT conname, conrelid::regclass::text FROM pg_constraint
+                 WHERE contype = 'f' AND confrelid = %s::regclass
+            """, [TABLE])
+            if referencing:
+                # A foreign key cannot reference id alone once the key is (id, user_id)
+                raise CommandError('Foreign keys reference api_word: ' + ', '.join(
+                    f'{name} on {table}' for name, table in referencing
+                ))
+
+            cursor.execute(
+                f"CREATE TABLE {NEW_TABLE} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                "PARTITION BY HASH (user_id)"
+            )
+            # The old id sequence goes away with the old table
+            cursor.execute(f"CREATE SEQUENCE {NEW_SEQUENCE}")
+            cursor.execute(f"ALTER TABLE {NEW_TABLE} ALTER COLUMN id SET DEFAULT nextval('{NEW_SEQUENCE}')")
+            cursor.execute(f"ALTER SEQUENCE {NEW_SEQUENCE} OWNED BY {NEW_TABLE}.id")
+            for remainder in range(partitions):
+                cursor.execute(
+                    f"CREATE TABLE {TABLE}_p{remainder:02d} PARTITION OF {NEW_TABLE} "
+                    f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+                )
+
+            # Unique keys must include the partition key; the primary key becomes (id, user_id)
+            for name, kind, definition in self.constraints(cursor, TABLE, 'puf'):
+                if kind == 'p':
+                    definition = 'PRIMARY KEY (id, user_id)'
+                elif kind == 'u' and 'user_id' not in definition:
+                    raise CommandError(f'{name} does not include user_id and cannot be kept per partition')
+                # Foreign key names are per table, index-backed names are not
+                new_name = name if kind == 'f' else renamed(name, NEW_SUFFIX)
+                cursor.execute(f"ALTER TABLE {NEW_TABLE} ADD CONSTRAINT {quote(new_name)} {definition}")
+
+            # Indexes on the partitioned table are created on every partition
+            for name, definition, unique in self.plain_indexes(cursor, TABLE):
+                if unique and 'user_id' not in definition:
+                    raise CommandError(f'Unique index {name} does not include user_id')
+                cursor.execute(rewrite_index_definition(definition, renamed(name, NEW_SUFFIX), NEW_TABLE))
+
+            for name, definition in self.fetch(cursor, """
+                SELECT tgname, pg_get_triggerdef(oid) FROM pg_trigger
+                 WHERE tgrelid = %s::regclass AND NOT tgisinternal AND tgname <> 'api_word_mirror_trigger'
+            """, [TABLE]):
+                cursor.execute(rewrite_trigger_definition(definition, NEW_TABLE))
+
+            cursor.execute(MIRROR_TRIGGER)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {NEW_TABLE} with {partitions} partitions; writes to {TABLE} are mirrored. Run "copy" next.'
+        ))
+
+    def copy(self, options):
+        with connection.cursor() as cursor:
+            if not self.table_exists(cursor, NEW_TABLE):
+                raise CommandError('Run "prepare" first')
+        # Rows added after this point reach the new table through the mirror trigger
+        bounds = Word.objects.aggregate(first=Min('id'), last=Max('id'))
+        if bounds['first'] is None:
+            self.stdout.write(self.style.SUCCESS('api_word is empty, nothing to copy'))
+            return
+
+        batch_size = options['batch_size']
+        start = options['start_id'] or bounds['first']
+        copied = 0
+        while start <= bounds['last']:
+            # Short transactions keep row locks brief while the app is running
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(COPY_BATCH, [start, start + batch_size])
+                copied += cursor.rowcount
+            start += batch_size
+            self.stdout.write(f'Copied ids below {start}')
+
+        self.stdout.write(self.style.SUCCESS(f'Copied {copied} words. Run "verify", then "swap".'))
+
+    def swap(self, options):
+        quote = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            if not self.table_exists(cursor, NEW_TABLE):
+                raise CommandError('Run "prepare" and "copy" first')
+            # Fail fast instead of queueing every request behind a long transaction
+            cursor.execute("SET LOCAL lock_timeout = '5s'")
+            cursor.execute(f"LOCK TABLE {TABLE}, {NEW_TABLE} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(DROP_MIRROR_TRIGGER)
+
+            old_sequence = self.fetch(cursor, "SELECT pg_get_serial_sequence(%s, 'id')", [TABLE])[0][0]
+            last_id = self.fetch(cursor, f"SELECT COALESCE(MAX(id), 0) FROM {TABLE}")[0][0]
+            if old_sequence:
+                last_id = max(last_id, self.fetch(cursor, f"SELECT last_value FROM {old_sequence}")[0][0])
+
+            # Renaming an index that backs a key renames the key too
+            for name in self.index_names(cursor, TABLE):
+                cursor.execute(f"ALTER INDEX {quote(name)} RENAME TO {quote(renamed(name, OLD_SUFFIX))}")
+            cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+            if old_sequence:
+                cursor.execute(f"ALTER SEQUENCE {old_sequence} RENAME TO {OLD_TABLE}_id_seq")
+
+            cursor.execute(f"ALTER TABLE {NEW_TABLE} RENAME TO {TABLE}")
+            for name in self.index_names(cursor, TABLE):
+                if name.endswith(NEW_SUFFIX):
+                    cursor.execute(f"ALTER INDEX {quote(name)} RENAME TO {quote(name[:-len(NEW_SUFFIX)])}")
+            cursor.execute(f"ALTER SEQUENCE {NEW_SEQUENCE} RENAME TO {TABLE}_id_seq")
+            if last_id:
+                cursor.execute(f"SELECT setval('{TABLE}_id_seq', %s)", [last_id])
+
+        # Autovacuum analyzes the partitions but never the partitioned parent,
+        # whose reltuples stays unset until this runs (see estimated_count).
+        # Re-run ANALYZE api_word after large imports or deletes.
+        self.stdout.write(f'Analyzing {TABLE}...')
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {TABLE}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{TABLE} is now partitioned; the old table is kept as {OLD_TABLE}. Run "verify".'
+        ))
+
+    def verify(self, options):
+        with connection.cursor() as cursor:
+            partitioned = self.is_partitioned(cursor)
+            pairs = [(TABLE, NEW_TABLE)] if not partitioned else [(OLD_TABLE, TABLE)]
+            for source, target in pairs:
+                if self.table_exists(cursor, source) and self.table_exists(cursor, target):
+                    counts = [self.fetch(cursor, f"SELECT count(*) FROM {table}")[0][0] for table in (source, target)]
+                    status = self.style.SUCCESS('OK') if counts[0] == counts[1] else self.style.ERROR('MISMATCH')
+                    self.stdout.write(f'{source}: {counts[0]} rows, {target}: {counts[1]} rows ... {status}')
+
+        if not partitioned:
+            self.stdout.write(f'{TABLE} is not partitioned yet; run "swap" once the counts match')
+            return
+
+        words = Word.objects.filter(user_id=options['user']) if options['user'] else Word.objects.all()
+        sample = words.values_list('user_id', 'language_id').first()
+        if sample is None:
+            self.stdout.write('No words to explain')
+            return
+        user_id, language_id = sample
+        # The shapes of WordViewSet's per-user list and detail queries
+        queries = {
+            'list': Word.objects.filter(user_id=user_id).order_by('-added_at')[:10],
+            'list by language': Word.objects.filter(user_id=user_id, language_id=language_id).order_by('-added_at')[:10],
+            'detail': Word.objects.filter(user_id=user_id, id=0),
+        }
+        failed = False
+        for label, queryset in queries.items():
+            plan = json.loads(queryset.explain(format='json'))[0]['Plan']
+            scanned = sorted(plan_relations(plan))
+            pruned = len(scanned) == 1 and scanned[0] != TABLE
+            failed = failed or not pruned
+            status = self.style.SUCCESS('pruned') if pruned else self.style.ERROR('NOT pruned')
+            self.stdout.write(f'{label}: scans {", ".join(scanned)} ... {status}')
+        if failed:
+            raise CommandError('Some per-user queries scan more than one partition')
+
+    def drop_old(self, options):
+        with connection.cursor() as cursor:
+            if not self.is_partitioned(cursor):
+                raise CommandError(f'{TABLE} is not partitioned; nothing to drop')
+            cursor.execute(f"DROP TABLE IF EXISTS {OLD_TABLE}")
+        self.stdout.write(self.style.SUCCESS(f'Dropped {OLD_TABLE}'))
+
+    def abort(self, options):
+        with transaction.atomic(), connection.cursor() as cursor:
+            if self.is_partitioned(cursor):
+                raise CommandError('The swap is done; restore from the old table by hand if needed')
+            cursor.execute(DROP_MIRROR_TRIGGER)
+            cursor.execute(f"DROP TABLE IF EXISTS {NEW_TABLE}")
+        self.stdout.write(self.style.SUCCESS(f'Dropped {NEW_TABLE} and the mirror trigger'))
@@ -0,0 +1,16 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from api.models import WordTombstone
+
+class Command(BaseCommand):
+    help = 'Delete word tombstones older than the sync retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.WORD_TOMBSTONE_RETENTION_DAYS)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted, _ = WordTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} word tombstones'))
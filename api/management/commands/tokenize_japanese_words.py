@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from api.models import Word
+from api.services.japanese_reading import analyze, is_available
+
+class Command(BaseCommand):
+    help = (
+        'Compute kana readings, romaji and MeCab tokens of Japanese words, one id range at a time. '
+        'Words are read as they are written; run with --missing for those written while MeCab was unavailable.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--missing', action='store_true',
+                            help='Only words whose reading is still empty')
+        parser.add_argument('--user', help='Only the words of this username')
+
+    def handle(self, *args, **options):
+        if not is_available():
+            raise CommandError('MeCab is not available, check MECAB_ARGS and the installed dictionary')
+
+        words = Word.objects.filter(language__code=Word.JAPANESE_CODE).order_by('id')
+        if options['missing']:
+            words = words.filter(reading_kana='')
+        if options['user']:
+            words = words.filter(user__username=options['user'])
+
+        updated = 0
+        last_id = 0
+        while True:
+            rows = list(
+                words.filter(id__gt=last_id)
+                .values_list('id', 'word', 'example_sentence')[:options['batch_size']]
+            )
+            if not rows:
+                break
+            changed = [
+                Word(id=pk, **analyze(word, example_sentence))
+                for pk, word, example_sentence in rows
+            ]
+            # Short transactions keep row locks brief while the app is running
+            with transaction.atomic():
+                Word.objects.bulk_update(changed, Word.READING_FIELDS)
+            updated += len(changed)
+            last_id = rows[-1][0]
+            self.stdout.write(f'Tokenized words up to id {last_id}')
+
+        self.stdout.write(self.style.SUCCESS(f'Tokenized {updated} Japanese words'))
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
-from api.models import Word
+from api.models import Language, Word
+from api.services.page_cache import core_word_pages
 
 class Command(BaseCommand):
     help = 'Update core field for specific word IDs'
@@ -7,4 +8,6 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         word_ids = range(148, 159)  # This will include IDs 148 to 158
         updated = Word.objects.filter(id__in=word_ids).update(core=True)
+        # update() sends no signals, so cached core word pages are invalidated here
+        core_word_pages.bump(*Language.objects.filter(words__id__in=word_ids).values_list('code', flat=True).distinct())
         self.stdout.write(self.style.SUCCESS(f'Successfully updated {updated} words'))
\ No newline at end of file
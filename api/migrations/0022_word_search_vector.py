@@ -0,0 +1,82 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, transaction
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Per-language stemming for the headword and example sentence, plus an unstemmed
+# 'simple' copy of word/translation so queries without a language still match.
+# Translations are always English.
+SEARCH_VECTOR_TRIGGER = """
+CREATE OR REPLACE FUNCTION api_word_search_vector_update() RETURNS trigger AS $$
+DECLARE
+    cfg regconfig;
+BEGIN
+    SELECT (CASE code WHEN 'de' THEN 'german' WHEN 'en' THEN 'english' ELSE 'simple' END)::regconfig
+      INTO cfg
+      FROM api_language
+     WHERE id = NEW.language_id;
+    cfg := COALESCE(cfg, 'simple'::regconfig);
+
+    NEW.search_vector :=
+        setweight(to_tsvector(cfg, COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(NEW.translation, '')), 'B') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.translation, '')), 'B') ||
+        setweight(to_tsvector(cfg, COALESCE(NEW.example_sentence, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER api_word_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF word, translation, example_sentence, language_id
+    ON api_word
+    FOR EACH ROW EXECUTE FUNCTION api_word_search_vector_update();
+"""
+
+# Touching word makes the trigger fill in the vector
+BACKFILL_BATCH = "UPDATE api_word SET word = word WHERE id >= %s AND id < %s"
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS api_word_search_vector_trigger ON api_word;
+DROP FUNCTION IF EXISTS api_word_search_vector_update();
+"""
+
+
+def backfill_search_vector(apps, schema_editor):
+    # One short transaction per id range instead of rewriting the table at once
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(id), MAX(id) FROM api_word")
+        first, last = cursor.fetchone()
+    if first is None:
+        return
+    for start in range(first, last + 1, BACKFILL_BATCH_SIZE):
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(BACKFILL_BATCH, [start, start + BACKFILL_BATCH_SIZE])
+
+
+class Migration(migrations.Migration):
+    # Backfill batches and the concurrent index build run outside one big transaction
+    atomic = False
+
+    dependencies = [
+        ('api', '0021_word_core_alter_readingcontent_level'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='word',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='word_search_vector_gin'),
+        ),
+    ]
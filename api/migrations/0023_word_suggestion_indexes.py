@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:06
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_word_search_vector'),
+    ]
+
+    # Suggestions are served from the in-process WordSuggestionIndex, so
+    # only the extension is needed, for the trigram indexes of 0028
+    operations = [
+        TrigramExtension(),
+    ]
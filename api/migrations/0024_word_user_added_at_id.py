@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_word_suggestion_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['user', 'added_at', 'id'], name='word_user_added_at_id'),
+        ),
+    ]
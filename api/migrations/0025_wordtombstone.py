@@ -0,0 +1,42 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('api', '0024_word_user_added_at_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['user', 'updated_at'], name='word_user_updated_at'),
+        ),
+        migrations.AddField(
+            model_name='wordtombstone',
+            name='language',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='word_tombstones', to='api.language'),
+        ),
+        migrations.AddField(
+            model_name='wordtombstone',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='word_tombstones', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='wordtombstone',
+            index=models.Index(fields=['user', 'deleted_at'], name='api_wordtom_user_id_7e986c_idx'),
+        ),
+    ]
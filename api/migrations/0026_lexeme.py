@@ -0,0 +1,102 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:17
+
+from importlib import import_module
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+search_vector = import_module('api.migrations.0022_word_search_vector')
+
+# Same vector as 0022, with blank translation/example_sentence read from the
+# linked lexeme; editing a lexeme refreshes the vectors of its words.
+LEXEME_SEARCH_VECTOR_TRIGGER = """
+CREATE OR REPLACE FUNCTION api_word_search_vector_update() RETURNS trigger AS $$
+DECLARE
+    cfg regconfig;
+    lexeme_translation text;
+    lexeme_example_sentence text;
+BEGIN
+    SELECT (CASE code WHEN 'de' THEN 'german' WHEN 'en' THEN 'english' ELSE 'simple' END)::regconfig
+      INTO cfg
+      FROM api_language
+     WHERE id = NEW.language_id;
+    cfg := COALESCE(cfg, 'simple'::regconfig);
+
+    IF NEW.lexeme_id IS NOT NULL THEN
+        SELECT translation, example_sentence
+          INTO lexeme_translation, lexeme_example_sentence
+          FROM api_lexeme
+         WHERE id = NEW.lexeme_id;
+    END IF;
+    lexeme_translation := COALESCE(NULLIF(NEW.translation, ''), lexeme_translation, '');
+    lexeme_example_sentence := COALESCE(NULLIF(NEW.example_sentence, ''), lexeme_example_sentence, '');
+
+    NEW.search_vector :=
+        setweight(to_tsvector(cfg, COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('english', lexeme_translation), 'B') ||
+        setweight(to_tsvector('simple', lexeme_translation), 'B') ||
+        setweight(to_tsvector(cfg, lexeme_example_sentence), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS api_word_search_vector_trigger ON api_word;
+CREATE TRIGGER api_word_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF word, translation, example_sentence, language_id, lexeme_id
+    ON api_word
+    FOR EACH ROW EXECUTE FUNCTION api_word_search_vector_update();
+
+CREATE OR REPLACE FUNCTION api_lexeme_refresh_words() RETURNS trigger AS $$
+BEGIN
+    UPDATE api_word SET lexeme_id = lexeme_id WHERE lexeme_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER api_lexeme_refresh_words_trigger
+    AFTER UPDATE OF translation, example_sentence
+    ON api_lexeme
+    FOR EACH ROW EXECUTE FUNCTION api_lexeme_refresh_words();
+"""
+
+DROP_LEXEME_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS api_lexeme_refresh_words_trigger ON api_lexeme;
+DROP FUNCTION IF EXISTS api_lexeme_refresh_words();
+DROP TRIGGER IF EXISTS api_word_search_vector_trigger ON api_word;
+""" + search_vector.SEARCH_VECTOR_TRIGGER
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_wordtombstone'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Lexeme',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_word', models.CharField(max_length=100)),
+                ('word', models.CharField(max_length=100)),
+                ('plural_form', models.CharField(blank=True, max_length=100)),
+                ('translation', models.CharField(blank=True, max_length=200)),
+                ('part_of_speech', models.CharField(blank=True, max_length=50)),
+                ('example_sentence', models.TextField(blank=True)),
+                ('gender', models.CharField(default='n/a', max_length=3)),
+                ('category', models.CharField(blank=True, max_length=50)),
+                ('language', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lexemes', to='api.language')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='lexeme',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.RESTRICT, related_name='words', to='api.lexeme'),
+        ),
+        migrations.AddConstraint(
+            model_name='lexeme',
+            constraint=models.UniqueConstraint(fields=('language', 'normalized_word'), name='unique_lexeme_per_language'),
+        ),
+        migrations.RunSQL(LEXEME_SEARCH_VECTOR_TRIGGER, DROP_LEXEME_SEARCH_VECTOR_TRIGGER),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_lexeme'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(condition=models.Q(('category', 'featured')), fields=['added_at'], name='word_featured_added_at'),
+        ),
+    ]
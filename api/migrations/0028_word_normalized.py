@@ -0,0 +1,152 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:24
+
+import unicodedata
+from importlib import import_module
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+
+lexeme = import_module('api.migrations.0026_lexeme')
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def normalize_text(text):
+    """Frozen copy of api.utils.text.normalize_text as of this migration"""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = ''.join(
+        char for char in unicodedata.normalize('NFD', text)
+        if not 0x0300 <= ord(char) <= 0x036F
+    )
+    text = unicodedata.normalize('NFC', text)
+    return ''.join(chr(ord(char) - 0x60) if 0x30A1 <= ord(char) <= 0x30F6 else char for char in text)
+
+# As in 0026, plus unstemmed entries for the normalized search keys so that
+# "strasse" finds "Straße" and hiragana finds katakana
+NORMALIZED_SEARCH_VECTOR_TRIGGER = """
+CREATE OR REPLACE FUNCTION api_word_search_vector_update() RETURNS trigger AS $$
+DECLARE
+    cfg regconfig;
+    lexeme_translation text;
+    lexeme_example_sentence text;
+BEGIN
+    SELECT (CASE code WHEN 'de' THEN 'german' WHEN 'en' THEN 'english' ELSE 'simple' END)::regconfig
+      INTO cfg
+      FROM api_language
+     WHERE id = NEW.language_id;
+    cfg := COALESCE(cfg, 'simple'::regconfig);
+
+    IF NEW.lexeme_id IS NOT NULL THEN
+        SELECT translation, example_sentence
+          INTO lexeme_translation, lexeme_example_sentence
+          FROM api_lexeme
+         WHERE id = NEW.lexeme_id;
+    END IF;
+    lexeme_translation := COALESCE(NULLIF(NEW.translation, ''), lexeme_translation, '');
+    lexeme_example_sentence := COALESCE(NULLIF(NEW.example_sentence, ''), lexeme_example_sentence, '');
+
+    NEW.search_vector :=
+        setweight(to_tsvector(cfg, COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.word_normalized, '')), 'A') ||
+        setweight(to_tsvector('english', lexeme_translation), 'B') ||
+        setweight(to_tsvector('simple', lexeme_translation), 'B') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.translation_normalized, '')), 'B') ||
+        setweight(to_tsvector(cfg, lexeme_example_sentence), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS api_word_search_vector_trigger ON api_word;
+CREATE TRIGGER api_word_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF word, translation, example_sentence, language_id, lexeme_id,
+                               word_normalized, translation_normalized
+    ON api_word
+    FOR EACH ROW EXECUTE FUNCTION api_word_search_vector_update();
+"""
+
+RESTORE_LEXEME_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS api_lexeme_refresh_words_trigger ON api_lexeme;
+DROP FUNCTION IF EXISTS api_lexeme_refresh_words();
+""" + lexeme.LEXEME_SEARCH_VECTOR_TRIGGER
+
+
+def backfill_normalized(apps, schema_editor):
+    # The migration is not atomic: each batch commits on its own, so row
+    # locks are held for one batch only and the search vector of each row
+    # is recomputed (by the trigger) in that same short transaction
+    Word = apps.get_model('api', 'Word')
+    last_id = 0
+    while True:
+        rows = list(
+            Word.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'word', 'translation', 'lexeme__translation')[:BACKFILL_BATCH_SIZE]
+        )
+        if not rows:
+            return
+        with transaction.atomic(using=schema_editor.connection.alias):
+            Word.objects.bulk_update(
+                [
+                    Word(
+                        id=pk,
+                        word_normalized=normalize_text(word),
+                        translation_normalized=normalize_text(translation or lexeme_translation),
+                    )
+                    for pk, word, translation, lexeme_translation in rows
+                ],
+                ['word_normalized', 'translation_normalized'],
+            )
+        last_id = rows[-1][0]
+
+
+# One statement each: DROP INDEX CONCURRENTLY cannot share a transaction
+DROP_LOWER_WORD_INDEXES = [
+    "DROP INDEX CONCURRENTLY IF EXISTS word_lower_prefix",
+    "DROP INDEX CONCURRENTLY IF EXISTS word_lower_trgm",
+]
+
+
+class Migration(migrations.Migration):
+    # Backfill batches and concurrent index builds run outside one big transaction
+    atomic = False
+
+    dependencies = [
+        ('api', '0027_word_featured_added_at'),
+    ]
+
+    operations = [
+        # lower(word) indexes an earlier 0023 built; no longer in the model state
+        migrations.RunSQL(DROP_LOWER_WORD_INDEXES, migrations.RunSQL.noop),
+        migrations.AddField(
+            model_name='word',
+            name='translation_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='word_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunSQL(NORMALIZED_SEARCH_VECTOR_TRIGGER, RESTORE_LEXEME_SEARCH_VECTOR_TRIGGER),
+        migrations.RunPython(backfill_normalized, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='word',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('word_normalized', name='text_pattern_ops'), name='word_normalized_prefix'),
+        ),
+        AddIndexConcurrently(
+            model_name='word',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('translation_normalized', name='text_pattern_ops'), name='word_translation_norm_prefix'),
+        ),
+        AddIndexConcurrently(
+            model_name='word',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('word_normalized', name='gin_trgm_ops'), name='word_normalized_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='word',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('translation_normalized', name='gin_trgm_ops'), name='word_translation_norm_trgm'),
+        ),
+    ]
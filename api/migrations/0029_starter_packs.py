@@ -0,0 +1,55 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0028_word_normalized'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StarterPack',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('language', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='starter_packs', to='api.language')),
+            ],
+            options={
+                'ordering': ['language', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StarterPackWord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('word', models.CharField(max_length=100)),
+                ('plural_form', models.CharField(blank=True, max_length=100)),
+                ('translation', models.CharField(blank=True, max_length=200)),
+                ('part_of_speech', models.CharField(blank=True, max_length=50)),
+                ('example_sentence', models.TextField(blank=True)),
+                ('gender', models.CharField(choices=[('der', 'Masculine'), ('die', 'Feminine'), ('das', 'Neuter'), ('n/a', 'Not Applicable')], default='n/a', max_length=3)),
+                ('difficulty_level', models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], default='medium', max_length=50)),
+                ('category', models.CharField(blank=True, max_length=50)),
+                ('image_url', models.URLField(blank=True, max_length=500, null=True)),
+                ('word_normalized', models.TextField(blank=True, default='', editable=False)),
+                ('translation_normalized', models.TextField(blank=True, default='', editable=False)),
+                ('pack', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='words', to='api.starterpack')),
+            ],
+            options={
+                'ordering': ['pack', 'position', 'id'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='starterpackword',
+            constraint=models.UniqueConstraint(fields=('pack', 'word'), name='unique_word_per_starter_pack'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0029_starter_packs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lexeme',
+            name='difficulty_level',
+            field=models.CharField(default='medium', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='lexeme',
+            name='source',
+            field=models.CharField(choices=[('word', 'User word'), ('llm', 'Generated')], default='word', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='lexeme',
+            index=models.Index(fields=['language', 'category', 'difficulty_level'], name='lexeme_language_category'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:36
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0030_lexeme_translation_memory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='reading_kana',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='reading_romaji',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='tokens',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('reading_kana', name='text_pattern_ops'), condition=models.Q(('reading_kana', ''), _negated=True), name='word_reading_kana_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('reading_romaji', name='text_pattern_ops'), condition=models.Q(('reading_kana', ''), _negated=True), name='word_reading_romaji_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('tokens', name='jsonb_path_ops'), condition=models.Q(('reading_kana', ''), _negated=True), name='word_tokens_gin'),
+        ),
+    ]
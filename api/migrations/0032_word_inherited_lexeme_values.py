@@ -0,0 +1,80 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:50
+
+from importlib import import_module
+
+from django.db import migrations, models
+
+normalized = import_module('api.migrations.0028_word_normalized')
+
+# As in 0028, but only NULL columns are read from the lexeme: a blank the
+# user saved stays blank
+INHERITED_SEARCH_VECTOR_TRIGGER = """
+CREATE OR REPLACE FUNCTION api_word_search_vector_update() RETURNS trigger AS $$
+DECLARE
+    cfg regconfig;
+    lexeme_translation text;
+    lexeme_example_sentence text;
+BEGIN
+    SELECT (CASE code WHEN 'de' THEN 'german' WHEN 'en' THEN 'english' ELSE 'simple' END)::regconfig
+      INTO cfg
+      FROM api_language
+     WHERE id = NEW.language_id;
+    cfg := COALESCE(cfg, 'simple'::regconfig);
+
+    IF NEW.lexeme_id IS NOT NULL AND (NEW.translation IS NULL OR NEW.example_sentence IS NULL) THEN
+        SELECT translation, example_sentence
+          INTO lexeme_translation, lexeme_example_sentence
+          FROM api_lexeme
+         WHERE id = NEW.lexeme_id;
+    END IF;
+    lexeme_translation := COALESCE(NEW.translation, lexeme_translation, '');
+    lexeme_example_sentence := COALESCE(NEW.example_sentence, lexeme_example_sentence, '');
+
+    NEW.search_vector :=
+        setweight(to_tsvector(cfg, COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.word, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.word_normalized, '')), 'A') ||
+        setweight(to_tsvector('english', lexeme_translation), 'B') ||
+        setweight(to_tsvector('simple', lexeme_translation), 'B') ||
+        setweight(to_tsvector('simple', COALESCE(NEW.translation_normalized, '')), 'B') ||
+        setweight(to_tsvector(cfg, lexeme_example_sentence), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+# Nothing is marked inherited here: a blank on a linked word may be the
+# user's own, and compact_words now writes NULL itself for the values it
+# clears. Going back, inherited values become blanks again.
+UNMARK_INHERITED = """
+UPDATE api_word SET translation = '' WHERE translation IS NULL;
+UPDATE api_word SET plural_form = '' WHERE plural_form IS NULL;
+UPDATE api_word SET example_sentence = '' WHERE example_sentence IS NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0031_word_readings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='word',
+            name='example_sentence',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='word',
+            name='plural_form',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='word',
+            name='translation',
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.RunSQL(INHERITED_SEARCH_VECTOR_TRIGGER, normalized.NORMALIZED_SEARCH_VECTOR_TRIGGER),
+        migrations.RunSQL(migrations.RunSQL.noop, UNMARK_INHERITED),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.20 on 2026-10-17 21:55
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0032_word_inherited_lexeme_values'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lexeme',
+            name='lexeme_language_category',
+        ),
+        migrations.AddIndex(
+            model_name='lexeme',
+            index=models.Index(models.F('language'), django.db.models.functions.text.Upper('category'), models.F('difficulty_level'), name='lexeme_language_category'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0033_lexeme_category_upper'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='starterpackword',
+            name='reading_kana',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='starterpackword',
+            name='reading_romaji',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='starterpackword',
+            name='tokens',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
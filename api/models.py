@@ -1,5 +1,11 @@
 from django.db import models
+from django.db.models import DEFERRED
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from api.services.japanese_reading import analyze as analyze_japanese
+from api.utils.text import normalize_text
 
 class Language(models.Model):
     """Model to represent a language, e.g. English or German"""
@@ -12,13 +18,67 @@ class Language(models.Model):
     class Meta:
         ordering = ['name'] 
 
-class Word(models.Model):
+class Lexeme(models.Model):
+    """
+    Canonical linguistic data for a word in a language, shared by every
+    user's Word that links to it
+    """
+    language = models.ForeignKey(Language, related_name='lexemes', on_delete=models.CASCADE)
+    normalized_word = models.CharField(max_length=100)
     word = models.CharField(max_length=100)
-    language = models.ForeignKey(Language, related_name='words', on_delete=models.CASCADE)
     plural_form = models.CharField(max_length=100, blank=True)
     translation = models.CharField(max_length=200, blank=True)
-    part_of_speech = models.CharField(max_length=50, blank=True) # ex: noun, verb, etc.
+    part_of_speech = models.CharField(max_length=50, blank=True)
     example_sentence = models.TextField(blank=True)
+    gender = models.CharField(max_length=3, default='n/a')
+    category = models.CharField(max_length=50, blank=True)
+    difficulty_level = models.CharField(max_length=50, default='medium')
+    # Where the entry came from; the translation memory serves both kinds
+    source = models.CharField(
+        max_length=10,
+        choices=[('word', 'User word'), ('llm', 'Generated')],
+        default='word'
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['language', 'normalized_word'], name='unique_lexeme_per_language')
+        ]
+        indexes = [
+            # Serves TranslationMemory.for_category's case-insensitive category match
+            models.Index(
+                models.F('language'), Upper('category'), models.F('difficulty_level'),
+                name='lexeme_language_category',
+            ),
+        ]
+
+    def __str__(self):
+        return self.word
+
+    @staticmethod
+    def normalize(word):
+        return normalize_text(word)
+
+class Word(models.Model):
+    # Columns a linked Word leaves NULL while it agrees with its lexeme;
+    # reads fall back to the lexeme's value. Anything else, '' included, is
+    # the user's own value.
+    LEXEME_FIELDS = ('translation', 'plural_form', 'example_sentence')
+
+    # Text search configuration per Language.code; anything else uses 'simple'.
+    # Keep in sync with the api_word_search_vector_update() trigger.
+    SEARCH_CONFIGS = {'de': 'german', 'en': 'english'}
+    DEFAULT_SEARCH_CONFIG = 'simple'
+
+    JAPANESE_CODE = 'jp'
+    READING_FIELDS = ('reading_kana', 'reading_romaji', 'tokens')
+
+    word = models.CharField(max_length=100)
+    language = models.ForeignKey(Language, related_name='words', on_delete=models.CASCADE)
+    plural_form = models.CharField(max_length=100, blank=True, null=True)
+    translation = models.CharField(max_length=200, blank=True, null=True)
+    part_of_speech = models.CharField(max_length=50, blank=True) # ex: noun, verb, etc.
+    example_sentence = models.TextField(blank=True, null=True)
     gender = models.CharField(
         max_length=3, 
         choices=[('der', 'Masculine'), ('die', 'Feminine'), ('das', 'Neuter'), ('n/a', 'Not Applicable')], 
@@ -35,12 +95,73 @@ class Word(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='word_entries')
     core = models.BooleanField(default=False, blank=True, null=True)
+    lexeme = models.ForeignKey(Lexeme, related_name='words', on_delete=models.RESTRICT, null=True, blank=True)
+    # Search keys (see normalize_text) of word and of the translation clients
+    # see, kept current by save(); bulk writes call refresh_normalized()
+    word_normalized = models.TextField(blank=True, default='', editable=False)
+    translation_normalized = models.TextField(blank=True, default='', editable=False)
+    # Japanese words only: hiragana reading and romaji of the word, and MeCab
+    # tokens of the word and example sentence, kept current by save()
+    reading_kana = models.TextField(blank=True, default='', editable=False)
+    reading_romaji = models.TextField(blank=True, default='', editable=False)
+    tokens = models.JSONField(blank=True, default=dict, editable=False)
+    # Maintained by a database trigger from word, translation and example_sentence
+    search_vector = SearchVectorField(null=True, editable=False)
 
+    # The partition_words command may have made api_word a table
+    # hash-partitioned by user_id, with the primary key (id, user_id).
+    # Later migrations then run against the partitioned table: unique
+    # constraints must include user, and AddIndexConcurrently (CREATE INDEX
+    # CONCURRENTLY) fails there; use a plain AddIndex, which builds the
+    # index partition by partition.
     class Meta:
         indexes = [
             models.Index(fields=['user']),  
             models.Index(fields=['language']),  
             models.Index(fields=['user', 'language']),
+            models.Index(fields=['user', 'added_at', 'id'], name='word_user_added_at_id'),
+            models.Index(fields=['user', 'updated_at'], name='word_user_updated_at'),
+            # The public featured list only ever reads this small slice
+            models.Index(
+                fields=['added_at'],
+                condition=models.Q(category='featured'),
+                name='word_featured_added_at',
+            ),
+            GinIndex(fields=['search_vector'], name='word_search_vector_gin'),
+            # Equality and prefix (LIKE 'abc%') lookups on the search keys,
+            # trigram indexes for substring (LIKE '%abc%') filters
+            models.Index(
+                OpClass('word_normalized', name='text_pattern_ops'),
+                name='word_normalized_prefix',
+            ),
+            models.Index(
+                OpClass('translation_normalized', name='text_pattern_ops'),
+                name='word_translation_norm_prefix',
+            ),
+            GinIndex(
+                OpClass('word_normalized', name='gin_trgm_ops'),
+                name='word_normalized_trgm',
+            ),
+            GinIndex(
+                OpClass('translation_normalized', name='gin_trgm_ops'),
+                name='word_translation_norm_trgm',
+            ),
+            # Prefix lookups by reading; only Japanese words have one
+            models.Index(
+                OpClass('reading_kana', name='text_pattern_ops'),
+                name='word_reading_kana_prefix',
+                condition=~models.Q(reading_kana=''),
+            ),
+            models.Index(
+                OpClass('reading_romaji', name='text_pattern_ops'),
+                name='word_reading_romaji_prefix',
+                condition=~models.Q(reading_kana=''),
+            ),
+            GinIndex(
+                OpClass('tokens', name='jsonb_path_ops'),
+                name='word_tokens_gin',
+                condition=~models.Q(reading_kana=''),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(fields=['user', 'language', 'word'], name='unique_word_per_user_language')
@@ -50,6 +171,168 @@ class Word(models.Model):
     def __str__(self):
         return self.word
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was loaded so signal handlers can tell what a save changed
+        instance._loaded_values = dict(
+            zip(field_names, (value for value in values if value is not DEFERRED))
+        )
+        return instance
+
+    @classmethod
+    def from_returning(cls, columns, row, connection):
+        """
+        A Word from a raw ``RETURNING`` row, each value converted the way a
+        query converts it (jsonb arrives as text, for one).
+        """
+        values = {}
+        for column, value in zip(columns, row):
+            field = cls._meta.get_field(column)
+            if value is not None:
+                for converter in field.get_db_converters(connection):
+                    value = converter(value, field.get_col(cls._meta.db_table), connection)
+            values[field.attname] = value
+        return cls(**values)
+
+    def lexeme_value(self, field):
+        """The value clients see for one of LEXEME_FIELDS"""
+        value = getattr(self, field)
+        if value is None:
+            # Only inherited values load the lexeme
+            return getattr(self.lexeme, field) if self.lexeme_id else ''
+        return value
+
+    def detach_lexeme(self):
+        """Copy the inherited values back in and drop the lexeme link"""
+        for field in self.LEXEME_FIELDS:
+            setattr(self, field, self.lexeme_value(field))
+        self.lexeme = None
+
+    def refresh_normalized(self):
+        self.word_normalized = normalize_text(self.word)
+        self.translation_normalized = normalize_text(self.lexeme_value('translation'))
+
+    def refresh_readings(self):
+        """
+        Recompute the reading columns; they are cleared for other languages
+        and left as they are if MeCab is unavailable.
+        """
+        readings = self.readings(self.language.code, self.word, self.example_sentence)
+        if readings is not None:
+            for field in self.READING_FIELDS:
+                setattr(self, field, readings[field])
+
+    @classmethod
+    def readings(cls, language_code, word, example_sentence):
+        """
+        READING_FIELDS values of a word: empty outside Japanese, None for a
+        Japanese word while MeCab is unavailable.
+        """
+        if language_code != cls.JAPANESE_CODE:
+            return {'reading_kana': '', 'reading_romaji': '', 'tokens': {}}
+        return analyze_japanese(word, example_sentence or '')
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_values', None)
+        changed = []
+        if not loaded or any(
+            loaded.get(field) != getattr(self, field) for field in ('word', 'example_sentence', 'language_id')
+        ):
+            self.refresh_readings()
+            changed += self.READING_FIELDS
+        if self.lexeme_id and loaded and (
+            loaded.get('word') != self.word or loaded.get('language_id') != self.language_id
+        ):
+            # A renamed word is no longer the lexeme's word
+            self.detach_lexeme()
+            changed += [*self.LEXEME_FIELDS, 'lexeme']
+        if self.translation is None and loaded and loaded.get('lexeme_id') == self.lexeme_id:
+            # Still the lexeme's translation, whose key was stored with it
+            self.word_normalized = normalize_text(self.word)
+            changed.append('word_normalized')
+        else:
+            self.refresh_normalized()
+            changed += ['word_normalized', 'translation_normalized']
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']).union(changed)
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+class StarterPack(models.Model):
+    """A curated set of words that new users copy into their vocabulary"""
+    slug = models.SlugField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    language = models.ForeignKey(Language, related_name='starter_packs', on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['language', 'name']
+
+    def __str__(self):
+        return self.name
+
+class StarterPackWord(models.Model):
+    """
+    One word of a starter pack, stored with the same columns as Word
+    (search keys included) so a pack can be cloned with INSERT ... SELECT
+    """
+    pack = models.ForeignKey(StarterPack, related_name='words', on_delete=models.CASCADE)
+    position = models.PositiveIntegerField(default=0)
+    word = models.CharField(max_length=100)
+    plural_form = models.CharField(max_length=100, blank=True)
+    translation = models.CharField(max_length=200, blank=True)
+    part_of_speech = models.CharField(max_length=50, blank=True)
+    example_sentence = models.TextField(blank=True)
+    gender = models.CharField(max_length=3, choices=Word._meta.get_field('gender').choices, default='n/a')
+    difficulty_level = models.CharField(
+        max_length=50, choices=Word._meta.get_field('difficulty_level').choices, default='medium'
+    )
+    category = models.CharField(max_length=50, blank=True)
+    image_url = models.URLField(max_length=500, blank=True, null=True)
+    word_normalized = models.TextField(blank=True, default='', editable=False)
+    translation_normalized = models.TextField(blank=True, default='', editable=False)
+    reading_kana = models.TextField(blank=True, default='', editable=False)
+    reading_romaji = models.TextField(blank=True, default='', editable=False)
+    tokens = models.JSONField(blank=True, default=dict, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['pack', 'word'], name='unique_word_per_starter_pack')
+        ]
+        ordering = ['pack', 'position', 'id']
+
+    def __str__(self):
+        return self.word
+
+    def refresh_normalized(self):
+        self.word_normalized = normalize_text(self.word)
+        self.translation_normalized = normalize_text(self.translation)
+
+    def save(self, *args, **kwargs):
+        self.refresh_normalized()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']).union(['word_normalized', 'translation_normalized'])
+        super().save(*args, **kwargs)
+
+class WordTombstone(models.Model):
+    """Marks a deleted Word so offline clients can drop it on their next sync"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='word_tombstones')
+    language = models.ForeignKey(Language, on_delete=models.CASCADE, related_name='word_tombstones')
+    word_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'deleted_at']),
+        ]
+
 class SubscriptionPlan(models.Model):
     PLAN_FREE = 'free'
     PLAN_BASIC = 'basic'
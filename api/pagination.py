@@ -0,0 +1,276 @@
+import hashlib
+import json
+import random
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def row_value(row, name):
+    """Read a column from either a model instance or a values() dict."""
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def encode_position(added_at, pk):
+    raw = f"{added_at.isoformat()}|{pk}"
+    return urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_position(cursor):
+    """Return (added_at, pk) from encode_position(), or None if malformed."""
+    try:
+        added_at, pk = urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|')
+        added_at = parse_datetime(added_at)
+        pk = int(pk)
+    except (TypeError, ValueError, UnicodeError):
+        return None
+    if added_at is None:
+        return None
+    return added_at, pk
+
+
+def estimated_count(queryset):
+    """
+    Row count of a queryset from planner statistics: pg_class.reltuples for
+    a whole table (summed over the partitions of a partitioned one), the
+    EXPLAIN row estimate for a filtered one. Estimates
+    under ESTIMATED_COUNT_THRESHOLD rows are replaced by an exact COUNT(*),
+    which is cheap at that size and covers tables never analyzed.
+    """
+    queryset = queryset.order_by()
+    query = queryset.query
+    if not query.where and not query.distinct and not query.is_sliced:
+        with connections[queryset.db].cursor() as cursor:
+            # reltuples is -1 until a table is analyzed; a partitioned parent
+            # keeps no rows of its own, its partitions do
+            cursor.execute(
+                """
+                SELECT SUM(GREATEST(reltuples, 0))::bigint FROM pg_class
+                 WHERE (oid = %(table)s::regclass AND relkind = 'r')
+                    OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %(table)s::regclass)
+                """,
+                {'table': queryset.model._meta.db_table},
+            )
+            row = cursor.fetchone()
+        estimate = row[0] if row and row[0] is not None else -1
+    else:
+        plan = json.loads(queryset.explain(format='json'))
+        estimate = plan[0]['Plan']['Plan Rows']
+
+    if estimate < settings.ESTIMATED_COUNT_THRESHOLD:
+        return queryset.count()
+    return int(estimate)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator whose count (and so num_pages) comes from estimated_count(),
+    keeping page loads over very large tables free of a full COUNT(*).
+    Past the threshold the last page number is approximate.
+    """
+
+    @cached_property
+    def count(self):
+        return estimated_count(self.object_list)
+
+
+class WordPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class StaffWordPagination(WordPagination):
+    """Page-number pagination for staff lists, which span every user's words."""
+    django_paginator_class = EstimatedCountPaginator
+
+
+class RandomWordPagination(WordPagination):
+    """
+    Pagination for ?random=true word lists.
+
+    Instead of ORDER BY random() over every matching row, the matching ids
+    are shuffled into a permutation that is cached per user and filter set
+    for RANDOM_WORDS_TTL seconds. Each page slices its ids out of that
+    permutation and fetches only those rows by primary key, so later pages
+    continue the same shuffle. Asking for the first page reshuffles.
+    Past RANDOM_WORDS_MAX_POOL matches the permutation holds a random sample
+    of them, while ``count`` still reports every match.
+    """
+    page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = queryset.order_by()
+        self.count, permutation = self.get_permutation(queryset, request)
+        page_ids = super().paginate_queryset(permutation, request, view)
+        if page_ids is None:
+            return None
+        rows = {row_value(row, 'id'): row for row in queryset.filter(id__in=page_ids)}
+        return [rows[pk] for pk in page_ids if pk in rows]
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data['count'] = self.count
+        return response
+
+    def get_permutation(self, queryset, request):
+        """Return (match count, shuffled ids), cached between pages."""
+        signature = hashlib.sha1(str(queryset.query).encode('utf-8')).hexdigest()
+        key = f"random_words:{request.user.pk}:{signature}"
+        page_number = request.query_params.get(self.page_query_param, 1)
+
+        cached = cache.get(key) if str(page_number) != '1' else None
+        if cached is None:
+            count = queryset.count()
+            permutation = self.get_id_pool(queryset, count)
+            random.shuffle(permutation)
+            cached = (count, permutation)
+            cache.set(key, cached, settings.RANDOM_WORDS_TTL)
+        return cached
+
+    def get_id_pool(self, queryset, count):
+        """
+        Up to RANDOM_WORDS_MAX_POOL of the ``count`` matching ids (only the
+        id column is read).
+
+        Small pools are read whole. Past the cap the ids are either all read
+        and sampled in memory, which is uniform but O(count), or taken from
+        a TABLESAMPLE SYSTEM scan sized for the cap, whichever reads fewer
+        rows. The table sample only pays off when the filters match a large
+        part of the table. It picks whole pages, so each match is equally
+        likely to be in it, but rows stored together, such as words a user
+        added at the same time, tend to be picked together.
+        """
+        limit = settings.RANDOM_WORDS_MAX_POOL
+        ids = queryset.values_list('id', flat=True)
+        if count <= limit:
+            return list(ids)
+
+        # Oversample so the filtered sample rarely falls short of the cap
+        fraction = min(1.0, 1.25 * limit / count)
+        table_rows = estimated_count(queryset.model._default_manager.all())
+        if fraction >= 1.0 or fraction * table_rows >= count:
+            return random.sample(list(ids), limit)
+
+        pool = self.sample_ids(ids, fraction * 100)
+        return random.sample(pool, limit) if len(pool) > limit else pool
+
+    def sample_ids(self, ids, percent):
+        """Run ``ids`` over a TABLESAMPLE SYSTEM (percent) scan of its table."""
+        table = connections[ids.db].ops.quote_name(ids.model._meta.db_table)
+        sql, params = ids.query.sql_with_params()
+        sql = sql.replace(f'FROM {table}', f'FROM {table} TABLESAMPLE SYSTEM ({percent:f})', 1)
+        with connections[ids.db].cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+
+class WordCursorPagination(CursorPagination):
+    """
+    Keyset pagination on (added_at, id) for the words list.
+
+    Each page seeks past the last row of the previous one, so there is no
+    COUNT(*) and no OFFSET, and rows inserted meanwhile never shift a page.
+    Opt in with ?pagination=cursor and follow ``next`` from there; the
+    order is newest first unless ?ordering=added_at.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.descending = self.is_descending(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            position = decode_position(cursor)
+            if position is None:
+                raise NotFound(self.invalid_cursor_message)
+            added_at, pk = position
+            # The redundant bound on added_at alone gives the planner an index range
+            if self.descending:
+                queryset = queryset.filter(
+                    Q(added_at__lt=added_at) | Q(added_at=added_at, id__lt=pk),
+                    added_at__lte=added_at,
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(added_at__gt=added_at) | Q(added_at=added_at, id__gt=pk),
+                    added_at__gte=added_at,
+                )
+
+        if self.descending:
+            queryset = queryset.order_by('-added_at', '-id')
+        else:
+            queryset = queryset.order_by('added_at', 'id')
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def is_descending(self, request):
+        return request.query_params.get('ordering') != 'added_at'
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        position = encode_position(row_value(last, 'added_at'), row_value(last, 'id'))
+        return replace_query_param(self.base_url, self.cursor_query_param, position)
+
+    def get_previous_link(self):
+        return None
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class SyncResetPagination(WordCursorPagination):
+    """
+    Keyset pages, oldest first, of the full vocabulary a reset sync sends.
+    ``next`` carries the sync cursor of the first page as ``snapshot``, so
+    edits made while the client pages through are picked up by the next
+    delta sync.
+    """
+    page_size = 500
+    max_page_size = 2000
+    cursor_query_param = 'page'
+    snapshot_query_param = 'snapshot'
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def is_descending(self, request):
+        return False
+
+    def get_next_link(self):
+        link = super().get_next_link()
+        return replace_query_param(link, self.snapshot_query_param, self.snapshot) if link else None
@@ -4,10 +4,12 @@ from .exercise import ExerciseQuestionSerializer, UserExerciseProgressSerializer
 from .feedback import FeedbackSerializer
 from .google_auth import GoogleAuthSerializer
 from .language import LanguageSerializer
+from .starter_pack import StarterPackSerializer, StarterPackWordSerializer
 from .subscription import SubscriptionPlanSerializer
 from .user_profile import UserProfileDetailSerializer, UserProfileUpdateSerializer
 from .user import UserLoginSerializer, UserRegistrationSerializer
-from .word import WordSerializer
+from .word import WordSerializer, WordBatchSerializer, WordBulkUpdateSerializer
+from .rows import RowEncoder
 
 __all__ = [
     'ExerciseQuestionSerializer',
@@ -16,7 +18,10 @@ __all__ = [
     'FeedbackSerializer',
     'GoogleAuthSerializer',
     'LanguageSerializer',
+    'StarterPackSerializer',
+    'StarterPackWordSerializer',
     'SubscriptionPlanSerializer',
     'UserProfileDetailSerializer',
     'UserProfileUpdateSerializer',
+    'RowEncoder',
 ]
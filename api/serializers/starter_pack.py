@@ -0,0 +1,32 @@
+from . import serializers
+from ..models import StarterPack, StarterPackWord
+
+class StarterPackWordSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StarterPackWord
+        fields = [
+            "word",
+            "translation",
+            "plural_form",
+            "part_of_speech",
+            "example_sentence",
+            "gender",
+            "difficulty_level",
+            "category",
+            "image_url",
+        ]
+
+class StarterPackSerializer(serializers.ModelSerializer):
+    language = serializers.SlugRelatedField(slug_field='code', read_only=True)
+    words_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = StarterPack
+        fields = [
+            "id",
+            "slug",
+            "name",
+            "description",
+            "language",
+            "words_count",
+        ]
@@ -1,7 +1,14 @@
 from . import serializers
 from ..models import Word
+from ..services.german_lexicon import get_german_lexicon, lexicon_key
 
 class WordSerializer(serializers.ModelSerializer):
+    # NULL columns of a Word linked to a lexeme are read from the lexeme
+    fallback_sources = {field: f'lexeme__{field}' for field in Word.LEXEME_FIELDS}
+    # Large columns rendered only when asked for with ?fields=, or in the
+    # detail view (context['detail'])
+    opt_in_fields = ('tokens',)
+
     def validate(self, data):
         user_profile = self.context['request'].user.userprofile
         language_code = data['language'].code
@@ -16,6 +23,51 @@ class WordSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 f"Word limit reached for {language_code}. Maximum {max_words} words allowed per language with your current plan."
             )
+        return self.apply_lexicon(data, language_code)
+
+    def apply_lexicon(self, data, language_code):
+        """
+        Fill in the article and plural of a German noun found in the
+        lexicon, and reject ones that contradict it.
+        """
+        if language_code != 'de' or not any(field in data for field in ('word', 'gender', 'plural_form')):
+            return data
+        lexicon = get_german_lexicon()
+        if lexicon is None:
+            return data
+
+        current = {}
+        for field in ('word', 'part_of_speech', 'gender', 'plural_form'):
+            if field in data:
+                current[field] = data[field]
+            elif self.instance is None:
+                current[field] = ''
+            elif field in Word.LEXEME_FIELDS:
+                current[field] = self.instance.lexeme_value(field)
+            else:
+                current[field] = getattr(self.instance, field)
+        if current['part_of_speech'] not in ('', 'noun'):
+            return data
+        entry = lexicon.lookup(current['word'] or '')
+        if entry is None:
+            return data
+
+        errors = {}
+        if current['gender'] in ('', 'n/a'):
+            if entry.genders:
+                data['gender'] = entry.genders[0]
+        elif entry.genders and current['gender'] not in entry.genders:
+            errors['gender'] = f"'{current['word']}' takes {' or '.join(entry.genders)}"
+        if current['plural_form'] in ('', 'n/a'):
+            if entry.plurals:
+                data['plural_form'] = entry.plurals[0]
+        elif entry.plurals and lexicon_key(current['plural_form']) not in map(lexicon_key, entry.plurals):
+            errors['plural_form'] = f"The plural of '{current['word']}' is {' or '.join(entry.plurals)}"
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        if not current['part_of_speech']:
+            data['part_of_speech'] = 'noun'
         return data
     
     def can_add_word(self, user_profile, language_code):
@@ -28,6 +80,16 @@ class WordSerializer(serializers.ModelSerializer):
         self.context['request'].user.userprofile.increment_words_count(word.language.code)
         return word
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if not self.context.get('detail'):
+            for field in self.opt_in_fields:
+                data.pop(field, None)
+        for field in Word.LEXEME_FIELDS:
+            if field in data and data[field] is None:
+                data[field] = instance.lexeme_value(field)
+        return data
+
     def delete(self, instance):
         language_code = instance.language.code
         instance.delete()
@@ -50,19 +112,52 @@ class WordSerializer(serializers.ModelSerializer):
             "updated_at", 
             "user",
             "core",
+            "reading_kana",
+            "reading_romaji",
+            "tokens",
         ]
-        read_only_fields = ["id", "added_at", "updated_at"]
+        read_only_fields = ["id", "added_at", "updated_at", "reading_kana", "reading_romaji", "tokens"]
         extra_kwargs = {
             'word': {'required': True},
             'language': {'required': True},
-            'translation': {'required': True},
+            'translation': {'required': True, 'allow_null': False},
             'user': {'required': True},
-            'plural_form': {'required': False},
+            # NULL only ever means "inherited from the lexeme"
+            'plural_form': {'required': False, 'allow_null': False},
             'part_of_speech': {'required': False},
-            'example_sentence': {'required': False},
+            'example_sentence': {'required': False, 'allow_null': False},
             'gender': {'required': False},
             'difficulty_level': {'required': False},
             'category': {'required': False},
             'image_url': {'required': False},
             'core': {'required': False},
-        }
\ No newline at end of file
+        }
+
+
+class WordBatchSerializer(WordSerializer):
+    """
+    Validates one item of a batch upload without touching the database:
+    user and language are resolved once by the view (and the language code
+    passed in the context for the lexicon check), duplicates are checked
+    with a single query and the quota is applied to the batch as a whole.
+    """
+    def validate(self, data):
+        return self.apply_lexicon(data, self.context.get('language_code'))
+
+    class Meta(WordSerializer.Meta):
+        fields = [
+            field for field in WordSerializer.Meta.fields
+            if field not in ('user', 'language')
+        ]
+        extra_kwargs = {
+            name: options for name, options in WordSerializer.Meta.extra_kwargs.items()
+            if name not in ('user', 'language')
+        }
+        validators = []
+
+
+class WordBulkUpdateSerializer(serializers.ModelSerializer):
+    """The fields that may be changed on many words at once"""
+    class Meta:
+        model = Word
+        fields = ["category", "difficulty_level", "part_of_speech", "gender"]
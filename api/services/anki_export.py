@@ -0,0 +1,279 @@
+import glob
+import hashlib
+import html
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+import zipfile
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+
+from api.models import Word
+from api.serializers.rows import RowEncoder
+from api.serializers.word import WordSerializer
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the server-side cursor and inserted into SQLite per batch
+ANKI_CHUNK_SIZE = 2000
+
+# Fixed ids keep re-imports of a deck updating the same note type and notes
+NOTE_TYPE_ID = 1700000000001
+NOTE_ID_BASE = 1700000000000
+
+FIELD_SEPARATOR = '\x1f'
+
+# Anki collection schema 11, the format .apkg files are read in
+COLLECTION_SCHEMA = """
+CREATE TABLE col (
+    id integer primary key, crt integer not null, mod integer not null,
+    scm integer not null, ver integer not null, dty integer not null,
+    usn integer not null, ls integer not null, conf text not null,
+    models text not null, decks text not null, dconf text not null,
+    tags text not null
+);
+CREATE TABLE notes (
+    id integer primary key, guid text not null, mid integer not null,
+    mod integer not null, usn integer not null, tags text not null,
+    flds text not null, sfld integer not null, csum integer not null,
+    flags integer not null, data text not null
+);
+CREATE TABLE cards (
+    id integer primary key, nid integer not null, did integer not null,
+    ord integer not null, mod integer not null, usn integer not null,
+    type integer not null, queue integer not null, due integer not null,
+    ivl integer not null, factor integer not null, reps integer not null,
+    lapses integer not null, left integer not null, odue integer not null,
+    odid integer not null, flags integer not null, data text not null
+);
+CREATE TABLE revlog (
+    id integer primary key, cid integer not null, usn integer not null,
+    ease integer not null, ivl integer not null, lastIvl integer not null,
+    factor integer not null, time integer not null, type integer not null
+);
+CREATE TABLE graves (usn integer not null, oid integer not null, type integer not null);
+CREATE INDEX ix_notes_usn ON notes (usn);
+CREATE INDEX ix_cards_usn ON cards (usn);
+CREATE INDEX ix_revlog_usn ON revlog (usn);
+CREATE INDEX ix_cards_nid ON cards (nid);
+CREATE INDEX ix_cards_sched ON cards (did, queue, due);
+CREATE INDEX ix_revlog_cid ON revlog (cid);
+CREATE INDEX ix_notes_csum ON notes (csum);
+"""
+
+CARD_CSS = """.card {
+  font-family: arial;
+  font-size: 20px;
+  text-align: center;
+  color: black;
+  background-color: white;
+}
+.details { font-size: 16px; color: #555; }
+"""
+
+DECK_OPTIONS = {
+    'id': 1, 'name': 'Default', 'mod': 0, 'usn': 0, 'maxTaken': 60, 'autoplay': True,
+    'timer': 0, 'replayq': True, 'dyn': False,
+    'new': {
+        'delays': [1, 10], 'ints': [1, 4, 7], 'initialFactor': 2500, 'order': 1,
+        'perDay': 20, 'bury': True, 'separate': True,
+    },
+    'lapse': {'delays': [10], 'mult': 0, 'minInt': 1, 'leechFails': 8, 'leechAction': 0},
+    'rev': {
+        'perDay': 200, 'ease4': 1.3, 'fuzz': 0.05, 'minSpace': 1, 'ivlFct': 1,
+        'maxIvl': 36500, 'bury': True, 'hardFactor': 1.2,
+    },
+}
+
+
+def _deck(deck_id: int, name: str, now: int) -> Dict:
+    return {
+        'id': deck_id, 'name': name, 'mod': now, 'usn': -1, 'desc': '', 'dyn': 0,
+        'conf': 1, 'collapsed': False, 'extendNew': 10, 'extendRev': 50,
+        'lrnToday': [0, 0], 'revToday': [0, 0], 'newToday': [0, 0], 'timeToday': [0, 0],
+    }
+
+
+def _note_type(deck_id: int, now: int) -> Dict:
+    field = {'sticky': False, 'rtl': False, 'font': 'Arial', 'size': 20, 'media': []}
+    return {
+        'id': NOTE_TYPE_ID, 'name': 'be_lernen word', 'type': 0, 'mod': now, 'usn': -1,
+        'sortf': 0, 'did': deck_id, 'tags': [], 'vers': [], 'css': CARD_CSS,
+        'flds': [{**field, 'name': 'Front', 'ord': 0}, {**field, 'name': 'Back', 'ord': 1}],
+        'tmpls': [{
+            'name': 'Card 1', 'ord': 0, 'did': None, 'bqfmt': '', 'bafmt': '',
+            'qfmt': '{{Front}}', 'afmt': '{{FrontSide}}<hr id=answer>{{Back}}',
+        }],
+        'req': [[0, 'any', [0]]],
+        'latexPre': '\\documentclass[12pt]{article}\n\\pagestyle{empty}\n\\begin{document}\n',
+        'latexPost': '\\end{document}',
+    }
+
+
+class AnkiDeckExporter:
+    """
+    Builds an Anki package (.apkg) of a user's words.
+
+    Rows are read from a server-side cursor and written to the SQLite
+    collection in batches, so memory stays bounded whatever the vocabulary
+    size. The zipped package is kept on disk under ANKI_EXPORT_DIR, named by
+    the user's vocabulary version, and reused until the vocabulary changes.
+    """
+    encoder = RowEncoder(
+        WordSerializer,
+        fields=['id', 'word', 'translation', 'plural_form', 'part_of_speech',
+                'example_sentence', 'gender', 'difficulty_level', 'category'],
+    )
+
+    def __init__(self, user, language_code: Optional[str] = None):
+        self.user = user
+        self.language_code = language_code
+
+    @property
+    def deck_name(self) -> str:
+        return f"be_lernen::{self.language_code}" if self.language_code else 'be_lernen'
+
+    @property
+    def deck_id(self) -> int:
+        digest = hashlib.sha1(f"{self.user.pk}:{self.deck_name}".encode('utf-8')).hexdigest()
+        return int(digest[:12], 16)
+
+    def _prefix(self) -> str:
+        return os.path.join(settings.ANKI_EXPORT_DIR, f"{self.user.pk}-{self.language_code or 'all'}-")
+
+    def path(self, version: int) -> str:
+        return f"{self._prefix()}{version}.apkg"
+
+    def get_or_build(self, version: int) -> BinaryIO:
+        """
+        The package for this vocabulary version, opened for reading and built
+        if missing. A build for a newer version may prune this one at any
+        moment, so the file is opened rather than checked for.
+        """
+        path = self.path(version)
+        try:
+            return open(path, 'rb')
+        except FileNotFoundError:
+            return self.build(path)
+
+    def words(self) -> Iterator[Dict]:
+        words = Word.objects.filter(user=self.user).order_by('added_at', 'id')
+        if self.language_code:
+            words = words.filter(language__code=self.language_code)
+        for row in words.values(*self.encoder.columns).iterator(chunk_size=ANKI_CHUNK_SIZE):
+            yield self.encoder.encode(row)
+
+    @staticmethod
+    def _back(word: Dict) -> str:
+        details = [
+            word[name] for name in ('part_of_speech', 'gender', 'plural_form')
+            if word[name] and word[name] != 'n/a'
+        ]
+        back = html.escape(word['translation'] or '')
+        if details:
+            back += f"<div class=details>{html.escape(', '.join(details))}</div>"
+        if word['example_sentence']:
+            back += f"<div class=details><i>{html.escape(word['example_sentence'])}</i></div>"
+        return back
+
+    @staticmethod
+    def _tags(word: Dict) -> str:
+        tags = [word['category'], word['difficulty_level']]
+        return ' ' + ' '.join(tag.replace(' ', '_') for tag in tags if tag) + ' '
+
+    def _note_rows(self, words: Iterable[Dict], now: int) -> Iterator[tuple]:
+        for word in words:
+            front = html.escape(word['word'])
+            checksum = int(hashlib.sha1(front.encode('utf-8')).hexdigest()[:8], 16)
+            note_id = NOTE_ID_BASE + word['id']
+            yield (
+                note_id, f"be_lernen-{word['id']}", NOTE_TYPE_ID, now, -1, self._tags(word),
+                front + FIELD_SEPARATOR + self._back(word), front, checksum, 0, '',
+            )
+
+    def _write_collection(self, path: str) -> int:
+        now = int(time.time())
+        deck_id = self.deck_id
+        database = sqlite3.connect(path)
+        try:
+            database.executescript(COLLECTION_SCHEMA)
+            count = 0
+            batch: List[tuple] = []
+            for note in self._note_rows(self.words(), now):
+                batch.append(note)
+                if len(batch) == ANKI_CHUNK_SIZE:
+                    count = self._insert(database, batch, deck_id, now, count)
+                    batch = []
+            count = self._insert(database, batch, deck_id, now, count)
+
+            decks = {'1': _deck(1, 'Default', now), str(deck_id): _deck(deck_id, self.deck_name, now)}
+            conf = {
+                'nextPos': count + 1, 'estTimes': True, 'activeDecks': [deck_id], 'sortType': 'noteFld',
+                'timeLim': 0, 'sortBackwards': False, 'addToCur': True, 'curDeck': deck_id,
+                'newBury': True, 'newSpread': 0, 'dueCounts': True, 'curModel': str(NOTE_TYPE_ID),
+                'collapseTime': 1200,
+            }
+            database.execute(
+                "INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, '{}')",
+                (
+                    now, now * 1000, now * 1000, json.dumps(conf),
+                    json.dumps({str(NOTE_TYPE_ID): _note_type(deck_id, now)}),
+                    json.dumps(decks), json.dumps({'1': DECK_OPTIONS}),
+                ),
+            )
+            database.commit()
+            return count
+        finally:
+            database.close()
+
+    @staticmethod
+    def _insert(database, notes: List[tuple], deck_id: int, now: int, position: int) -> int:
+        database.executemany("INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", notes)
+        database.executemany(
+            "INSERT INTO cards VALUES (?, ?, ?, 0, ?, -1, 0, 0, ?, 0, 0, 0, 0, 0, 0, 0, 0, '')",
+            [
+                (note[0], note[0], deck_id, now, position + offset + 1)
+                for offset, note in enumerate(notes)
+            ],
+        )
+        return position + len(notes)
+
+    def build(self, path: str) -> BinaryIO:
+        """Build the package at ``path`` and return it opened for reading."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(path)) as workdir:
+            collection = os.path.join(workdir, 'collection.anki2')
+            count = self._write_collection(collection)
+            package = os.path.join(workdir, 'deck.apkg')
+            with zipfile.ZipFile(package, 'w', zipfile.ZIP_DEFLATED) as archive:
+                archive.write(collection, 'collection.anki2')
+                # No media files; the manifest maps archive names to file names
+                archive.writestr('media', '{}')
+            # Opened before it is moved into place, so the handle stays valid
+            # even if a later build prunes the file; concurrent builds of the
+            # same version just replace each other
+            deck = open(package, 'rb')
+            os.replace(package, path)
+
+        self._prune(path)
+        logger.info(f"Built Anki deck with {count} notes for user {self.user.pk}")
+        return deck
+
+    def _prune(self, path: str) -> None:
+        """Remove packages of versions older than the one at ``path``."""
+        prefix = self._prefix()
+        current = int(path[len(prefix):-len('.apkg')])
+        for stale in glob.glob(f"{glob.escape(prefix)}*.apkg"):
+            try:
+                version = int(stale[len(prefix):-len('.apkg')])
+            except ValueError:
+                continue
+            if version < current:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
@@ -0,0 +1,166 @@
+import logging
+import mmap
+import os
+import struct
+import threading
+import unicodedata
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# File layout, all little-endian:
+#   header   MAGIC, format version (u16), reserved (u16), entry count (u32)
+#   offsets  one u32 file offset per record, in key order
+#   records  key length (u8), key (UTF-8), gender bits (u8),
+#            plurals length (u8), plurals (UTF-8, alternatives joined by '|')
+MAGIC = b'BLLX'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+OFFSET = struct.Struct('<I')
+
+# A noun may take more than one article (der/das Teil)
+GENDER_BITS = {'der': 1, 'die': 2, 'das': 4}
+PLURAL_SEPARATOR = '|'
+
+
+class LexiconEntry(NamedTuple):
+    genders: Tuple[str, ...]
+    plurals: Tuple[str, ...]
+
+
+def lexicon_key(word: str) -> bytes:
+    """Lookup key of a noun: NFC and lower-cased, umlauts and ß kept."""
+    return unicodedata.normalize('NFC', word.strip()).lower().encode('utf-8')
+
+
+class _Keys:
+    """Sequence view of the record keys, so bisect can search the mapped file."""
+
+    def __init__(self, lexicon: 'GermanLexicon'):
+        self._lexicon = lexicon
+
+    def __len__(self) -> int:
+        return len(self._lexicon)
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._lexicon._key_at(self._lexicon._offset(index))
+
+
+class GermanLexicon:
+    """
+    German nouns with their articles and plurals, read from a memory-mapped
+    sorted file. Lookups bisect the offset table, so they take O(log n)
+    page reads and nothing is loaded up front; worker processes mapping
+    the same file share its pages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} German lexicon")
+        self._keys = _Keys(self)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, index: int) -> int:
+        return OFFSET.unpack_from(self._map, HEADER.size + OFFSET.size * index)[0]
+
+    def _key_at(self, offset: int) -> bytes:
+        length = self._map[offset]
+        return self._map[offset + 1:offset + 1 + length]
+
+    def lookup(self, word: str) -> Optional[LexiconEntry]:
+        key = lexicon_key(word)
+        low = bisect_left(self._keys, key)
+        if low == self._count or self._keys[low] != key:
+            return None
+
+        position = self._offset(low) + 1 + len(key)
+        bits = self._map[position]
+        plurals_length = self._map[position + 1]
+        plurals = self._map[position + 2:position + 2 + plurals_length].decode('utf-8')
+        return LexiconEntry(
+            genders=tuple(gender for gender, bit in GENDER_BITS.items() if bits & bit),
+            plurals=tuple(plural for plural in plurals.split(PLURAL_SEPARATOR) if plural),
+        )
+
+    def close(self) -> None:
+        self._map.close()
+
+    @staticmethod
+    def write(path: str, entries: Iterable[Tuple[str, List[str], List[str]]]) -> int:
+        """
+        Write (word, genders, plurals) entries as a lexicon file, replacing
+        path atomically so processes that mapped the old file keep reading it.
+        Later duplicates of a word are merged into the first.
+        """
+        records = {}
+        for word, genders, plurals in entries:
+            key = lexicon_key(word)
+            encoded = PLURAL_SEPARATOR.join(plurals).encode('utf-8')
+            if not key or len(key) > 255 or len(encoded) > 255:
+                continue
+            bits, known = records.get(key, (0, b''))
+            bits |= sum(GENDER_BITS[gender] for gender in set(genders))
+            records[key] = (bits, known or encoded)
+
+        keys = sorted(records)
+        body = bytearray()
+        offsets = []
+        start = HEADER.size + OFFSET.size * len(keys)
+        for key in keys:
+            bits, plurals = records[key]
+            offsets.append(start + len(body))
+            body += bytes([len(key)]) + key + bytes([bits, len(plurals)]) + plurals
+
+        temporary = f"{path}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(keys)))
+            for offset in offsets:
+                f.write(OFFSET.pack(offset))
+            f.write(body)
+        os.replace(temporary, path)
+        return len(keys)
+
+
+# path -> GermanLexicon, or the file's mtime (None if missing) when it failed to load
+_lexicons = {}
+_lexicons_lock = threading.Lock()
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def get_german_lexicon() -> Optional[GermanLexicon]:
+    """
+    The lexicon at GERMAN_LEXICON_PATH, mapped once per process; None if it
+    is not built. A failed load is retried once the file's mtime changes, so
+    building the lexicon takes effect without a restart.
+    """
+    path = settings.GERMAN_LEXICON_PATH
+    with _lexicons_lock:
+        cached = _lexicons.get(path)
+        if isinstance(cached, GermanLexicon):
+            return cached
+        mtime = _mtime(path)
+        if path in _lexicons and cached == mtime:
+            return None
+        try:
+            _lexicons[path] = GermanLexicon(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"German lexicon unavailable: {str(e)}")
+            _lexicons[path] = mtime
+            return None
+        return _lexicons[path]
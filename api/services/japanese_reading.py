@@ -0,0 +1,101 @@
+import csv
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from api.utils.text import to_hiragana, to_romaji
+
+logger = logging.getLogger(__name__)
+
+# Positions of the part of speech, dictionary form and reading in MeCab's
+# comma separated features, per dictionary (see MECAB_DICTIONARY). The
+# reading is the kana of the surface form, whose position depends on the
+# number of fields: unidic-lite has 26, full UniDic 29 and IPAdic 9.
+# UniDic's "pron" field is the pronunciation (勉強 -> ベンキョー, は -> ワ),
+# which would not match readings typed as written.
+FEATURE_FIELDS = {
+    'unidic': {'pos': 0, 'base': 7, 'reading': {26: 17, 29: 20}},
+    'ipadic': {'pos': 0, 'base': 6, 'reading': {9: 7}},
+}
+
+_tagger = None
+_tagger_unavailable = False
+# MeCab taggers are not safe to share between threads mid-parse
+_tagger_lock = threading.Lock()
+
+
+def _get_tagger():
+    global _tagger, _tagger_unavailable
+    if _tagger is None and not _tagger_unavailable:
+        try:
+            import MeCab
+            # Loading the dictionary is slow: done once per process, on first use
+            _tagger = MeCab.Tagger(settings.MECAB_ARGS)
+        except (ImportError, RuntimeError) as e:
+            logger.warning(f"MeCab unavailable, Japanese readings are not computed: {str(e)}")
+            _tagger_unavailable = True
+    return _tagger
+
+
+def _feature(features: List[str], index: Optional[int], default: str) -> str:
+    value = features[index] if index is not None and index < len(features) else '*'
+    return default if value in ('', '*') else value
+
+
+def parse_features(feature: str, surface: str, dictionary: str) -> Dict:
+    """A token's {surface, reading, base, pos} from its MeCab feature string"""
+    fields = FEATURE_FIELDS[dictionary]
+    # UniDic quotes fields that contain commas
+    features = next(csv.reader([feature]))
+    return {
+        'surface': surface,
+        # Unknown words have fewer fields and no reading: keep the surface
+        'reading': to_hiragana(_feature(features, fields['reading'].get(len(features)), surface)),
+        'base': _feature(features, fields['base'], surface),
+        'pos': _feature(features, fields['pos'], ''),
+    }
+
+
+def is_available() -> bool:
+    with _tagger_lock:
+        return _get_tagger() is not None
+
+
+def tokenize(text: str) -> Optional[List[Dict]]:
+    """
+    Tokens of a Japanese text as {surface, reading, base, pos} with the
+    reading in hiragana, or None when MeCab is not available.
+    """
+    tokens = []
+    with _tagger_lock:
+        tagger = _get_tagger()
+        if tagger is None:
+            return None
+        node = tagger.parseToNode(text or '')
+        while node:
+            # BOS/EOS nodes have no surface
+            if node.surface:
+                tokens.append(parse_features(node.feature, node.surface, settings.MECAB_DICTIONARY))
+            node = node.next
+    return tokens
+
+
+def analyze(word: str, example_sentence: str = '') -> Optional[Dict]:
+    """
+    reading_kana, reading_romaji and tokens (of the word and of its example
+    sentence) for a Japanese word, or None when MeCab is not available.
+    """
+    word_tokens = tokenize(word)
+    if word_tokens is None:
+        return None
+    reading = ''.join(token['reading'] for token in word_tokens)
+    return {
+        'reading_kana': reading,
+        'reading_romaji': to_romaji(reading),
+        'tokens': {
+            'word': word_tokens,
+            'example_sentence': tokenize(example_sentence) if example_sentence else [],
+        },
+    }
@@ -0,0 +1,104 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import quote_etag
+
+ALL_SCOPES = '*'
+
+
+class VersionedPageCache:
+    """
+    Rendered list pages of a rarely changing catalog, kept in process memory
+    and in the shared cache.
+
+    Every scope (e.g. a language code) has a version number in the shared
+    cache; pages are stored under the version they were built for, so
+    bump() invalidates them everywhere at once without deleting anything.
+    Old pages simply stop being asked for and expire. The ALL_SCOPES version
+    covers pages that mix scopes and moves with every bump.
+    """
+
+    def __init__(self, namespace: str, local_size: int = 256):
+        self.namespace = namespace
+        self.local_size = local_size
+        self._lock = threading.Lock()
+        self._local: OrderedDict = OrderedDict()
+
+    @property
+    def timeout(self) -> int:
+        return settings.PAGE_CACHE_TTL
+
+    def _version_key(self, scope: Optional[str]) -> str:
+        return f"{self.namespace}:version:{scope or ALL_SCOPES}"
+
+    def version(self, scope: Optional[str] = None) -> int:
+        key = self._version_key(scope)
+        version = cache.get(key)
+        if version is None:
+            # A clock-based start never reuses a version from before a cache flush
+            cache.add(key, time.time_ns(), None)
+            version = cache.get(key)
+        return version
+
+    def bump(self, *scopes: Optional[str]) -> None:
+        for scope in {scope or ALL_SCOPES for scope in scopes} | {ALL_SCOPES}:
+            key = self._version_key(scope)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), None)
+
+    @staticmethod
+    def _digest(scope: Optional[str], key: str) -> str:
+        # Versions of different scopes can be equal (they are clock-based
+        # counters), so the scope is part of every page key and ETag
+        return hashlib.sha1(f"{scope or ALL_SCOPES}|{key}".encode('utf-8')).hexdigest()
+
+    def _page_key(self, version: int, key: str, scope: Optional[str]) -> str:
+        return f"{self.namespace}:page:{version}:{self._digest(scope, key)}"
+
+    def etag(self, version: int, key: str, scope: Optional[str] = None) -> str:
+        return quote_etag(f"{self._digest(scope, key)}-{version}")
+
+    def get(self, version: int, key: str, scope: Optional[str] = None) -> Optional[Dict]:
+        page_key = self._page_key(version, key, scope)
+        with self._lock:
+            if page_key in self._local:
+                self._local.move_to_end(page_key)
+                return self._local[page_key]
+        data = cache.get(page_key)
+        if data is not None:
+            self._remember(page_key, data)
+        return data
+
+    def set(self, version: int, key: str, data: Dict, scope: Optional[str] = None) -> None:
+        page_key = self._page_key(version, key, scope)
+        cache.set(page_key, data, self.timeout)
+        self._remember(page_key, data)
+
+    def _remember(self, page_key: str, data: Dict) -> None:
+        with self._lock:
+            self._local[page_key] = data
+            self._local.move_to_end(page_key)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget this process's pages; shared ones are left to expire."""
+        with self._lock:
+            self._local.clear()
+
+
+# Pages of ?core=true word lists, scoped by language code
+core_word_pages = VersionedPageCache('core_words')
+
+# Pages of the public featured words list, a single scope
+featured_word_pages = VersionedPageCache('featured_words')
+
+# Per-user answers derived from a user's whole vocabulary, scoped by user id
+vocabulary_pages = VersionedPageCache('vocabulary')
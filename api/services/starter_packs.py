@@ -0,0 +1,91 @@
+import logging
+from typing import Dict
+
+from django.db import connection, transaction
+
+from api.models import StarterPack, UserProfile, Word
+from api.serializers.word import WordSerializer
+from api.services.word_import import RETURNED_COLUMNS, STAGED_COLUMNS
+from api.signals import words_bulk_created
+
+logger = logging.getLogger(__name__)
+
+# Pack words the user does not have yet, in pack order, up to the quota
+# (LIMIT NULL means no limit). The conflict clause only guards against a
+# word added concurrently.
+CLONE_PACK = f"""
+INSERT INTO api_word (user_id, language_id, {', '.join(STAGED_COLUMNS)}, added_at, updated_at)
+SELECT %(user_id)s, p.language_id, {', '.join(
+    'false' if column == 'core' else 'w.' + column for column in STAGED_COLUMNS
+)}, now(), now()
+  FROM api_starterpackword w
+  JOIN api_starterpack p ON p.id = w.pack_id
+ WHERE w.pack_id = %(pack_id)s
+   AND NOT EXISTS (
+       SELECT 1 FROM api_word u
+        WHERE u.user_id = %(user_id)s
+          AND u.language_id = p.language_id
+          AND u.word = w.word)
+ ORDER BY w.position, w.id
+ LIMIT %(limit)s
+    ON CONFLICT ON CONSTRAINT unique_word_per_user_language DO NOTHING
+RETURNING {', '.join(RETURNED_COLUMNS)}
+"""
+
+
+class StarterPackCloner:
+    """
+    Copies a starter pack into a user's words with one INSERT ... SELECT
+    and one words_count update, so onboarding needs no per-word queries
+    and no generation calls.
+    """
+
+    def __init__(self, user, enforce_quota: bool = True):
+        self.user = user
+        self.enforce_quota = enforce_quota
+
+    def max_words(self, profile, language_code: str):
+        """The user's word quota for the language, or None when not enforced."""
+        if not self.enforce_quota or profile is None:
+            return None
+        max_words, _ = WordSerializer().can_add_word(profile, language_code)
+        return max_words
+
+    def clone(self, pack: StarterPack) -> Dict:
+        """
+        Counts of the pack words inserted, already in the user's words
+        (duplicates) and left out by the quota (limit_reached), with the
+        quota applied (max_words, None without one).
+        """
+        language_code = pack.language.code
+        with transaction.atomic():
+            profile = UserProfile.objects.select_for_update().filter(user=self.user).first()
+            max_words = self.max_words(profile, language_code)
+            remaining = None if max_words is None else max(max_words - profile.get_words_count(language_code), 0)
+            missing = pack.words.exclude(
+                word__in=Word.objects.filter(user=self.user, language_id=pack.language_id).values('word')
+            ).count()
+            with connection.cursor() as cursor:
+                cursor.execute(CLONE_PACK, {
+                    'user_id': self.user.pk,
+                    'pack_id': pack.pk,
+                    'limit': remaining,
+                })
+                created = [Word.from_returning(RETURNED_COLUMNS, row, connection) for row in cursor.fetchall()]
+
+            if profile is not None and created:
+                profile.words_count[language_code] = profile.get_words_count(language_code) + len(created)
+                profile.save(update_fields=['words_count'])
+
+            if created:
+                transaction.on_commit(lambda: words_bulk_created.send(sender=Word, words=created))
+
+        total = pack.words.count()
+        logger.info(f"Cloned {len(created)} words of starter pack {pack.slug} for user {self.user.pk}")
+        return {
+            'inserted': len(created),
+            'duplicates': total - missing,
+            'limit_reached': missing - len(created),
+            'max_words': max_words,
+            'language': language_code,
+        }
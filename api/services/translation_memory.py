@@ -0,0 +1,77 @@
+import logging
+from typing import Dict, Iterable, List
+
+from django.db.models import Exists, OuterRef, Value
+from django.db.models.functions import Upper
+
+from api.models import Language, Lexeme, Word
+
+logger = logging.getLogger(__name__)
+
+# Lexeme columns handed out as word data, in the shape GenerateWordsView returns
+MEMORY_FIELDS = (
+    'word', 'translation', 'category', 'difficulty_level', 'gender',
+    'example_sentence', 'plural_form', 'part_of_speech',
+)
+MAX_LENGTHS = {
+    field: Lexeme._meta.get_field(field).max_length
+    for field in MEMORY_FIELDS
+    if Lexeme._meta.get_field(field).max_length
+}
+NORMALIZED_MAX_LENGTH = Lexeme._meta.get_field('normalized_word').max_length
+
+
+class TranslationMemory:
+    """
+    Known words of one language, shared across users and keyed by
+    (language, normalized word).
+
+    Entries are the lexemes: compact_words seeds them from existing Word
+    rows and remember() adds generated words, so words someone has already
+    saved or generated are served without another model call.
+    """
+
+    def __init__(self, language: Language):
+        self.language = language
+
+    def _as_word_data(self, lexeme: Lexeme) -> Dict:
+        data = {field: getattr(lexeme, field) for field in MEMORY_FIELDS}
+        data['language'] = self.language.code
+        return data
+
+    def for_category(self, category: str, difficulty_level: str, user, limit: int) -> List[Dict]:
+        """Up to ``limit`` remembered words of a category that the user does not have yet."""
+        owned = Word.objects.filter(
+            user=user, language=self.language, word_normalized=OuterRef('normalized_word')
+        )
+        lexemes = (
+            Lexeme.objects
+            # The same expression as the lexeme_language_category index
+            .alias(category_key=Upper('category'))
+            .filter(language=self.language, category_key=Upper(Value(category)), difficulty_level=difficulty_level)
+            .exclude(translation='')
+            .filter(~Exists(owned))
+            .order_by('id')[:limit]
+        )
+        return [self._as_word_data(lexeme) for lexeme in lexemes]
+
+    def remember(self, items: Iterable[Dict], source: str = 'llm') -> int:
+        """
+        Store generated words, which must have passed WordSerializer
+        validation; words already in the memory are left as they are.
+        """
+        lexemes = {}
+        for item in items:
+            values = {field: str(item.get(field) or '').strip() for field in MEMORY_FIELDS}
+            key = Lexeme.normalize(values['word'])
+            too_long = len(key) > NORMALIZED_MAX_LENGTH or any(
+                len(values[field]) > length for field, length in MAX_LENGTHS.items()
+            )
+            if not key or too_long:
+                continue
+            values['gender'] = values['gender'] or 'n/a'
+            values['difficulty_level'] = values['difficulty_level'] or 'medium'
+            lexemes.setdefault(key, Lexeme(language=self.language, normalized_word=key, source=source, **values))
+        Lexeme.objects.bulk_create(lexemes.values(), ignore_conflicts=True)
+        logger.info(f"Remembered {len(lexemes)} {self.language.code} words from {source}")
+        return len(lexemes)
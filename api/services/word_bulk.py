@@ -0,0 +1,87 @@
+import logging
+from collections import Counter
+from typing import Dict, List
+
+from django.db import connection, transaction
+
+from api.models import Language, UserProfile, Word, WordTombstone
+
+logger = logging.getLogger(__name__)
+
+# Every stored column except the trigger-maintained search vector, so the
+# returned rows can stand in for full Word instances in signal receivers
+RETURNED_FIELDS = [field for field in Word._meta.concrete_fields if field.name != 'search_vector']
+RETURNED_COLUMNS = [field.attname for field in RETURNED_FIELDS]
+RETURNING = ', '.join(connection.ops.quote_name(field.column) for field in RETURNED_FIELDS)
+
+
+class WordBulkEditor:
+    """
+    Deletes or updates many of a user's words with one statement each.
+
+    The selection is any Word queryset; it is used as an ``id IN (...)``
+    subquery, so no rows are loaded before the write. Changed rows come
+    back through RETURNING to keep counters, tombstones and the in-process
+    indexes current without per-row queries.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    def _execute(self, sql: str, params) -> List[Word]:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [Word.from_returning(RETURNED_COLUMNS, row, connection) for row in cursor.fetchall()]
+
+    def _selection(self, queryset):
+        return queryset.filter(user=self.user).order_by().values('id').query.sql_with_params()
+
+    def delete(self, queryset) -> Dict:
+        from api.signals import words_bulk_deleted
+
+        selection, params = self._selection(queryset)
+        with transaction.atomic():
+            profile = UserProfile.objects.select_for_update().filter(user=self.user).first()
+            deleted = self._execute(
+                # The user_id condition lets PostgreSQL prune to the user's partition
+                f"DELETE FROM api_word WHERE user_id = %s AND id IN ({selection}) RETURNING {RETURNING}",
+                [self.user.pk, *params],
+            )
+            WordTombstone.objects.bulk_create([
+                WordTombstone(user_id=word.user_id, language_id=word.language_id, word_id=word.id)
+                for word in deleted
+            ])
+
+            per_language = Counter(word.language_id for word in deleted)
+            codes = dict(Language.objects.filter(id__in=per_language).values_list('id', 'code'))
+            by_language = {codes[language_id]: count for language_id, count in per_language.items()}
+            if profile is not None and by_language:
+                for code, count in by_language.items():
+                    profile.words_count[code] = max(profile.get_words_count(code) - count, 0)
+                profile.save(update_fields=['words_count'])
+
+            if deleted:
+                transaction.on_commit(lambda: words_bulk_deleted.send(sender=Word, words=deleted))
+
+        logger.info(f"Deleted {len(deleted)} words for user {self.user.pk}")
+        return {'deleted': len(deleted), 'by_language': by_language}
+
+    def update(self, queryset, changes: Dict) -> Dict:
+        from api.signals import words_bulk_updated
+
+        selection, params = self._selection(queryset)
+        assignments = ', '.join(
+            f"{connection.ops.quote_name(Word._meta.get_field(name).column)} = %s" for name in changes
+        )
+        with transaction.atomic():
+            updated = self._execute(
+                f"UPDATE api_word SET {assignments}, updated_at = now() "
+                f"WHERE user_id = %s AND id IN ({selection}) RETURNING {RETURNING}",
+                [*changes.values(), self.user.pk, *params],
+            )
+            if updated:
+                fields = list(changes)
+                transaction.on_commit(lambda: words_bulk_updated.send(sender=Word, words=updated, fields=fields))
+
+        logger.info(f"Updated {len(updated)} words for user {self.user.pk}")
+        return {'updated': len(updated)}
@@ -0,0 +1,309 @@
+import csv
+import io
+import json
+import logging
+from typing import Dict, Iterable, Iterator, Optional
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import connection, transaction
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+from api.models import Language, UserProfile, Word
+from api.serializers.word import WordSerializer
+from api.signals import words_bulk_created
+from api.utils.text import normalize_text
+
+logger = logging.getLogger(__name__)
+
+FILE_FORMATS = ('csv', 'jsonl', 'json')
+
+# Columns taken from the file, in COPY order after seq and language_id
+IMPORT_COLUMNS = (
+    'word', 'translation', 'plural_form', 'part_of_speech', 'example_sentence',
+    'gender', 'difficulty_level', 'category', 'image_url', 'core',
+)
+
+# Columns computed from the file's values, copied after IMPORT_COLUMNS
+COMPUTED_COLUMNS = ('word_normalized', 'translation_normalized') + Word.READING_FIELDS
+
+STAGED_COLUMNS = IMPORT_COLUMNS + COMPUTED_COLUMNS
+
+# Columns handed back by the merge so bulk signal receivers get full rows
+RETURNED_COLUMNS = (
+    'id', 'user_id', 'language_id', 'added_at', 'updated_at',
+) + STAGED_COLUMNS
+
+CREATE_STAGING_TABLE = """
+CREATE TEMPORARY TABLE word_import (
+    seq bigint NOT NULL,
+    language_id bigint NOT NULL,
+    word varchar(100) NOT NULL,
+    translation varchar(200) NOT NULL,
+    plural_form varchar(100) NOT NULL,
+    part_of_speech varchar(50) NOT NULL,
+    example_sentence text NOT NULL,
+    gender varchar(3) NOT NULL,
+    difficulty_level varchar(50) NOT NULL,
+    category varchar(50) NOT NULL,
+    image_url varchar(500) NOT NULL,
+    core boolean NOT NULL,
+    word_normalized text NOT NULL,
+    translation_normalized text NOT NULL,
+    reading_kana text NOT NULL,
+    reading_romaji text NOT NULL,
+    tokens jsonb NOT NULL
+) ON COMMIT DROP
+"""
+
+# Dropped as soon as the merge is done, so a second import in the same
+# outer transaction can create it again
+DROP_STAGING_TABLE = "DROP TABLE word_import"
+
+COPY_STAGING_TABLE = (
+    f"COPY word_import (seq, language_id, {', '.join(STAGED_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# New words only (first occurrence of each word wins), at most `remaining`
+# per language when a quota is given, merged in file order.
+MERGE_STAGING_TABLE = f"""
+WITH candidates AS (
+    SELECT DISTINCT ON (s.language_id, s.word) s.*
+      FROM word_import s
+     WHERE NOT EXISTS (
+           SELECT 1 FROM api_word w
+            WHERE w.user_id = %(user_id)s
+              AND w.language_id = s.language_id
+              AND w.word = s.word)
+     ORDER BY s.language_id, s.word, s.seq
+), ranked AS (
+    SELECT c.*, row_number() OVER (PARTITION BY c.language_id ORDER BY c.seq) AS position
+      FROM candidates c
+), quota AS (
+    SELECT * FROM unnest(%(quota_languages)s::bigint[], %(quota_remaining)s::bigint[])
+        AS q(language_id, remaining)
+)
+INSERT INTO api_word (user_id, language_id, {', '.join(STAGED_COLUMNS)}, added_at, updated_at)
+SELECT %(user_id)s, r.language_id, {', '.join('r.' + column for column in STAGED_COLUMNS)}, now(), now()
+  FROM ranked r
+  LEFT JOIN quota q ON q.language_id = r.language_id
+ WHERE q.remaining IS NULL OR r.position <= q.remaining
+ ORDER BY r.seq
+    ON CONFLICT ON CONSTRAINT unique_word_per_user_language DO NOTHING
+RETURNING {', '.join(RETURNED_COLUMNS)}
+"""
+
+
+def iter_json_array(stream: io.TextIOBase, chunk_size: int = 65536) -> Iterator:
+    """Yield the items of a top-level JSON array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer and not started:
+            if not buffer.startswith('['):
+                raise ValueError("Expected a JSON array")
+            buffer = buffer[1:]
+            started = True
+            continue
+        if buffer.startswith(','):
+            buffer = buffer[1:]
+            continue
+        if buffer.startswith(']'):
+            return
+        if buffer:
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # The item may continue in the next chunk
+                if eof:
+                    raise
+            else:
+                # A number at the end of the buffer may be cut short
+                if end < len(buffer) or eof:
+                    yield item
+                    buffer = buffer[end:]
+                    continue
+
+        if eof:
+            raise ValueError("Unexpected end of JSON array")
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+
+class _CsvRowStream(io.RawIOBase):
+    """Readable file over CSV-encoded rows, for psycopg2's copy_expert()."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        self._rows = iter(rows)
+        self._buffer = b''
+        self._line = io.StringIO()
+        # Quoted so empty strings are not read back as NULL
+        self._writer = csv.writer(self._line, quoting=csv.QUOTE_ALL)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while len(self._buffer) < len(target):
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._line.seek(0)
+            self._line.truncate()
+            self._writer.writerow(row)
+            self._buffer += self._line.getvalue().encode('utf-8')
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class WordImporter:
+    """
+    Bulk-loads a vocabulary file into a user's words.
+
+    The file is parsed incrementally, validated rows are streamed into a
+    temporary table with COPY, and one INSERT ... SELECT merges them into
+    api_word, skipping words the user already has. The words_count quota
+    counter is updated once per import.
+    """
+
+    def __init__(self, user, default_language: Optional[str] = None, enforce_quota: bool = True):
+        self.user = user
+        self.default_language = default_language
+        self.enforce_quota = enforce_quota
+        self.languages = dict(Language.objects.values_list('code', 'id'))
+        self.language_codes = {pk: code for code, pk in self.languages.items()}
+        self.gender_choices = {value for value, _ in Word._meta.get_field('gender').choices}
+        self.difficulty_choices = {value for value, _ in Word._meta.get_field('difficulty_level').choices}
+        self.max_lengths = {
+            column: Word._meta.get_field(column).max_length
+            for column in IMPORT_COLUMNS
+            if Word._meta.get_field(column).max_length
+        }
+        self.validate_url = URLValidator()
+        self.invalid = 0
+        self.parsed = 0
+
+    def read_items(self, stream: io.TextIOBase, file_format: str) -> Iterator[Dict]:
+        if file_format == 'csv':
+            yield from csv.DictReader(stream)
+        elif file_format == 'jsonl':
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+        elif file_format == 'json':
+            yield from iter_json_array(stream)
+        else:
+            raise ValueError(f"Unsupported format '{file_format}', expected one of: {', '.join(FILE_FORMATS)}")
+
+    def valid_url(self, value: str) -> bool:
+        if not value:
+            return True
+        try:
+            self.validate_url(value)
+        except ValidationError:
+            return False
+        return True
+
+    def clean(self, item) -> Optional[tuple]:
+        """
+        Return (language_id, column values...) for a valid item, else None.
+        Items need a word and a translation, as WordSerializer does.
+        """
+        if not isinstance(item, dict):
+            return None
+        language_id = self.languages.get(item.get('language') or self.default_language)
+        values = {column: str(item.get(column) or '').strip() for column in IMPORT_COLUMNS}
+        values['gender'] = values['gender'] or 'n/a'
+        values['difficulty_level'] = values['difficulty_level'] or 'medium'
+        values['core'] = str(item.get('core')).lower() in ('true', '1')
+
+        if (
+            language_id is None
+            or not values['word']
+            or not values['translation']
+            or not self.valid_url(values['image_url'])
+            or values['gender'] not in self.gender_choices
+            or values['difficulty_level'] not in self.difficulty_choices
+            or any(len(values[column]) > length for column, length in self.max_lengths.items())
+        ):
+            return None
+        values['word_normalized'] = normalize_text(values['word'])
+        values['translation_normalized'] = normalize_text(values['translation'])
+        # Without MeCab Japanese rows go in unread, for tokenize_japanese_words --missing
+        values.update(
+            Word.readings(self.language_codes[language_id], values['word'], values['example_sentence'])
+            or {'reading_kana': '', 'reading_romaji': '', 'tokens': {}}
+        )
+        return (language_id,) + tuple(values[column] for column in STAGED_COLUMNS)
+
+    def staged_rows(self, items: Iterable) -> Iterator[tuple]:
+        for seq, item in enumerate(items):
+            self.parsed += 1
+            row = self.clean(item)
+            if row is None:
+                self.invalid += 1
+                continue
+            # jsonb columns are copied as JSON text
+            yield (seq,) + tuple(json.dumps(value) if isinstance(value, dict) else value for value in row)
+
+    def copy_rows(self, cursor, rows: Iterable[tuple]) -> None:
+        raw_cursor = cursor.cursor
+        if is_psycopg3:
+            with raw_cursor.copy(COPY_STAGING_TABLE) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            raw_cursor.copy_expert(COPY_STAGING_TABLE, _CsvRowStream(rows), size=65536)
+
+    def quota(self, profile: Optional[UserProfile]) -> Dict[int, int]:
+        if not self.enforce_quota or profile is None:
+            return {}
+        checker = WordSerializer()
+        remaining = {}
+        for code, language_id in self.languages.items():
+            max_words, _ = checker.can_add_word(profile, code)
+            remaining[language_id] = max(max_words - profile.get_words_count(code), 0)
+        return remaining
+
+    def run(self, stream: io.TextIOBase, file_format: str) -> Dict:
+        items = self.read_items(stream, file_format)
+        with transaction.atomic():
+            profile = UserProfile.objects.select_for_update().filter(user=self.user).first()
+            quota = self.quota(profile)
+            with connection.cursor() as cursor:
+                cursor.execute(CREATE_STAGING_TABLE)
+                self.copy_rows(cursor, self.staged_rows(items))
+                cursor.execute(MERGE_STAGING_TABLE, {
+                    'user_id': self.user.pk,
+                    'quota_languages': list(quota.keys()),
+                    'quota_remaining': list(quota.values()),
+                })
+                created = [Word.from_returning(RETURNED_COLUMNS, row, connection) for row in cursor.fetchall()]
+                cursor.execute(DROP_STAGING_TABLE)
+
+            inserted_by_language = {}
+            for word in created:
+                code = self.language_codes[word.language_id]
+                inserted_by_language[code] = inserted_by_language.get(code, 0) + 1
+            if profile is not None and inserted_by_language:
+                for code, count in inserted_by_language.items():
+                    profile.words_count[code] = profile.get_words_count(code) + count
+                profile.save(update_fields=['words_count'])
+
+            if created:
+                transaction.on_commit(lambda: words_bulk_created.send(sender=Word, words=created))
+
+        logger.info(f"Imported {len(created)} words for user {self.user.pk}")
+        return {
+            'inserted': len(created),
+            'skipped': self.parsed - self.invalid - len(created),
+            'invalid': self.invalid,
+            'by_language': inserted_by_language,
+        }
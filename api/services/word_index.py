@@ -0,0 +1,388 @@
+import bisect
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, Window
+
+from api.models import Language, Word
+from api.serializers.rows import RowEncoder
+from api.serializers.word import WordSerializer
+from api.services.word_spelling import SymSpellIndex
+from api.utils.text import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Suggestions render like WordSerializer
+payload_encoder = RowEncoder(WordSerializer)
+
+
+def fold(text: str) -> str:
+    """Key used for prefix matching; the same key as Word.word_normalized."""
+    return normalize_text(text)
+
+
+def _column_value(word: Word, column: str):
+    if '__' in column:
+        # Lexeme fallback columns, e.g. lexeme__translation, only needed
+        # (and only loaded) for values the word inherits
+        relation, name = column.split('__', 1)
+        if getattr(word, name) is not None or getattr(word, f'{relation}_id') is None:
+            return None
+        return getattr(getattr(word, relation), name)
+    return word.serializable_value(column)
+
+
+def payload_from_word(word: Word) -> Dict:
+    return payload_encoder.encode(
+        {column: _column_value(word, column) for column in payload_encoder.columns}
+    )
+
+
+class _Entry:
+    __slots__ = ('count', 'payload')
+
+    def __init__(self, count: int, payload: Dict):
+        self.count = count
+        self.payload = payload
+
+
+class PrefixIndex:
+    """
+    Distinct words of one language as a sorted array of folded keys.
+
+    A prefix maps to a contiguous slice found with two bisects; the slice is
+    ranked by popularity (number of users who saved the word) with a heap, so
+    a lookup costs O(log n + m log k) for m matches and k results.
+    """
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._entries: Dict[str, _Entry] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self, payload: Dict, count: int) -> None:
+        """Bulk-load one distinct word; call finish_loading() afterwards."""
+        key = fold(payload['word'])
+        self._keys.append(key)
+        self._entries[key] = _Entry(count, payload)
+
+    def finish_loading(self) -> None:
+        # Database collation order is not Python's code point order
+        self._keys.sort()
+
+    def add(self, payload: Dict) -> None:
+        key = fold(payload['word'])
+        entry = self._entries.get(key)
+        if entry is None:
+            bisect.insort(self._keys, key)
+            self._entries[key] = _Entry(1, payload)
+            return
+        entry.count += 1
+        if entry.payload is None or payload['id'] < entry.payload['id']:
+            entry.payload = payload
+
+    def replace(self, payload: Dict) -> None:
+        """Refresh the payload of an already indexed word after an edit."""
+        entry = self._entries.get(fold(payload['word']))
+        if entry is not None and entry.payload['id'] == payload['id']:
+            entry.payload = payload
+
+    def remove(self, word: str, word_id: Optional[int] = None) -> None:
+        key = fold(word)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.count -= 1
+        if entry.payload is not None and entry.payload['id'] == word_id:
+            # Never hand out a deleted word; the remaining copies are not in
+            # memory, so the word is hidden until one is saved or the next rebuild
+            entry.payload = None
+        if entry.count <= 0:
+            del self._entries[key]
+            position = bisect.bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    def _best_keys(self, prefix: str, limit: int) -> List[str]:
+        prefix = fold(prefix)
+        low = bisect.bisect_left(self._keys, prefix)
+        high = bisect.bisect_left(self._keys, prefix + '\U0010ffff', low)
+        return heapq.nsmallest(
+            limit,
+            (key for key in self._keys[low:high] if self._entries[key].payload is not None),
+            key=lambda key: (-self._entries[key].count, key),
+        )
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        return entry.payload if entry is not None else None
+
+    def search(self, prefix: str, limit: int) -> List[Dict]:
+        return [self._entries[key].payload for key in self._best_keys(prefix, limit)]
+
+    def top(self, prefix: str, limit: int) -> List[tuple]:
+        """Like search(), but returns (count, key, payload) for merging languages."""
+        return [
+            (self._entries[key].count, key, self._entries[key].payload)
+            for key in self._best_keys(prefix, limit)
+        ]
+
+
+class SpellingIndex:
+    """
+    Typo-tolerant lookup of the words and translations of one language: a
+    SymSpellIndex over their folded forms, plus a representative payload for
+    each translation (words resolve through the PrefixIndex).
+    """
+
+    def __init__(self):
+        self.terms = SymSpellIndex()
+        self._translations: Dict[str, Dict] = {}
+
+    def add(self, payload: Dict, count: int = 1) -> None:
+        self.terms.add(fold(payload['word']), count)
+        translation = fold(payload.get('translation') or '')
+        if translation:
+            self.terms.add(translation, count)
+            self._translations.setdefault(translation, payload)
+
+    def remove(self, word: str, translation: str, word_id: Optional[int] = None) -> None:
+        self.terms.remove(fold(word))
+        translation = fold(translation or '')
+        if translation:
+            self.terms.remove(translation)
+            payload = self._translations.get(translation)
+            if translation not in self.terms or (payload is not None and payload['id'] == word_id):
+                self._translations.pop(translation, None)
+
+    def translation_payload(self, key: str) -> Optional[Dict]:
+        return self._translations.get(key)
+
+
+class WordSuggestionIndex:
+    """
+    Process-wide autocomplete over every user's words, one PrefixIndex per
+    language, so suggestions never touch the database. A SpellingIndex per
+    language answers fuzzy (misspelled) lookups the same way.
+
+    Built on first use (or by warm() at worker start) and kept current by the
+    Word post_save/post_delete receivers. Writes made by other workers only
+    arrive through the periodic rebuild after WORD_SUGGESTION_INDEX_MAX_AGE
+    seconds, which runs on a background thread while requests keep reading
+    the current index. Recent answers, empty ones included, are kept in a
+    small LRU.
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._indexes: Dict[str, PrefixIndex] = {}
+        self._spellings: Dict[str, SpellingIndex] = {}
+        self._language_codes: Dict[int, str] = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._built_at: Optional[float] = None
+
+    @property
+    def max_age(self) -> int:
+        return settings.WORD_SUGGESTION_INDEX_MAX_AGE
+
+    def warm(self) -> None:
+        try:
+            self.build()
+        except Exception as e:
+            logger.warning(f"Could not build word suggestion index: {str(e)}")
+
+    def build(self) -> None:
+        with self._build_lock:
+            self._build()
+
+    def _build(self) -> None:
+        language_codes = dict(Language.objects.values_list('id', 'code'))
+        indexes: Dict[str, PrefixIndex] = {}
+        spellings: Dict[str, SpellingIndex] = {}
+        rows = (
+            Word.objects
+            .annotate(
+                popularity=Window(Count('id'), partition_by=[F('language_id'), F('word_normalized')]),
+            )
+            .order_by('language_id', 'word_normalized', 'id')
+            .distinct('language_id', 'word_normalized')
+            .values('popularity', *payload_encoder.columns)
+        )
+        for row in rows.iterator(chunk_size=5000):
+            payload = payload_encoder.encode(row)
+            code = language_codes.get(row['language'])
+            indexes.setdefault(code, PrefixIndex()).load(payload, row['popularity'])
+            spellings.setdefault(code, SpellingIndex()).add(payload, row['popularity'])
+        for index in indexes.values():
+            index.finish_loading()
+
+        with self._lock:
+            self._indexes = indexes
+            self._spellings = spellings
+            self._language_codes = language_codes
+            self._cache.clear()
+            self._built_at = time.monotonic()
+        logger.info(f"Built word suggestion index with {sum(map(len, indexes.values()))} words")
+
+    def clear(self) -> None:
+        """Drop everything; the next suggest() rebuilds from the database."""
+        with self._lock:
+            self._indexes = {}
+            self._spellings = {}
+            self._cache.clear()
+            self._built_at = None
+
+    def _ensure_fresh(self) -> None:
+        if self._built_at is None:
+            with self._build_lock:
+                if self._built_at is None:
+                    self._build()
+        elif time.monotonic() - self._built_at > self.max_age and self._build_lock.acquire(blocking=False):
+            # Keep serving the old index while a background thread rebuilds it
+            threading.Thread(target=self._rebuild, name='word-suggestion-index', daemon=True).start()
+
+    def _rebuild(self) -> None:
+        """Background rebuild; the caller acquired _build_lock for this thread."""
+        try:
+            self._build()
+        except Exception as e:
+            logger.warning(f"Could not rebuild word suggestion index: {str(e)}")
+        finally:
+            self._build_lock.release()
+            # The thread's own database connection
+            connection.close()
+
+    def suggest(self, query: str, language_code: Optional[str], limit: int) -> List[Dict]:
+        self._ensure_fresh()
+        cache_key = (language_code, fold(query), limit)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+            if language_code:
+                index = self._indexes.get(language_code)
+                results = index.search(query, limit) if index else []
+            else:
+                candidates = [
+                    candidate
+                    for index in self._indexes.values()
+                    for candidate in index.top(query, limit)
+                ]
+                best = heapq.nsmallest(limit, candidates, key=lambda c: (-c[0], c[1]))
+                results = [payload for _, _, payload in best]
+
+            self._cache[cache_key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return results
+
+    def fuzzy_terms(self, query: str, language_code: Optional[str], limit: int) -> List[tuple]:
+        """
+        Folded words and translations within the spelling index's edit
+        distance of ``query``, as (term, distance), closest first.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            return self._fuzzy_terms(fold(query), language_code, limit)
+
+    def _fuzzy_terms(self, query: str, language_code: Optional[str], limit: int) -> List[tuple]:
+        codes = [language_code] if language_code else list(self._spellings)
+        matches = []
+        for code in codes:
+            spelling = self._spellings.get(code)
+            if spelling is not None:
+                matches.extend(
+                    (distance, -spelling.terms.count(term), term, code)
+                    for term, distance in spelling.terms.lookup(query, limit)
+                )
+        matches.sort()
+        return [(term, distance, code) for distance, _, term, code in matches[:limit]]
+
+    def suggest_fuzzy(self, query: str, language_code: Optional[str], limit: int) -> List[Dict]:
+        """Words spelled like ``query``, or whose translation is, closest first."""
+        self._ensure_fresh()
+        with self._lock:
+            results = []
+            seen = set()
+            # Several terms can resolve to the same word
+            for term, _, code in self._fuzzy_terms(fold(query), language_code, limit * 2):
+                payload = self._indexes[code].get(term) if code in self._indexes else None
+                if payload is None:
+                    payload = self._spellings[code].translation_payload(term)
+                if payload is not None and payload['id'] not in seen:
+                    seen.add(payload['id'])
+                    results.append(payload)
+                    if len(results) == limit:
+                        break
+            return results
+
+    def _language_code(self, language_id: int) -> Optional[str]:
+        code = self._language_codes.get(language_id)
+        if code is None:
+            code = Language.objects.filter(id=language_id).values_list('code', flat=True).first()
+            self._language_codes[language_id] = code
+        return code
+
+    def _forget_cached(self, language_code: Optional[str], word: str) -> None:
+        key = fold(word)
+        stale = [
+            cache_key for cache_key in self._cache
+            if cache_key[0] in (None, language_code) and key.startswith(cache_key[1])
+        ]
+        for cache_key in stale:
+            del self._cache[cache_key]
+
+    def word_saved(self, word: Word, created: bool, previous: Optional[Dict] = None) -> None:
+        if self._built_at is None:
+            return
+        # Anything that may query the database is done before taking the lock
+        code = self._language_code(word.language_id)
+        previous_code = self._language_code(previous.get('language_id')) if previous else None
+        payload = payload_from_word(word)
+        with self._lock:
+            index = self._indexes.setdefault(code, PrefixIndex())
+            spelling = self._spellings.setdefault(code, SpellingIndex())
+            if created or not previous:
+                index.add(payload)
+                spelling.add(payload)
+            elif (previous.get('language_id'), fold(previous.get('word', ''))) != (word.language_id, fold(word.word)):
+                if previous_code in self._indexes:
+                    self._indexes[previous_code].remove(previous.get('word', ''), word.id)
+                if previous_code in self._spellings:
+                    self._spellings[previous_code].remove(
+                        previous.get('word', ''), previous.get('translation'), word.id
+                    )
+                self._forget_cached(previous_code, previous.get('word', ''))
+                index.add(payload)
+                spelling.add(payload)
+            else:
+                index.replace(payload)
+                if fold(previous.get('translation') or '') != fold(word.translation or ''):
+                    spelling.remove(word.word, previous.get('translation'), word.id)
+                    spelling.add(payload)
+            self._forget_cached(code, word.word)
+
+    def word_deleted(self, word: Word) -> None:
+        if self._built_at is None:
+            return
+        code = self._language_code(word.language_id)
+        with self._lock:
+            if code in self._indexes:
+                self._indexes[code].remove(word.word, word.id)
+            if code in self._spellings:
+                self._spellings[code].remove(word.word, word.translation, word.id)
+            self._forget_cached(code, word.word)
+
+
+word_suggestion_index = WordSuggestionIndex()
@@ -0,0 +1,122 @@
+from typing import Dict, Iterator, List, Set, Tuple
+
+
+def edit_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions), or max_distance + 1 once it is known to be larger.
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+    for i, source_char in enumerate(source, 1):
+        current = [i] * (len(target) + 1)
+        row_min = i
+        for j, target_char in enumerate(target, 1):
+            value = previous[j - 1] + (source_char != target_char)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                previous_previous is not None and j > 1
+                and source_char == target[j - 2] and source[i - 2] == target_char
+                and previous_previous[j - 2] + 1 < value
+            ):
+                value = previous_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def deletes(term: str, max_distance: int) -> Set[str]:
+    """Every string obtained by removing up to max_distance characters from term."""
+    found = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {
+            candidate[:i] + candidate[i + 1:]
+            for candidate in frontier
+            for i in range(len(candidate))
+        } - found
+        found |= frontier
+    return found
+
+
+class SymSpellIndex:
+    """
+    Symmetric delete spelling index over the terms of one language.
+
+    Each term is stored under every variant with up to ``max_distance``
+    characters removed from its first ``prefix_length`` characters. A lookup
+    generates the same deletes for the query, so candidates within the edit
+    distance are found with dictionary hits instead of comparing against
+    every term; only those candidates get a real distance check.
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._counts: Dict[str, int] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._counts
+
+    def count(self, term: str) -> int:
+        return self._counts.get(term, 0)
+
+    def _variants(self, term: str) -> Set[str]:
+        return deletes(term[:self.prefix_length], self.max_distance)
+
+    def add(self, term: str, count: int = 1) -> None:
+        if not term:
+            return
+        if term in self._counts:
+            self._counts[term] += count
+            return
+        self._counts[term] = count
+        for variant in self._variants(term):
+            self._deletes.setdefault(variant, set()).add(term)
+
+    def remove(self, term: str) -> None:
+        if term not in self._counts:
+            return
+        self._counts[term] -= 1
+        if self._counts[term] > 0:
+            return
+        del self._counts[term]
+        for variant in self._variants(term):
+            terms = self._deletes.get(variant)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._deletes[variant]
+
+    def _candidates(self, query: str) -> Iterator[str]:
+        seen = set()
+        for variant in self._variants(query):
+            for term in self._deletes.get(variant, ()):
+                if term not in seen:
+                    seen.add(term)
+                    yield term
+
+    def lookup(self, query: str, limit: int, max_distance: int = None) -> List[Tuple[str, int]]:
+        """Up to ``limit`` (term, distance) pairs, closest and most common first."""
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        matches = []
+        for term in self._candidates(query):
+            distance = edit_distance(query, term, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, -self._counts[term], term))
+        matches.sort()
+        return [(term, distance) for distance, _, term in matches[:limit]]
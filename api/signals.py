@@ -1,7 +1,18 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .models import Language, Lexeme, UserProfile, Word, WordTombstone
+from .services.page_cache import core_word_pages, featured_word_pages, vocabulary_pages
+from .services.word_index import word_suggestion_index
+from .utils.text import normalize_text
+
+# Sent after bulk writes that skip the per-row post_save/post_delete signals,
+# with ``words`` holding the affected Word instances (as written, or as they
+# were before deletion). words_bulk_updated also gets the changed ``fields``.
+words_bulk_created = Signal()
+words_bulk_deleted = Signal()
+words_bulk_updated = Signal()
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
@@ -15,3 +26,112 @@ def create_user_profile(sender, instance, created, **kwargs):
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, **kwargs):
     instance.userprofile.save()
+
+@receiver(post_save, sender=Word)
+def update_suggestion_index(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_loaded_values', None)
+    word_suggestion_index.word_saved(instance, created, previous)
+
+@receiver(post_delete, sender=Word)
+def remove_from_suggestion_index(sender, instance, **kwargs):
+    word_suggestion_index.word_deleted(instance)
+
+@receiver(post_delete, sender=Word)
+def record_word_tombstone(sender, instance, origin=None, **kwargs):
+    # Cascades from a deleted user or language leave nothing to sync
+    deleted_directly = isinstance(origin, Word) or (
+        isinstance(origin, QuerySet) and origin.model is Word
+    )
+    if deleted_directly:
+        WordTombstone.objects.create(
+            user_id=instance.user_id,
+            language_id=instance.language_id,
+            word_id=instance.id,
+        )
+
+@receiver(words_bulk_created, sender=Word)
+def add_bulk_to_suggestion_index(sender, words, **kwargs):
+    for word in words:
+        word_suggestion_index.word_saved(word, created=True)
+
+@receiver(words_bulk_deleted, sender=Word)
+def remove_bulk_from_suggestion_index(sender, words, **kwargs):
+    for word in words:
+        word_suggestion_index.word_deleted(word)
+
+@receiver(words_bulk_updated, sender=Word)
+def refresh_bulk_in_suggestion_index(sender, words, **kwargs):
+    # Bulk updates never touch word, language or translation
+    for word in words:
+        previous = {'language_id': word.language_id, 'word': word.word, 'translation': word.translation}
+        word_suggestion_index.word_saved(word, created=False, previous=previous)
+
+def _language_codes(language_ids):
+    return Language.objects.filter(id__in=language_ids).values_list('code', flat=True)
+
+def _invalidate_catalog_pages(words):
+    """Bump the cached core and featured pages that (word, previous values) pairs touch"""
+    core_language_ids = set()
+    featured = False
+    for word, previous in words:
+        if word.core or previous.get('core'):
+            core_language_ids.update({word.language_id, previous.get('language_id')})
+        featured = featured or 'featured' in (word.category, previous.get('category'))
+    if core_language_ids:
+        core_word_pages.bump(*_language_codes(core_language_ids))
+    if featured:
+        featured_word_pages.bump()
+
+@receiver(post_save, sender=Word)
+def invalidate_catalog_pages(sender, instance, created, **kwargs):
+    previous = {} if created else (getattr(instance, '_loaded_values', None) or {})
+    _invalidate_catalog_pages([(instance, previous)])
+
+@receiver(post_delete, sender=Word)
+def invalidate_catalog_pages_on_delete(sender, instance, **kwargs):
+    _invalidate_catalog_pages([(instance, {})])
+
+@receiver(words_bulk_created, sender=Word)
+@receiver(words_bulk_deleted, sender=Word)
+def invalidate_catalog_pages_on_bulk(sender, words, **kwargs):
+    _invalidate_catalog_pages([(word, {}) for word in words])
+
+@receiver(words_bulk_updated, sender=Word)
+def invalidate_catalog_pages_on_bulk_update(sender, words, fields, **kwargs):
+    _invalidate_catalog_pages([(word, {}) for word in words])
+    if 'category' in fields:
+        # Words may have been moved out of the featured category
+        featured_word_pages.bump()
+
+@receiver(post_save, sender=Lexeme)
+def invalidate_catalog_pages_on_lexeme(sender, instance, **kwargs):
+    # Core and featured words linked to the lexeme may render its values
+    core_word_pages.bump(*_language_codes([instance.language_id]))
+    featured_word_pages.bump()
+
+@receiver(post_save, sender=Lexeme)
+def refresh_inherited_translations(sender, instance, created, update_fields=None, **kwargs):
+    # The search key of an inherited translation is the lexeme's; the
+    # api_lexeme_refresh_words trigger only rebuilds the search vectors
+    if created or (update_fields is not None and 'translation' not in update_fields):
+        return
+    key = normalize_text(instance.translation)
+    stale = Word.objects.filter(lexeme=instance, translation__isnull=True).exclude(translation_normalized=key)
+    users = set(stale.values_list('user_id', flat=True).distinct())
+    if users:
+        stale.update(translation_normalized=key)
+        vocabulary_pages.bump(*(str(user_id) for user_id in users))
+
+@receiver(post_save, sender=Word)
+def bump_vocabulary_version(sender, instance, **kwargs):
+    vocabulary_pages.bump(str(instance.user_id))
+
+@receiver(post_delete, sender=Word)
+def bump_vocabulary_version_on_delete(sender, instance, **kwargs):
+    vocabulary_pages.bump(str(instance.user_id))
+
+@receiver(words_bulk_created, sender=Word)
+@receiver(words_bulk_deleted, sender=Word)
+@receiver(words_bulk_updated, sender=Word)
+def bump_vocabulary_version_on_bulk(sender, words, **kwargs):
+    vocabulary_pages.bump(*{str(word.user_id) for word in words})
@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services import german_lexicon
+from api.services.german_lexicon import GermanLexicon, get_german_lexicon
+
+
+class GermanLexiconTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'nouns.lex')
+        GermanLexicon.write(self.path, [
+            ('Haus', ['das'], ['Häuser']),
+            ('Straße', ['die'], ['Straßen']),
+            ('Wort', ['das'], ['Wörter', 'Worte']),
+            ('See', ['der'], ['Seen']),
+            ('See', ['die'], []),
+            ('Butter', ['die'], []),
+        ])
+        self.lexicon = GermanLexicon(self.path)
+        self.addCleanup(self.lexicon.close)
+
+    def test_lookup_is_case_insensitive(self):
+        self.assertEqual(len(self.lexicon), 5)
+        self.assertEqual(self.lexicon.lookup('haus').genders, ('das',))
+        self.assertEqual(self.lexicon.lookup('STRASSE'), None)
+        self.assertEqual(self.lexicon.lookup('straße').plurals, ('Straßen',))
+
+    def test_alternatives(self):
+        self.assertEqual(self.lexicon.lookup('Wort').plurals, ('Wörter', 'Worte'))
+        # Duplicates merge their articles and keep the first plurals
+        self.assertEqual(self.lexicon.lookup('See'), (('der', 'die'), ('Seen',)))
+        self.assertEqual(self.lexicon.lookup('Butter').plurals, ())
+
+    def test_missing_words(self):
+        for word in ('', 'Aal', 'Hauser', 'Zebra'):
+            self.assertIsNone(self.lexicon.lookup(word))
+
+    def test_rejects_other_files(self):
+        path = os.path.join(os.path.dirname(self.path), 'other.lex')
+        with open(path, 'wb') as f:
+            f.write(b'not a lexicon')
+        with self.assertRaises(ValueError):
+            GermanLexicon(path)
+
+    def test_missing_lexicon_loads_once_built(self):
+        path = os.path.join(os.path.dirname(self.path), 'later.lex')
+        self.addCleanup(german_lexicon._lexicons.pop, path, None)
+        with override_settings(GERMAN_LEXICON_PATH=path):
+            self.assertIsNone(get_german_lexicon())
+            GermanLexicon.write(path, [('Haus', ['das'], ['Häuser'])])
+            lexicon = get_german_lexicon()
+            self.addCleanup(lexicon.close)
+            self.assertEqual(lexicon.lookup('Haus').genders, ('das',))
@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+
+from api.services.japanese_reading import parse_features
+
+# Feature strings as unidic-lite and IPAdic print them
+UNIDIC_BENKYOU = (
+    '名詞,普通名詞,サ変可能,*,*,*,ベンキョウ,勉強,勉強,ベンキョー,勉強,ベンキョー,漢,*,*,*,*,'
+    'ベンキョウ,ベンキョウ,ベンキョウ,ベンキョウ,*,*,0,C2,*'
+)
+UNIDIC_WA = (
+    '助詞,係助詞,*,*,*,*,ハ,は,は,ワ,は,ワ,和,*,*,*,*,ハ,ハ,ハ,ハ,*,*,*,'
+    '"動詞%F2@0,名詞%F1,形容詞%F2@-1",*'
+)
+IPADIC_BENKYOU = '名詞,サ変接続,*,*,*,*,勉強,ベンキョウ,ベンキョー'
+
+
+class ParseFeaturesTests(SimpleTestCase):
+    def test_unidic_reading_is_the_written_kana(self):
+        self.assertEqual(
+            parse_features(UNIDIC_BENKYOU, '勉強', 'unidic'),
+            {'surface': '勉強', 'reading': 'べんきょう', 'base': '勉強', 'pos': '名詞'},
+        )
+
+    def test_unidic_quoted_fields(self):
+        self.assertEqual(parse_features(UNIDIC_WA, 'は', 'unidic')['reading'], 'は')
+
+    def test_ipadic_reading(self):
+        self.assertEqual(parse_features(IPADIC_BENKYOU, '勉強', 'ipadic')['reading'], 'べんきょう')
+
+    def test_unknown_word_keeps_surface(self):
+        token = parse_features('名詞,普通名詞,一般,*,*,*', 'ポケモン', 'unidic')
+        self.assertEqual((token['reading'], token['base']), ('ぽけもん', 'ポケモン'))
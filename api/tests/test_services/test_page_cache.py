@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from api.services.page_cache import VersionedPageCache
+
+
+class VersionedPageCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.pages = VersionedPageCache('test_pages')
+
+    def test_page_is_served_until_its_scope_is_bumped(self):
+        version = self.pages.version('de')
+        self.pages.set(version, 'page-1', {'results': ['Haus']})
+        self.assertEqual(self.pages.get(self.pages.version('de'), 'page-1'), {'results': ['Haus']})
+
+        self.pages.bump('de')
+        self.assertIsNone(self.pages.get(self.pages.version('de'), 'page-1'))
+
+    def test_bump_moves_all_scopes_version(self):
+        version = self.pages.version()
+        self.pages.bump('en')
+        self.assertNotEqual(self.pages.version(), version)
+
+    def test_bump_leaves_other_scopes(self):
+        version = self.pages.version('de')
+        self.pages.bump('en')
+        self.assertEqual(self.pages.version('de'), version)
+        self.assertNotEqual(self.pages.etag(version, 'page-1'), self.pages.etag(version + 1, 'page-1'))
+
+    def test_scopes_with_equal_versions_do_not_share_pages(self):
+        self.pages.set(7, 'page-1', {'results': ['Haus']}, scope='1')
+        self.assertIsNone(self.pages.get(7, 'page-1', scope='2'))
+        self.assertNotEqual(self.pages.etag(7, 'page-1', '1'), self.pages.etag(7, 'page-1', '2'))
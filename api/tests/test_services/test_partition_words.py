@@ -0,0 +1,56 @@
+from django.test import SimpleTestCase
+
+from api.management.commands.partition_words import (
+    NEW_SUFFIX, plan_relations, renamed, rewrite_index_definition, rewrite_trigger_definition,
+)
+
+
+class PartitionWordsTests(SimpleTestCase):
+    def test_renamed_fits_identifier_limit(self):
+        self.assertEqual(renamed('api_word_pkey', NEW_SUFFIX), 'api_word_pkey_part')
+        long_name = renamed('x' * 63, NEW_SUFFIX)
+        self.assertEqual(len(long_name), 63)
+        self.assertTrue(long_name.endswith(NEW_SUFFIX))
+
+    def test_rewrite_index_definition(self):
+        cases = [
+            (
+                'CREATE INDEX word_user_added_at_id ON public.api_word USING btree (user_id, added_at, id)',
+                'word_user_added_at_id_part',
+                'CREATE INDEX "word_user_added_at_id_part" ON api_word_partitioned '
+                'USING btree (user_id, added_at, id)',
+            ),
+            (
+                'CREATE UNIQUE INDEX some_key ON ONLY api_word USING btree (user_id, word) WHERE (core = true)',
+                'some_key_part',
+                'CREATE UNIQUE INDEX "some_key_part" ON api_word_partitioned '
+                'USING btree (user_id, word) WHERE (core = true)',
+            ),
+        ]
+        for definition, name, expected in cases:
+            with self.subTest(definition=definition):
+                self.assertEqual(rewrite_index_definition(definition, name, 'api_word_partitioned'), expected)
+
+    def test_rewrite_trigger_definition(self):
+        definition = (
+            'CREATE TRIGGER api_word_search_vector_trigger BEFORE INSERT OR UPDATE OF word ON public.api_word '
+            'FOR EACH ROW EXECUTE FUNCTION api_word_search_vector_update()'
+        )
+        self.assertEqual(
+            rewrite_trigger_definition(definition, 'api_word_partitioned'),
+            'CREATE TRIGGER api_word_search_vector_trigger BEFORE INSERT OR UPDATE OF word ON api_word_partitioned '
+            'FOR EACH ROW EXECUTE FUNCTION api_word_search_vector_update()',
+        )
+
+    def test_plan_relations(self):
+        plan = {
+            'Node Type': 'Limit',
+            'Plans': [{
+                'Node Type': 'Nested Loop',
+                'Plans': [
+                    {'Node Type': 'Index Scan', 'Relation Name': 'api_word_p03'},
+                    {'Node Type': 'Index Scan', 'Relation Name': 'api_language'},
+                ],
+            }],
+        }
+        self.assertEqual(plan_relations(plan), {'api_word_p03', 'api_language'})
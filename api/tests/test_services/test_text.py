@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+
+from api.utils.text import to_hiragana, to_romaji
+
+
+class KanaTests(SimpleTestCase):
+    def test_to_hiragana(self):
+        self.assertEqual(to_hiragana('カタカナとひらがな'), 'かたかなとひらがな')
+        self.assertEqual(to_hiragana('コーヒー'), 'こーひー')
+
+    def test_to_romaji(self):
+        cases = {
+            'にほんご': 'nihongo',
+            'べんきょう': 'benkyou',
+            'きっぷ': 'kippu',
+            'まっちゃ': 'matcha',
+            'しゃしん': 'shashin',
+            'ちょっと': 'chotto',
+            'じゃあ': 'jaa',
+            'げんいん': "gen'in",
+            'こんや': "kon'ya",
+            'ファイル': 'fairu',
+            'コーヒー': 'koohii',
+            'ABC': 'ABC',
+        }
+        for kana, romaji in cases.items():
+            with self.subTest(kana=kana):
+                self.assertEqual(to_romaji(kana), romaji)
@@ -0,0 +1,56 @@
+from django.test import SimpleTestCase
+from api.services.word_index import PrefixIndex, fold
+
+
+def payload(word_id, word):
+    return {'id': word_id, 'word': word, 'translation': ''}
+
+
+class PrefixIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = PrefixIndex()
+        self.index.load(payload(1, 'Haus'), 3)
+        self.index.load(payload(2, 'Hausaufgabe'), 5)
+        self.index.load(payload(3, 'Hund'), 1)
+        self.index.finish_loading()
+
+    def test_search_ranks_by_popularity(self):
+        results = self.index.search('hau', 5)
+        self.assertEqual([p['word'] for p in results], ['Hausaufgabe', 'Haus'])
+
+    def test_search_respects_limit(self):
+        self.assertEqual(len(self.index.search('h', 2)), 2)
+
+    def test_search_without_match(self):
+        self.assertEqual(self.index.search('katz', 5), [])
+
+    def test_add_new_word(self):
+        self.index.add(payload(4, 'Hauptstadt'))
+        results = self.index.search('haup', 5)
+        self.assertEqual([p['word'] for p in results], ['Hauptstadt'])
+
+    def test_add_existing_word_increments_popularity(self):
+        self.index.add(payload(5, 'Hund'))
+        self.index.add(payload(6, 'hund'))
+        self.assertEqual(self.index.search('h', 1)[0]['word'], 'Hausaufgabe')
+        self.assertEqual(self.index.top('hu', 1)[0][0], 3)
+
+    def test_remove_last_copy_drops_word(self):
+        self.index.remove('Hund')
+        self.assertEqual(self.index.search('hu', 5), [])
+        self.assertEqual(len(self.index), 2)
+
+    def test_remove_representative_hides_deleted_word(self):
+        self.index.remove('Haus', word_id=1)
+        self.assertEqual([p['word'] for p in self.index.search('hau', 5)], ['Hausaufgabe'])
+        self.assertIsNone(self.index.get(fold('Haus')))
+
+        self.index.add(payload(7, 'Haus'))
+        self.assertEqual(self.index.get(fold('Haus'))['id'], 7)
+
+
+class FoldTests(SimpleTestCase):
+    def test_fold_matches_normalized_spellings(self):
+        self.assertEqual(fold('Straße'), fold('strasse'))
+        self.assertEqual(fold('Über'), 'uber')
+        self.assertEqual(fold('カタカナ'), fold('かたかな'))
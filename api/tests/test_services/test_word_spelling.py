@@ -0,0 +1,31 @@
+from django.test import SimpleTestCase
+from api.services.word_spelling import SymSpellIndex, edit_distance
+
+
+class EditDistanceTests(SimpleTestCase):
+    def test_substitution_and_transposition(self):
+        self.assertEqual(edit_distance('madchen', 'mädchen', 2), 1)
+        self.assertEqual(edit_distance('hnud', 'hund', 2), 1)
+
+    def test_stops_past_max_distance(self):
+        self.assertEqual(edit_distance('katze', 'hund', 2), 3)
+
+
+class SymSpellIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SymSpellIndex()
+        self.index.add('mädchen', 3)
+        self.index.add('märchen', 1)
+        self.index.add('hund', 2)
+
+    def test_lookup_ranks_by_distance_then_count(self):
+        self.assertEqual(self.index.lookup('madchen', 5), [('mädchen', 1), ('märchen', 2)])
+
+    def test_lookup_respects_max_distance(self):
+        self.assertEqual(self.index.lookup('madchen', 5, max_distance=1), [('mädchen', 1)])
+
+    def test_remove_drops_term_when_count_reaches_zero(self):
+        self.index.remove('hund')
+        self.assertEqual(self.index.lookup('hund', 5), [('hund', 0)])
+        self.index.remove('hund')
+        self.assertEqual(self.index.lookup('hund', 5), [])
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.contrib.auth.models import User
+from api.models import Language, StarterPack, StarterPackWord, Word
+from api.services.page_cache import vocabulary_pages
+from api.services.word_index import word_suggestion_index
+
+class StarterPackViewSetTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.profile = self.user.userprofile
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.language = Language.objects.create(
+            code='de',
+            name='German'
+        )
+        self.pack = StarterPack.objects.create(slug='de-basics', name='German basics', language=self.language)
+        for position, (word, translation) in enumerate([('Haus', 'house'), ('Katze', 'cat'), ('Hund', 'dog')]):
+            StarterPackWord.objects.create(pack=self.pack, position=position, word=word, translation=translation)
+
+        word_suggestion_index.clear()
+        cache.clear()
+        vocabulary_pages.clear()
+
+    def test_list_starter_packs(self):
+        response = self.client.get(reverse('starter-pack-list'), {'language': 'de'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['slug'], 'de-basics')
+        self.assertEqual(response.data[0]['words_count'], 3)
+
+    def test_clone_skips_existing_words(self):
+        Word.objects.create(word='Haus', translation='house', language=self.language, user=self.user)
+        url = reverse('starter-pack-clone', kwargs={'slug': 'de-basics'})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['inserted'], 2)
+        self.assertEqual(response.data['duplicates'], 1)
+        self.assertEqual(response.data['limit_reached'], 0)
+
+        katze = Word.objects.get(user=self.user, word='Katze')
+        self.assertEqual(katze.translation, 'cat')
+        self.assertEqual(katze.word_normalized, 'katze')
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.get_words_count('de'), 2)
+
+        response = self.client.post(url)
+        self.assertEqual(response.data['inserted'], 0)
+
+    def test_clone_over_quota_is_forbidden(self):
+        self.profile.words_count = {'de': 49}
+        self.profile.save()
+        url = reverse('starter-pack-clone', kwargs={'slug': 'de-basics'})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((response.data['inserted'], response.data['limit_reached']), (1, 2))
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data['error'], 'Word limit reached for de. Maximum 50 words allowed per language with your current plan.')
+        self.assertEqual((response.data['duplicates'], response.data['limit_reached']), (1, 2))
@@ -1,9 +1,25 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
 from django.urls import reverse
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import zipfile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from unittest.mock import patch
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.contrib.auth.models import User
-from api.models import Word, Language, UserProfile
+from api.models import Lexeme, Word, Language, UserProfile
 from api.serializers import WordSerializer
+from api.services.german_lexicon import GermanLexicon
+from api.services.word_import import WordImporter
+from api.services.page_cache import core_word_pages, featured_word_pages, vocabulary_pages
+from api.services.word_index import word_suggestion_index
+from api.signals import words_bulk_deleted
 
 class WordViewSetTests(APITestCase):
     def setUp(self):
@@ -76,6 +92,13 @@ class WordViewSetTests(APITestCase):
             name='German'
         )
         
+        # The suggestion index is process-wide and would outlive rolled back rows
+        word_suggestion_index.clear()
+        cache.clear()
+        core_word_pages.clear()
+        featured_word_pages.clear()
+        vocabulary_pages.clear()
+
         # Create test word
         self.word = Word.objects.create(
             word='Haus',
@@ -177,4 +200,666 @@ class WordViewSetTests(APITestCase):
         url = reverse('word-list')
         response = self.client.get(url, {'search': 'Haus'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
\ No newline at end of file
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_word_search_ranks_headword_first(self):
+        Word.objects.create(
+            word='Katze',
+            translation='cat',
+            example_sentence='Die Katze jagt den Hund',
+            language=self.language,
+            user=self.user
+        )
+        Word.objects.create(
+            word='Hund',
+            translation='dog',
+            language=self.language,
+            user=self.user
+        )
+        url = reverse('word-list')
+        response = self.client.get(url, {'search': 'Hund', 'language': 'de'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [word['word'] for word in response.data['results']],
+            ['Hund', 'Katze']
+        )
+
+    def test_word_search_matches_prefix(self):
+        url = reverse('word-list')
+        response = self.client.get(url, {'search': 'Hau'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_word_suggestions_deduplicate_across_users(self):
+        other_user = User.objects.create_user(username='otheruser', password='testpass123')
+        Word.objects.create(word='Haus', translation='house', language=self.language, user=other_user)
+        Word.objects.create(word='Hausaufgabe', translation='homework', language=self.language, user=other_user)
+        url = reverse('word-suggestions')
+        response = self.client.get(url, {'query': 'hau', 'language': 'de', 'limit': 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([word['word'] for word in response.data], ['Haus', 'Hausaufgabe'])
+
+    def test_list_words_cursor_pagination(self):
+        for word in ['Hund', 'Katze', 'Maus']:
+            Word.objects.create(word=word, translation=word, language=self.language, user=self.user)
+        url = reverse('word-list')
+        response = self.client.get(url, {'pagination': 'cursor', 'page_size': 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        first_page = [word['word'] for word in response.data['results']]
+        self.assertEqual(first_page, ['Maus', 'Katze', 'Hund'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([word['word'] for word in response.data['results']], ['Haus'])
+        self.assertIsNone(response.data['next'])
+
+    def test_list_words_invalid_cursor(self):
+        url = reverse('word-list')
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_random_words_keep_shuffle_across_pages(self):
+        for word in ['Hund', 'Katze', 'Maus']:
+            Word.objects.create(word=word, translation=word, language=self.language, user=self.user)
+        url = reverse('word-list')
+        first = self.client.get(url, {'random': 'true', 'page_size': 2})
+        second = self.client.get(url, {'random': 'true', 'page_size': 2, 'page': 2})
+        self.assertEqual(first.data['count'], 4)
+        seen = [word['word'] for word in first.data['results'] + second.data['results']]
+        self.assertCountEqual(seen, ['Haus', 'Hund', 'Katze', 'Maus'])
+
+    @override_settings(RANDOM_WORDS_MAX_POOL=2)
+    def test_random_words_sample_reports_full_count(self):
+        for word in ['Hund', 'Katze', 'Maus']:
+            Word.objects.create(word=word, translation=word, language=self.language, user=self.user)
+        url = reverse('word-list')
+        response = self.client.get(url, {'random': 'true', 'page_size': 10})
+        self.assertEqual(response.data['count'], 4)
+        self.assertLessEqual(len(response.data['results']), 2)
+        self.assertIsNone(response.data['next'])
+
+    def test_list_words_sparse_fields(self):
+        url = reverse('word-list')
+        response = self.client.get(url, {'fields': 'word,translation'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'word': 'Haus', 'translation': 'house'}])
+
+    def test_list_words_exclude_fields(self):
+        url = reverse('word-list')
+        response = self.client.get(url, {'exclude': 'example_sentence'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('example_sentence', response.data['results'][0])
+        self.assertEqual(response.data['results'][0]['language'], self.language.id)
+
+    def test_tokens_only_on_request_or_in_detail(self):
+        response = self.client.get(reverse('word-list'))
+        self.assertNotIn('tokens', response.data['results'][0])
+        response = self.client.get(reverse('word-list'), {'fields': 'word,tokens'})
+        self.assertEqual(response.data['results'], [{'word': 'Haus', 'tokens': {}}])
+        response = self.client.get(reverse('word-detail', kwargs={'pk': self.word.pk}))
+        self.assertEqual(response.data['tokens'], {})
+
+    def test_list_words_unknown_field(self):
+        url = reverse('word-list')
+        response = self.client.get(url, {'fields': 'word,secret'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_reports_status_per_item(self):
+        url = reverse('word-batch')
+        data = [
+            {'word': 'Hund', 'translation': 'dog', 'language': 'de'},
+            {'word': 'Haus', 'translation': 'house', 'language': 'de'},
+            {'word': 'Hund', 'translation': 'dog', 'language': 'de'},
+            {'translation': 'no word', 'language': 'de'},
+        ]
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [item['status'] for item in response.data['results']],
+            ['created', 'duplicate', 'duplicate', 'invalid']
+        )
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.get_words_count('de'), 1)
+        self.assertTrue(self.profile.onboarded)
+
+    def test_batch_skips_words_added_concurrently(self):
+        bulk_create = Word.objects.bulk_create
+
+        def insert_first(words, **kwargs):
+            Word.objects.create(word='Hund', translation='dog', language=self.language, user=self.user)
+            return bulk_create(words, **kwargs)
+
+        url = reverse('word-batch')
+        data = [
+            {'word': 'Hund', 'translation': 'dog', 'language': 'de'},
+            {'word': 'Katze', 'translation': 'cat', 'language': 'de'},
+        ]
+        with patch.object(Word.objects, 'bulk_create', side_effect=insert_first):
+            response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([item['status'] for item in response.data['results']], ['duplicate', 'created'])
+        self.assertEqual(response.data['message'], 'Added 1 words successfully!')
+
+    def test_batch_rejects_non_object_items(self):
+        url = reverse('word-batch')
+        response = self.client.post(url, ['Hund', {'word': 'Katze', 'translation': 'cat', 'language': 'de'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sync_returns_changes_and_deletes(self):
+        url = reverse('word-sync')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['reset'])
+        self.assertEqual([word['word'] for word in response.data['changed']], ['Haus'])
+
+        from datetime import timedelta
+        from api.views.word import encode_sync_cursor
+        since = encode_sync_cursor(self.word.updated_at + timedelta(microseconds=1))
+        self.client.delete(reverse('word-detail', kwargs={'pk': self.word.pk}))
+        katze = Word.objects.create(word='Katze', translation='cat', language=self.language, user=self.user)
+
+        response = self.client.get(url, {'since': since})
+        self.assertFalse(response.data['reset'])
+        self.assertEqual([word['id'] for word in response.data['changed']], [katze.id])
+        self.assertEqual(response.data['deleted'], [self.word.pk])
+
+    def test_sync_rejects_invalid_cursor(self):
+        response = self.client.get(reverse('word-sync'), {'since': '???'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sync_rejects_naive_cursor(self):
+        from base64 import urlsafe_b64encode
+        since = urlsafe_b64encode(b'2026-01-01T00:00:00').decode('ascii')
+        response = self.client.get(reverse('word-sync'), {'since': since})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sync_reset_is_paged(self):
+        Word.objects.create(word='Katze', translation='cat', language=self.language, user=self.user)
+        response = self.client.get(reverse('word-sync'), {'page_size': 1})
+        self.assertTrue(response.data['reset'])
+        self.assertEqual([word['word'] for word in response.data['changed']], ['Haus'])
+        cursor = response.data['cursor']
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([word['word'] for word in response.data['changed']], ['Katze'])
+        self.assertEqual(response.data['cursor'], cursor)
+        self.assertIsNone(response.data['next'])
+
+    def test_list_words_not_modified(self):
+        url = reverse('word-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Authorization', response['Vary'])
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Word.objects.create(word='Katze', translation='cat', language=self.language, user=self.user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_words_ignores_if_modified_since(self):
+        url = reverse('word-list')
+        response = self.client.get(url)
+        self.assertNotIn('Last-Modified', response)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_staff_list_counts_every_user(self):
+        other = User.objects.create_user(username='otheruser', password='otherpassword')
+        Word.objects.create(word='Katze', translation='cat', language=self.language, user=other)
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.client.get(reverse('word-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Below ESTIMATED_COUNT_THRESHOLD the count is exact
+        self.assertEqual(response.data['count'], 2)
+        self.assertNotIn('ETag', response)
+
+        with override_settings(ESTIMATED_COUNT_THRESHOLD=0):
+            response = self.client.get(reverse('word-list'), {'word': 'Katze'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data['count'], int)
+
+    def test_export_words_csv(self):
+        url = reverse('word-export')
+        response = self.client.get(url, {'fields': 'word,translation'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual(content.splitlines(), ['word,translation', 'Haus,house'])
+
+    def test_export_words_jsonl(self):
+        url = reverse('word-export')
+        response = self.client.get(url, {'output': 'jsonl', 'fields': 'word'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual(content, '{"word": "Haus"}\n')
+
+    def test_anki_export_cached_per_vocabulary_version(self):
+        url = reverse('word-anki')
+        with tempfile.TemporaryDirectory() as export_dir, override_settings(ANKI_EXPORT_DIR=export_dir):
+            response = self.client.get(url, {'language': 'de'})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            package = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+            self.assertEqual(sorted(package.namelist()), ['collection.anki2', 'media'])
+            collection = os.path.join(export_dir, 'collection.anki2')
+            with open(collection, 'wb') as f:
+                f.write(package.read('collection.anki2'))
+            database = sqlite3.connect(collection)
+            fields = [row[0] for row in database.execute('SELECT flds FROM notes')]
+            database.close()
+            os.remove(collection)
+            self.assertEqual(len(fields), 1)
+            self.assertTrue(fields[0].startswith('Haus\x1fhouse'))
+
+            built = os.listdir(export_dir)
+            b''.join(self.client.get(url, {'language': 'de'}).streaming_content)
+            self.assertEqual(os.listdir(export_dir), built)
+
+            vocabulary_pages.bump(str(self.user.pk))
+            b''.join(self.client.get(url, {'language': 'de'}).streaming_content)
+            self.assertEqual(len(os.listdir(export_dir)), 1)
+            self.assertNotEqual(os.listdir(export_dir), built)
+
+    def test_anki_export_keeps_newer_decks(self):
+        url = reverse('word-anki')
+        version = vocabulary_pages.version(str(self.user.pk))
+        with tempfile.TemporaryDirectory() as export_dir, override_settings(ANKI_EXPORT_DIR=export_dir):
+            for other in (version - 1, version + 1):
+                open(os.path.join(export_dir, f"{self.user.pk}-de-{other}.apkg"), 'wb').close()
+            response = self.client.get(url, {'language': 'de'})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            b''.join(response.streaming_content)
+            self.assertEqual(
+                sorted(os.listdir(export_dir)),
+                sorted([f"{self.user.pk}-de-{version}.apkg", f"{self.user.pk}-de-{version + 1}.apkg"]),
+            )
+
+    def test_import_words_csv(self):
+        url = reverse('word-import-words')
+        upload = SimpleUploadedFile(
+            'words.csv',
+            'word,translation,gender\nHaus,house,das\nKatze,cat,die\nKatze,cat,die\nHund,dog,xyz\n'.encode('utf-8'),
+        )
+        response = self.client.post(url, {'file': upload, 'language': 'de'}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['inserted'], 1)
+        self.assertEqual(response.data['skipped'], 2)
+        self.assertEqual(response.data['invalid'], 1)
+        self.assertTrue(Word.objects.filter(user=self.user, word='Katze').exists())
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.get_words_count('de'), 1)
+
+    def test_import_words_json_array(self):
+        url = reverse('word-import-words')
+        upload = SimpleUploadedFile(
+            'words.json',
+            json.dumps([{'language': 'de', 'word': 'Maus', 'translation': 'mouse'}]).encode('utf-8'),
+        )
+        response = self.client.post(url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['inserted'], 1)
+        self.assertEqual(Word.objects.get(user=self.user, word='Maus').translation, 'mouse')
+
+    def test_import_words_validates_like_serializer(self):
+        url = reverse('word-import-words')
+        upload = SimpleUploadedFile(
+            'words.csv',
+            (
+                'word,translation,image_url\n'
+                'Maus,mouse,https://example.com/maus.png\n'
+                'Katze,,\n'
+                'Hund,dog,not a url\n'
+            ).encode('utf-8'),
+        )
+        response = self.client.post(url, {'file': upload, 'language': 'de'}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((response.data['inserted'], response.data['invalid']), (1, 2))
+
+    def test_import_words_reads_japanese_words(self):
+        Language.objects.create(code='jp', name='Japanese')
+        analysis = {'reading_kana': 'ねこ', 'reading_romaji': 'neko', 'tokens': {'word': [], 'example_sentence': []}}
+        url = reverse('word-import-words')
+        upload = SimpleUploadedFile('words.jsonl', b'{"word": "\\u732b", "translation": "cat"}\n')
+        with patch('api.models.analyze_japanese', return_value=analysis):
+            response = self.client.post(url, {'file': upload, 'language': 'jp'}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        word = Word.objects.get(user=self.user, word='猫')
+        self.assertEqual((word.reading_kana, word.reading_romaji, word.tokens), ('ねこ', 'neko', analysis['tokens']))
+
+    def test_import_words_twice_in_one_transaction(self):
+        with transaction.atomic():
+            for word in ('Maus', 'Katze'):
+                stream = io.StringIO(json.dumps({'word': word, 'translation': word}) + '\n')
+                result = WordImporter(self.user, default_language='de').run(stream, 'jsonl')
+                self.assertEqual(result['inserted'], 1)
+
+    def test_word_reads_blank_fields_from_lexeme(self):
+        lexeme = Lexeme.objects.create(
+            language=self.language, normalized_word='haus', word='Haus',
+            translation='house', example_sentence='Das Haus ist groß.'
+        )
+        Word.objects.filter(pk=self.word.pk).update(lexeme=lexeme, translation=None, example_sentence=None)
+
+        response = self.client.get(reverse('word-detail', kwargs={'pk': self.word.pk}))
+        self.assertEqual(response.data['translation'], 'house')
+        self.assertEqual(response.data['example_sentence'], 'Das Haus ist groß.')
+
+        response = self.client.get(reverse('word-list'), {'fields': 'word,translation'})
+        self.assertEqual(response.data['results'], [{'word': 'Haus', 'translation': 'house'}])
+
+        response = self.client.get(reverse('word-list'), {'translation': 'house'})
+        self.assertEqual(response.data['count'], 1)
+
+    def test_lexeme_edit_refreshes_inherited_search_keys(self):
+        lexeme = Lexeme.objects.create(
+            language=self.language, normalized_word='haus', word='Haus', translation='house'
+        )
+        Word.objects.filter(pk=self.word.pk).update(lexeme=lexeme, translation=None)
+        lexeme.translation = 'Building'
+        lexeme.save()
+        self.assertEqual(Word.objects.get(pk=self.word.pk).translation_normalized, 'building')
+
+        response = self.client.get(reverse('word-list'), {'translation': 'building'})
+        self.assertEqual(response.data['count'], 1)
+
+    def test_word_keeps_own_blank_fields_when_linked(self):
+        lexeme = Lexeme.objects.create(
+            language=self.language, normalized_word='haus', word='Haus',
+            translation='house', example_sentence='Das Haus ist groß.'
+        )
+        Word.objects.filter(pk=self.word.pk).update(lexeme=lexeme, translation=None, example_sentence='')
+
+        response = self.client.get(reverse('word-detail', kwargs={'pk': self.word.pk}))
+        self.assertEqual(response.data['translation'], 'house')
+        self.assertEqual(response.data['example_sentence'], '')
+
+        response = self.client.get(reverse('word-list'), {'fields': 'word,example_sentence'})
+        self.assertEqual(response.data['results'], [{'word': 'Haus', 'example_sentence': ''}])
+
+    def test_renaming_word_detaches_lexeme(self):
+        lexeme = Lexeme.objects.create(
+            language=self.language, normalized_word='haus', word='Haus',
+            translation='house', example_sentence='Das Haus ist groß.'
+        )
+        Word.objects.filter(pk=self.word.pk).update(lexeme=lexeme, example_sentence=None)
+
+        url = reverse('word-detail', kwargs={'pk': self.word.pk})
+        data = {
+            'word': 'Häuschen',
+            'translation': 'little house',
+            'language': self.language.id,
+            'user': self.user.id
+        }
+        response = self.client.put(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.word.refresh_from_db()
+        self.assertIsNone(self.word.lexeme_id)
+        self.assertEqual(self.word.example_sentence, 'Das Haus ist groß.')
+
+    def test_core_words_served_from_page_cache(self):
+        core_word = Word.objects.create(
+            word='Katze', translation='cat', language=self.language, user=self.user, core=True
+        )
+        url = reverse('word-list')
+        response = self.client.get(url, {'core': 'true', 'language': 'de'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['Katze'])
+        etag = response['ETag']
+
+        # Writes that bypass signals are not seen until the next version bump
+        Word.objects.filter(pk=core_word.pk).update(translation='kitty')
+        response = self.client.get(url, {'core': 'true', 'language': 'de'})
+        self.assertEqual(response.data['results'][0]['translation'], 'cat')
+        response = self.client.get(url, {'core': 'true', 'language': 'de'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        core_word.refresh_from_db()
+        core_word.core = False
+        core_word.save()
+        response = self.client.get(url, {'core': 'true', 'language': 'de'})
+        self.assertEqual(response.data['results'], [])
+
+    def test_core_page_cache_key_ignores_other_params(self):
+        Word.objects.create(word='Katze', translation='cat', language=self.language, user=self.user, core=True)
+        url = reverse('word-list')
+        params = {'core': 'true', 'language': 'de'}
+        etag = self.client.get(url, params)['ETag']
+        for extra in ({'junk': 'x'}, {'page': '01'}, {'page_size': '10'}):
+            self.assertEqual(self.client.get(url, {**params, **extra})['ETag'], etag)
+        self.assertEqual(
+            self.client.get(url, {**params, 'page_size': 500})['ETag'],
+            self.client.get(url, {**params, 'page_size': 100})['ETag'],
+        )
+        self.assertNotEqual(self.client.get(url, {**params, 'gender': 'die'})['ETag'], etag)
+
+    def test_featured_words_publicly_cacheable(self):
+        featured = Word.objects.create(
+            word='Katze', translation='cat', language=self.language, user=self.user, category='featured'
+        )
+        self.client.force_authenticate(user=None)
+        url = reverse('word-featured')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([word['word'] for word in response.data['results']], ['Katze'])
+        self.assertIn('public', response['Cache-Control'])
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        featured.category = 'animal'
+        featured.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+    def test_featured_words_ignore_other_query_params(self):
+        Word.objects.create(
+            word='Katze', translation='cat', language=self.language, user=self.user, category='featured'
+        )
+        self.client.force_authenticate(user=None)
+        url = reverse('word-featured')
+        etag = self.client.get(url, {'page_size': 5})['ETag']
+        for params in ({'page_size': 5, 'junk': 'x'}, {'page_size': 5, 'random': 'true'}, {'page_size': 5, 'cursor': 'abc'}):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(response.data['count'], 1)
+        self.assertNotEqual(self.client.get(url, {'page_size': 6})['ETag'], etag)
+
+    def test_facets_count_filtered_words(self):
+        Word.objects.create(
+            word='Katze', translation='cat', language=self.language, user=self.user,
+            category='animal', gender='die'
+        )
+        Word.objects.create(
+            word='Hund', translation='dog', language=self.language, user=self.user,
+            category='animal', gender='der'
+        )
+        url = reverse('word-facets')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total'], 3)
+        self.assertEqual(response.data['facets']['language'], [{'value': 'de', 'count': 3}])
+        self.assertEqual(response.data['facets']['category'][0], {'value': 'animal', 'count': 2})
+
+        response = self.client.get(url, {'gender': 'die'})
+        self.assertEqual(response.data['total'], 1)
+        self.assertEqual(response.data['facets']['category'], [{'value': 'animal', 'count': 1}])
+
+    def test_facets_refresh_after_vocabulary_change(self):
+        url = reverse('word-facets')
+        self.assertEqual(self.client.get(url).data['total'], 1)
+        Word.objects.create(word='Katze', translation='cat', language=self.language, user=self.user)
+        self.assertEqual(self.client.get(url).data['total'], 2)
+
+    def test_fuzzy_suggestions_tolerate_typos(self):
+        Word.objects.create(word='Mädchen', translation='girl', language=self.language, user=self.user)
+        url = reverse('word-suggestions')
+        response = self.client.get(url, {'query': 'Madchen', 'language': 'de'})
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(url, {'query': 'Madchen', 'language': 'de', 'fuzzy': 'true'})
+        self.assertEqual([word['word'] for word in response.data], ['Mädchen'])
+
+    def test_fuzzy_search_matches_words_and_translations(self):
+        Word.objects.create(word='Mädchen', translation='girl', language=self.language, user=self.user)
+        url = reverse('word-list')
+        response = self.client.get(url, {'search': 'Madchen', 'fuzzy': 'true', 'language': 'de'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['Mädchen'])
+
+        response = self.client.get(url, {'search': 'hous', 'fuzzy': 'true', 'language': 'de'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['Haus'])
+
+    def test_fuzzy_search_not_crowded_out_by_other_users(self):
+        other = User.objects.create_user(username='other', password='otherpass123')
+        Word.objects.bulk_create([
+            Word(word=f'Mant{letter}', word_normalized=f'mant{letter}', translation='-',
+                 language=self.language, user=other)
+            for letter in 'abcdefghijklmnopqrstuvwxyz'
+        ])
+        Word.objects.create(word='Mantelx', translation='coat', language=self.language, user=self.user)
+        url = reverse('word-list')
+        response = self.client.get(url, {'search': 'Mantx', 'fuzzy': 'true', 'language': 'de'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['Mantelx'])
+
+    def test_search_ignores_accents_and_sharp_s(self):
+        Word.objects.create(word='Straße', translation='street', language=self.language, user=self.user)
+        Word.objects.create(word='über', translation='over', language=self.language, user=self.user)
+        url = reverse('word-list')
+        response = self.client.get(url, {'search': 'strasse'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['Straße'])
+        response = self.client.get(url, {'word': 'uber'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['über'])
+
+    def test_suggestions_match_normalized_prefix(self):
+        Word.objects.create(word='Straße', translation='street', language=self.language, user=self.user)
+        response = self.client.get(reverse('word-suggestions'), {'query': 'strass', 'language': 'de'})
+        self.assertEqual([word['word'] for word in response.data], ['Straße'])
+
+    def test_bulk_delete_by_ids(self):
+        katze = Word.objects.create(word='Katze', translation='cat', language=self.language, user=self.user)
+        self.profile.words_count = {'de': 2}
+        self.profile.save()
+
+        response = self.client.post(reverse('word-bulk-delete'), {'ids': [self.word.pk, katze.pk]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['deleted'], 2)
+        self.assertFalse(Word.objects.filter(user=self.user).exists())
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.get_words_count('de'), 0)
+
+        response = self.client.get(reverse('word-sync'))
+        self.assertEqual(response.data['changed'], [])
+
+    def test_bulk_delete_signals_decoded_rows(self):
+        deleted = []
+
+        def receiver(sender, words, **kwargs):
+            deleted.extend(words)
+
+        words_bulk_deleted.connect(receiver, sender=Word)
+        self.addCleanup(words_bulk_deleted.disconnect, receiver, sender=Word)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('word-bulk-delete'), {'ids': [self.word.pk]}, format='json')
+        self.assertEqual([word.pk for word in deleted], [self.word.pk])
+        self.assertEqual(deleted[0].tokens, {})
+
+    def test_bulk_delete_requires_selection(self):
+        response = self.client.post(reverse('word-bulk-delete'), {'filter': {}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Word.objects.filter(pk=self.word.pk).exists())
+
+    def test_bulk_delete_rejects_empty_filter_values(self):
+        response = self.client.post(reverse('word-bulk-delete'), {'filter': {'category': ''}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Word.objects.filter(pk=self.word.pk).exists())
+
+    def test_bulk_delete_rejects_unknown_filters(self):
+        response = self.client.post(reverse('word-bulk-delete'), {'filter': {'bogus': 'x'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Word.objects.filter(pk=self.word.pk).exists())
+
+    def test_bulk_update_by_filter(self):
+        other_user = User.objects.create_user(username='other', password='testpass123')
+        other_word = Word.objects.create(word='Haus', translation='house', language=self.language, user=other_user)
+        data = {'filter': {'word': 'Haus'}, 'changes': {'difficulty_level': 'hard', 'category': 'home'}}
+        response = self.client.post(reverse('word-bulk-update'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 1)
+        self.word.refresh_from_db()
+        self.assertEqual((self.word.difficulty_level, self.word.category), ('hard', 'home'))
+        other_word.refresh_from_db()
+        self.assertEqual(other_word.category, '')
+
+    def test_bulk_update_rejects_invalid_changes(self):
+        data = {'ids': [self.word.pk], 'changes': {'difficulty_level': 'impossible'}}
+        response = self.client.post(reverse('word-bulk-update'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch('api.views.word.client')
+    def test_generate_words_from_translation_memory(self, mock_client):
+        Lexeme.objects.bulk_create([
+            Lexeme(language=self.language, normalized_word=word.lower(), word=word, translation=translation,
+                   category='animals', difficulty_level='easy')
+            for word, translation in [
+                ('Hund', 'dog'), ('Katze', 'cat'), ('Maus', 'mouse'), ('Pferd', 'horse'),
+                ('Vogel', 'bird'), ('Fisch', 'fish'),
+            ]
+        ])
+        data = {'categories': ['animals'], 'proficiency': 'easy', 'language': 'de'}
+        response = self.client.post(reverse('generate-words'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['from_memory'], 5)
+        mock_client.chat.completions.create.assert_not_called()
+        self.assertEqual(Word.objects.filter(user=self.user, category='animals').count(), 5)
+
+    @patch('api.views.word.client')
+    def test_generate_words_remembers_only_valid_items(self, mock_client):
+        items = [
+            {'word': word, 'translation': translation, 'category': 'actions', 'difficulty_level': 'easy',
+             'gender': 'n/a', 'part_of_speech': 'verb', 'language': 'de'}
+            for word, translation in [('laufen', 'to run'), ('essen', 'to eat'), ('schlafen', 'to sleep')]
+        ]
+        items.append({**items[0], 'word': 'gehen', 'translation': 'to go', 'gender': 'xyz'})
+        items.append('trinken')
+        mock_client.chat.completions.create.return_value.choices[0].message.content = json.dumps(items)
+
+        data = {'categories': ['actions'], 'proficiency': 'easy', 'language': 'de'}
+        response = self.client.post(reverse('generate-words'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            sorted(Lexeme.objects.values_list('word', flat=True)), ['essen', 'laufen', 'schlafen']
+        )
+
+    def test_create_german_noun_uses_lexicon(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'nouns.lex')
+            GermanLexicon.write(path, [('Katze', ['die'], ['Katzen'])])
+            with override_settings(GERMAN_LEXICON_PATH=path):
+                url = reverse('word-list')
+                data = {'word': 'Katze', 'translation': 'cat', 'language': 'de', 'user': self.user.id}
+                response = self.client.post(url, {**data, 'gender': 'der'}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('gender', response.data)
+
+                response = self.client.post(url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                self.assertEqual(
+                    (response.data['gender'], response.data['plural_form'], response.data['part_of_speech']),
+                    ('die', 'Katzen', 'noun'),
+                )
+
+    def test_german_plural_check_ignores_case(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'nouns.lex')
+            GermanLexicon.write(path, [('Hund', ['der'], ['Hunde'])])
+            with override_settings(GERMAN_LEXICON_PATH=path):
+                url = reverse('word-list')
+                data = {'word': 'Hund', 'translation': 'dog', 'language': 'de', 'user': self.user.id}
+                response = self.client.post(url, {**data, 'plural_form': 'hunde'}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
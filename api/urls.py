@@ -8,6 +8,7 @@ from .views.user import UserRegisterView, CustomAuthToken, ListUsers, GetUserDat
 from .views.feedback import FeedbackView
 from .views.google_auth import google_auth
 from .views.reading import ReadingContentViewSet
+from .views.starter_pack import StarterPackViewSet
 
 
 router = DefaultRouter()
@@ -15,6 +16,7 @@ router.register(r'words', WordViewSet, basename='word')
 router.register(r'languages', LanguageViewSet, basename='language')
 router.register(r'exercises', ExerciseViewSet, basename='exercise')
 router.register(r'readings', ReadingContentViewSet, basename='reading')
+router.register(r'starter-packs', StarterPackViewSet, basename='starter-pack')
 
 urlpatterns = [
     path('api/', include(router.urls)),  
@@ -0,0 +1,90 @@
+import unicodedata
+
+# Katakana letters that have a hiragana counterpart 0x60 code points lower
+KATAKANA_START, KATAKANA_END = 0x30A1, 0x30F6
+KANA_OFFSET = 0x60
+
+
+def _is_latin_diacritic(char):
+    # Only the general combining diacritics: the kana voicing marks
+    # (U+3099, U+309A) are part of the word and must stay
+    return 0x0300 <= ord(char) <= 0x036F
+
+
+def normalize_text(text):
+    """
+    Search key for word and translation columns: NFKC, casefolded (ß -> ss),
+    accents and umlauts stripped (ü -> u) and katakana turned into hiragana,
+    so "Straße"/"strasse", "über"/"uber" and カタカナ/かたかな compare equal.
+    """
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = ''.join(
+        char for char in unicodedata.normalize('NFD', text)
+        if not _is_latin_diacritic(char)
+    )
+    return to_hiragana(unicodedata.normalize('NFC', text))
+
+
+def to_hiragana(text):
+    return ''.join(
+        chr(ord(char) - KANA_OFFSET) if KATAKANA_START <= ord(char) <= KATAKANA_END else char
+        for char in text
+    )
+
+
+# Hepburn romanization of single hiragana; small kana combine with the
+# syllable before them (き + ゃ -> kya, ふ + ぁ -> fa)
+HIRAGANA_ROMAJI = dict(zip(
+    'あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわゐゑをん'
+    'がぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽゔぁぃぅぇぉゃゅょゎ',
+    'a i u e o ka ki ku ke ko sa shi su se so ta chi tsu te to na ni nu ne no ha hi fu he ho '
+    'ma mi mu me mo ya yu yo ra ri ru re ro wa i e o n ga gi gu ge go za ji zu ze zo da ji zu de do '
+    'ba bi bu be bo pa pi pu pe po vu a i u e o ya yu yo wa'.split(),
+))
+SMALL_KANA = set('ぁぃぅぇぉゃゅょゎ')
+VOWELS = set('aiueo')
+SOKUON = 'っ'
+LONG_VOWEL_MARK = 'ー'
+
+
+def to_romaji(text):
+    """
+    Hepburn romaji of a kana string: っ doubles the next consonant, ー
+    repeats the previous vowel and ん before a vowel or y is written n'.
+    Anything that is not kana is kept as it is.
+    """
+    syllables = []
+    for char in to_hiragana(text):
+        romaji = HIRAGANA_ROMAJI.get(char)
+        previous = syllables[-1] if syllables else ''
+        if char in SMALL_KANA and len(previous) > 1 and previous[-1] in VOWELS:
+            stem = previous[:-1]
+            if romaji[0] == 'y' and previous[-1] == 'i':
+                # しゃ -> sha, ちゃ -> cha, じゃ -> ja, きゃ -> kya
+                syllables[-1] = (stem if stem in ('sh', 'ch', 'j') else stem + 'y') + romaji[1:]
+                continue
+            if romaji in VOWELS:
+                syllables[-1] = stem + romaji
+                continue
+        if char == LONG_VOWEL_MARK and previous and previous[-1] in VOWELS:
+            syllables.append(previous[-1])
+        elif char == SOKUON:
+            syllables.append(SOKUON)
+        else:
+            syllables.append(romaji if romaji is not None else char)
+
+    result = []
+    for index, syllable in enumerate(syllables):
+        following = syllables[index + 1] if index + 1 < len(syllables) else ''
+        if syllable == SOKUON:
+            if following.startswith('ch'):
+                result.append('t')
+            elif following[:1].isascii() and following[:1].isalpha() and following[0] not in VOWELS:
+                result.append(following[0])
+        elif syllable == 'n' and following[:1] and (following[0] in VOWELS or following[0] == 'y'):
+            result.append("n'")
+        else:
+            result.append(syllable)
+    return ''.join(result)
@@ -30,19 +30,22 @@ class ExerciseViewSet(viewsets.ModelViewSet):
         if request.user.is_staff:
             words = Word.objects.filter(
                 language__code=language_code
-            ).values('word', 'translation').order_by('?')[:count]
+            ).values('word', 'translation', 'lexeme__translation').order_by('?')[:count]
         else:
             words = Word.objects.filter(
                 user=request.user,
                 language__code=language_code
-            ).values('word', 'translation').order_by('?')[:count]
+            ).values('word', 'translation', 'lexeme__translation').order_by('?')[:count]
 
         if not words:
             return Response({})
 
         # Generate exercise
         exercise_generator = MatchingExerciseGenerator()
-        exercise = exercise_generator.generate(list(words))
+        exercise = exercise_generator.generate([
+            {'word': word['word'], 'translation': word['lexeme__translation'] if word['translation'] is None else word['translation']}
+            for word in words
+        ])
 
         return Response(exercise)
 
@@ -0,0 +1,128 @@
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag, urlencode
+from rest_framework.response import Response
+from api.serializers.rows import RowEncoder
+
+
+def split_param(value):
+    return [name.strip() for name in value.split(',') if name.strip()] if value else None
+
+
+class SparseFieldsListMixin:
+    """
+    List action that selects only the needed columns with ``values()`` and
+    renders rows through a RowEncoder instead of the ModelSerializer.
+
+    Clients can narrow the output with ``?fields=word,translation`` or
+    ``?exclude=example_sentence``; the SQL projection shrinks with it.
+    """
+    # Columns the paginator needs even when the client did not ask for them
+    pagination_columns = ('id',)
+
+    def get_row_encoder(self):
+        params = self.request.query_params
+        return RowEncoder(
+            self.get_serializer_class(),
+            fields=split_param(params.get('fields')),
+            exclude=split_param(params.get('exclude')),
+        )
+
+    def list(self, request, *args, **kwargs):
+        encoder = self.get_row_encoder()
+        columns = dict.fromkeys(encoder.columns + self.pagination_columns)
+        queryset = self.filter_queryset(self.get_queryset()).values(*columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(encoder.encode_many(page))
+        return Response(encoder.encode_many(queryset))
+
+
+class ConditionalListMixin:
+    """
+    List action that answers 304 Not Modified, before fetching or rendering
+    any rows, when the client's If-None-Match still matches.
+
+    The version of a list is COUNT(*) and MAX(updated_at) over the filtered
+    queryset: an insert or edit moves the maximum and a delete moves the
+    count. The ETag also covers the user, the query string and the renderer.
+    No Last-Modified is sent: MAX(updated_at) alone misses deletes and edits
+    within the same second, so If-Modified-Since could not be trusted.
+    """
+    version_field = 'updated_at'
+
+    def is_list_cacheable(self, request):
+        return not request.query_params.get('random')
+
+    def get_list_version(self, queryset):
+        return queryset.order_by().aggregate(
+            count=Count('pk'),
+            last_modified=Max(self.version_field),
+        )
+
+    def get_list_etag(self, request, version):
+        last_modified = version['last_modified']
+        parts = [
+            str(request.user.pk),
+            request.get_full_path(),
+            request.accepted_renderer.format,
+            str(version['count']),
+            last_modified.isoformat() if last_modified else '',
+        ]
+        return quote_etag(hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest())
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_list_cacheable(request):
+            return super().list(request, *args, **kwargs)
+
+        version = self.get_list_version(self.filter_queryset(self.get_queryset()))
+        etag = self.get_list_etag(request, version)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+
+        response['ETag'] = etag
+        # Per-user data: browsers may keep it but must revalidate, shared caches may not
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+
+class CachedPageMixin:
+    """
+    Serve a rendered page from a VersionedPageCache, building it with
+    ``render()`` (which returns a Response) only on a miss. The ETag comes
+    from the cache version, so a revalidation costs no query either.
+
+    Pages are keyed by the full URL, or with ``params`` by only those query
+    parameters, which bounds the entries callers can create by varying the
+    query string.
+    """
+
+    def cached_page_response(self, request, pages, render, scope=None, params=None, **cache_control):
+        if params is None:
+            url = request.build_absolute_uri()
+        else:
+            url = f"{request.build_absolute_uri(request.path)}?{urlencode(self.cache_key_params(request, params))}"
+        key = f"{url}|{request.accepted_renderer.format}"
+        version = pages.version(scope)
+        etag = pages.etag(version, key, scope)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = pages.get(version, key, scope)
+            if data is None:
+                data = render().data
+                pages.set(version, key, data, scope)
+            response = Response(data)
+
+        response['ETag'] = etag
+        patch_cache_control(response, **(cache_control or {'private': True, 'no_cache': True}))
+        return response
+
+    def cache_key_params(self, request, params):
+        """The (name, value) pairs of the ``params`` query parameters, in a stable order."""
+        return sorted((name, value) for name in params for value in request.query_params.getlist(name))
@@ -10,6 +10,7 @@ from django.db.models import Count
 from ..services.content_generator import ContentGenerator
 from ..filters import ReadingContentFilter
 from rest_framework.pagination import PageNumberPagination
+from .mixins import ConditionalListMixin, SparseFieldsListMixin
 from openai import OpenAI
 import os
 import json
@@ -19,7 +20,7 @@ class ReadingPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
 
-class ReadingContentViewSet(viewsets.ModelViewSet):
+class ReadingContentViewSet(ConditionalListMixin, SparseFieldsListMixin, viewsets.ModelViewSet):
     queryset = ReadingContent.objects.all()
     serializer_class = ReadingContentSerializer
     permission_classes = [permissions.IsAuthenticated]
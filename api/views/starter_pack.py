@@ -0,0 +1,49 @@
+from . import (
+    viewsets, authentication, status,
+    IsAuthenticated, Response, action,
+)
+from django.db.models import Count
+from api.models import StarterPack
+from api.serializers.starter_pack import StarterPackSerializer, StarterPackWordSerializer
+from api.services.starter_packs import StarterPackCloner
+
+
+class StarterPackViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Curated starter packs, optionally filtered with ?language=<code>.
+    POST clone/ copies a pack into the user's vocabulary.
+    """
+    authentication_classes = [authentication.TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    serializer_class = StarterPackSerializer
+    lookup_field = 'slug'
+
+    def get_queryset(self):
+        packs = StarterPack.objects.select_related('language').annotate(words_count=Count('words'))
+        language_code = self.request.query_params.get('language')
+        if language_code:
+            packs = packs.filter(language__code=language_code)
+        return packs
+
+    @action(detail=True, methods=['get'])
+    def words(self, request, slug=None):
+        pack = self.get_object()
+        return Response(StarterPackWordSerializer(pack.words.all(), many=True).data)
+
+    @action(detail=True, methods=['post'])
+    def clone(self, request, slug=None):
+        """
+        Add the pack's words the user does not have yet, within the user's
+        word quota, in one statement. Answers 403 when the quota leaves room
+        for none of them.
+        """
+        result = StarterPackCloner(request.user).clone(self.get_object())
+        if not result['inserted'] and result['limit_reached']:
+            return Response({
+                "error": f"Word limit reached for {result['language']}. Maximum {result['max_words']} words allowed per language with your current plan.",
+                **result,
+            }, status=status.HTTP_403_FORBIDDEN)
+        return Response({
+            "message": f"Added {result['inserted']} words successfully!",
+            **result,
+        }, status=status.HTTP_201_CREATED)
@@ -1,22 +1,72 @@
 from . import (
     viewsets, authentication, status, filters, 
     IsAuthenticated, AllowAny, Response, action,
-    PageNumberPagination, DjangoFilterBackend,
+    DjangoFilterBackend,
     IntegrityError, ConflictError,
-    Word, WordSerializer, Language,
+    Word, WordSerializer, Language, UserProfile,
     ValidationError, APIView
 )
-from api.filters import WordFilter
+from api.models import WordTombstone
+from api.serializers.word import WordBatchSerializer, WordBulkUpdateSerializer
+from api.signals import words_bulk_created
+from django.conf import settings
+from rest_framework.settings import api_settings
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import FileResponse, StreamingHttpResponse
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import timedelta
+import csv
+import io
+from functools import partial
+from itertools import chain
+from api.filters import WordFilter, WordSearchFilter, word_facet_counts
+from api.pagination import (
+    WordPagination, WordCursorPagination, RandomWordPagination, StaffWordPagination, SyncResetPagination,
+)
+from api.services.anki_export import AnkiDeckExporter
+from api.services.page_cache import core_word_pages, featured_word_pages, vocabulary_pages
+from api.services.translation_memory import TranslationMemory
+from api.services.word_bulk import WordBulkEditor
+from api.services.word_import import FILE_FORMATS, WordImporter
+from api.services.word_index import word_suggestion_index
+from api.views.mixins import CachedPageMixin, ConditionalListMixin, SparseFieldsListMixin
 import os
 import json
 from openai import OpenAI
 
-class WordPagination(PageNumberPagination):
-    page_size = 10  
-    page_size_query_param = 'page_size' 
-    max_page_size = 100 
 
-class WordViewSet(viewsets.ModelViewSet):
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+
+class Echo:
+    """Pseudo-buffer whose write() hands back the line csv.writer produced"""
+    def write(self, value):
+        return value
+
+
+def encode_sync_cursor(moment):
+    return urlsafe_b64encode(moment.isoformat().encode('utf-8')).decode('ascii')
+
+
+def decode_sync_cursor(cursor):
+    try:
+        moment = parse_datetime(urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError):
+        moment = None
+    # encode_sync_cursor() always writes an offset; a naive time cannot be compared
+    if moment is None or timezone.is_naive(moment):
+        raise ValidationError({"since": "Invalid sync cursor"})
+    return moment
+
+
+class WordViewSet(CachedPageMixin, ConditionalListMixin, SparseFieldsListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing words.
     Requires token authentication.
@@ -25,15 +75,43 @@ class WordViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = WordSerializer
     pagination_class = WordPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    # WordSearchFilter runs last so its rank ordering wins over the default ordering
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, WordSearchFilter]
     filterset_class = WordFilter
-    search_fields = ['word', 'translation', 'example_sentence']
     ordering_fields = ['added_at', 'updated_at', 'word']
     ordering = ['-added_at']  # default ordering
+    pagination_columns = ('id', 'added_at')
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # Single-word responses carry the opt-in fields too
+        context['detail'] = bool(getattr(self, 'detail', False))
+        return context
+
+    @property
+    def paginator(self):
+        """
+        Page-number pagination by default; keyset pagination for clients that
+        opt in with ?pagination=cursor (or are following a cursor link), and
+        a cached shuffle for ?random=true. Staff lists span the whole table
+        and report an estimated count.
+        """
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            if params.get('random'):
+                self._paginator = RandomWordPagination()
+            elif params.get('pagination') == 'cursor' or params.get('cursor'):
+                self._paginator = WordCursorPagination()
+            elif self.request.user.is_staff:
+                self._paginator = StaffWordPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_queryset(self):
         """
-        Optimize queryset with select_related for language and user
+        Words visible to the user. Language and user render as ids, so no
+        joins are needed beyond what the filters add.
         """
         core = self.request.query_params.get('core')
         filters = {} if (self.request.user.is_staff or core == 'true') else {"user": self.request.user}
@@ -45,13 +123,60 @@ class WordViewSet(viewsets.ModelViewSet):
         if core:
             filters["core"] = core.lower() == 'true'
 
-        if self.request.query_params.get('random'):
-            paginator = WordPagination()
-            paginator.page_size = 100
-            self.pagination_class = paginator.__class__
-            return Word.objects.select_related('language', 'user').filter(**filters).order_by('?')
-        
-        return Word.objects.select_related('language', 'user').filter(**filters)
+        return Word.objects.filter(**filters)
+
+    def is_core_catalog_request(self, request):
+        """?core=true lists show every user's core words, the same for everyone"""
+        params = request.query_params
+        return params.get('core') == 'true' and not params.get('random')
+
+    def is_list_cacheable(self, request):
+        # Core catalog pages are versioned by core_word_pages instead, see list().
+        # Staff lists span every user, where the COUNT/MAX version is a full scan.
+        return (
+            super().is_list_cacheable(request)
+            and not self.is_core_catalog_request(request)
+            and not request.user.is_staff
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        Core catalog pages come from core_word_pages without touching the
+        database; they are rebuilt after a core word of the language changes.
+        """
+        if not self.is_core_catalog_request(request):
+            return super().list(request, *args, **kwargs)
+
+        return self.cached_page_response(
+            request,
+            core_word_pages,
+            partial(super().list, request, *args, **kwargs),
+            scope=request.query_params.get('language'),
+            params=self.core_page_params(),
+        )
+
+    def core_page_params(self):
+        """Query parameters that shape a core catalog page; the rest are left out of its cache key."""
+        return (
+            'core', 'language', 'fuzzy', 'fields', 'exclude', 'pagination',
+            api_settings.SEARCH_PARAM, api_settings.ORDERING_PARAM,
+            WordPagination.page_query_param, WordPagination.page_size_query_param,
+            WordCursorPagination.cursor_query_param,
+            *WordFilter.base_filters,
+        )
+
+    def cache_key_params(self, request, params):
+        # Page numbers and sizes as the paginators read them, so '01' or a
+        # page_size past the maximum does not get a cache entry of its own
+        pagination = WordPagination()
+        paging = {pagination.page_query_param, pagination.page_size_query_param}
+        pairs = [pair for pair in super().cache_key_params(request, params) if pair[0] not in paging]
+        page = request.query_params.get(pagination.page_query_param, '1')
+        if pagination.page_query_param in params:
+            pairs.append((pagination.page_query_param, str(int(page)) if page.isdigit() else page))
+        if pagination.page_size_query_param in params:
+            pairs.append((pagination.page_size_query_param, str(pagination.get_page_size(request))))
+        return sorted(pairs)
 
     def create(self, request, *args, **kwargs):
         data = request.data.copy()
@@ -84,57 +209,326 @@ class WordViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
     def featured(self, request):
-        featured_words = Word.objects.select_related('language', 'user').filter(category='featured')
-        page = self.paginate_queryset(featured_words)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(featured_words, many=True)
-        return Response(serializer.data)
+        """
+        Featured words are the same for every caller: pages are cached per
+        page and page size in featured_word_pages and may be cached publicly
+        by proxies for FEATURED_WORDS_MAX_AGE seconds. Other query parameters
+        are ignored.
+        """
+        return self.cached_page_response(
+            request,
+            featured_word_pages,
+            self._render_featured,
+            params=(WordPagination.page_query_param, WordPagination.page_size_query_param),
+            public=True,
+            max_age=settings.FEATURED_WORDS_MAX_AGE,
+        )
+
+    def _render_featured(self):
+        featured_words = Word.objects.select_related('lexeme').filter(category='featured')
+        # Always plain pages, whatever ?random or ?cursor the list honours
+        paginator = WordPagination()
+        page = paginator.paginate_queryset(featured_words, self.request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
     def batch(self, request):
+        """
+        Add a list of words in one transaction: items are validated in
+        memory, duplicates are found with one query, new words are inserted
+        with a single bulk INSERT and the quota counter is written once.
+        Every item gets a status: created, duplicate, invalid or limit_reached.
+        """
         user = request.user
         words_data = request.data
-        successful_words = []
 
         if not isinstance(words_data, list):
             raise ValidationError("Expected a list of words")
+        if not words_data:
+            return Response({"message": "Added 0 words successfully!", "results": []}, status=201)
+        if not all(isinstance(word_data, dict) for word_data in words_data):
+            raise ValidationError("Each word must be an object")
+
+        language = self._resolve_language(words_data[0].get('language'))
+
+        results = []
+        valid_items = []
+        for index, word_data in enumerate(words_data):
+            serializer = WordBatchSerializer(data=word_data, context={'language_code': language.code})
+            if serializer.is_valid():
+                valid_items.append((index, serializer.validated_data))
+                results.append(None)
+            else:
+                results.append({"index": index, "status": "invalid", "errors": serializer.errors})
 
-        language_code = words_data[0].get('language')
-        if language_code:
-            try:
-                language = Language.objects.get(code=language_code)
-                language_id = language.id
-            except Language.DoesNotExist:
-                raise ValidationError(f"Language with code '{language_code}' does not exist")
-
-        for word_data in words_data:
-            word_data['user'] = user.id
-            word_data['language'] = language_id
-            
-            # Check if word already exists
-            if not Word.objects.filter(
-                user=user,
-                language=language_id,
-                word=word_data['word']
-            ).exists():
-                serializer = WordSerializer(data=word_data, context={'request': request})
-                if serializer.is_valid():
-                    try:
-                        word = serializer.save()
-                        successful_words.append(word)
-                    except Exception as e:
-                        continue
-
-        if successful_words and hasattr(user, 'userprofile'):
-            user.userprofile.onboarded = True
-            user.userprofile.save()
+        with transaction.atomic():
+            # Serializes concurrent batches of the same user around the quota
+            profile, _ = UserProfile.objects.select_for_update().get_or_create(user=user)
+            existing = set(
+                Word.objects.filter(
+                    user=user,
+                    language=language,
+                    word__in=[data['word'] for _, data in valid_items],
+                ).values_list('word', flat=True)
+            )
+            max_words, _ = WordBatchSerializer().can_add_word(profile, language.code)
+            remaining = max_words - profile.get_words_count(language.code)
+
+            new_words = []
+            for index, data in valid_items:
+                if data['word'] in existing:
+                    results[index] = {"index": index, "word": data['word'], "status": "duplicate"}
+                elif remaining <= 0:
+                    results[index] = {"index": index, "word": data['word'], "status": "limit_reached"}
+                else:
+                    existing.add(data['word'])
+                    remaining -= 1
+                    word = Word(user=user, language=language, **data)
+                    # bulk_create() does not call save()
+                    word.refresh_normalized()
+                    word.refresh_readings()
+                    new_words.append((index, word))
+
+            # A concurrent request may insert the same words first. Those rows
+            # are skipped rather than failing the batch; ignore_conflicts
+            # leaves pks unset, so ids are drawn up front to find ours after.
+            if new_words:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                        [Word._meta.db_table, len(new_words)],
+                    )
+                    for (_, word), (pk,) in zip(new_words, cursor.fetchall()):
+                        word.id = pk
+                Word.objects.bulk_create([word for _, word in new_words], ignore_conflicts=True)
+            inserted = set(Word.objects.filter(id__in=[word.id for _, word in new_words]).values_list('id', flat=True))
+            created = [word for _, word in new_words if word.id in inserted]
+
+            if created:
+                profile.words_count[language.code] = profile.get_words_count(language.code) + len(created)
+                profile.onboarded = True
+                profile.save(update_fields=['words_count', 'onboarded'])
+                transaction.on_commit(lambda: words_bulk_created.send(sender=Word, words=created))
+
+        for index, word in new_words:
+            if word.id in inserted:
+                results[index] = {"index": index, "word": word.word, "status": "created", "id": word.id}
+            else:
+                results[index] = {"index": index, "word": word.word, "status": "duplicate"}
 
         return Response({
-            "message": f"Added {len(successful_words)} words successfully!"
+            "message": f"Added {len(created)} words successfully!",
+            "results": results,
         }, status=201)
 
+    def _resolve_language(self, value):
+        """Language from a code, or from an id as sent by older clients."""
+        if not value:
+            raise ValidationError("A language is required")
+        language = Language.objects.filter(code=value).first()
+        if language is None and str(value).isdigit():
+            language = Language.objects.filter(id=value).first()
+        if language is None:
+            raise ValidationError(f"Language with code '{value}' does not exist")
+        return language
+
+    @action(detail=False, methods=['post'])
+    def bulk_delete(self, request):
+        """
+        Delete the user's words picked by ``ids`` or by a ``filter`` of list
+        filter parameters, in one statement. Counters, sync tombstones and
+        caches are updated once for the whole set.
+        """
+        result = WordBulkEditor(request.user).delete(self._bulk_selection(request))
+        return Response({"message": f"Deleted {result['deleted']} words successfully!", **result})
+
+    @action(detail=False, methods=['post'])
+    def bulk_update(self, request):
+        """
+        Set ``changes`` (category, difficulty_level, part_of_speech, gender)
+        on the user's words picked by ``ids`` or ``filter``, in one statement.
+        """
+        serializer = WordBulkUpdateSerializer(data=request.data.get('changes') or {}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        if not serializer.validated_data:
+            raise ValidationError({"changes": "Nothing to change"})
+        result = WordBulkEditor(request.user).update(self._bulk_selection(request), serializer.validated_data)
+        return Response({"message": f"Updated {result['updated']} words successfully!", **result})
+
+    def _bulk_selection(self, request):
+        """The user's words named by ``ids``, or matching ``filter`` (WordFilter parameters)"""
+        words = Word.objects.filter(user=request.user)
+        ids = request.data.get('ids')
+        selection = request.data.get('filter')
+        if ids is not None:
+            if not isinstance(ids, list) or not all(str(pk).isdigit() for pk in ids):
+                raise ValidationError({"ids": "Expected a list of word ids"})
+            return words.filter(id__in=ids)
+        if not isinstance(selection, dict) or not selection:
+            # An empty filter would silently select the whole vocabulary
+            raise ValidationError("Pass either 'ids' or a non-empty 'filter'")
+        # WordFilter skips unknown keys and empty values, which would
+        # likewise widen the selection to every word
+        unknown = sorted(set(selection) - set(WordFilter.base_filters) - {'language'})
+        if unknown:
+            raise ValidationError({"filter": f"Unknown filters: {', '.join(unknown)}"})
+        if not any(str(value if value is not None else '').strip() for value in selection.values()):
+            raise ValidationError({"filter": "At least one filter needs a value"})
+
+        language_code = selection.get('language')
+        if language_code:
+            words = words.filter(language__code=language_code)
+        filterset = WordFilter(data=selection, queryset=words)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        return filterset.qs
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream the words matching the list filters as CSV, or as JSON lines
+        with ?output=jsonl. Rows are read from a server-side cursor in chunks
+        and written out as they arrive, so memory use does not grow with the
+        vocabulary. ?fields= and ?exclude= pick the columns.
+        """
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_CONTENT_TYPES:
+            raise ValidationError({"output": f"Expected one of: {', '.join(EXPORT_CONTENT_TYPES)}"})
+
+        encoder = self.get_row_encoder()
+        queryset = self.filter_queryset(self.get_queryset()).values(*encoder.columns)
+        rows = (encoder.encode(row) for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE))
+
+        if output == 'jsonl':
+            content = (
+                json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+                for row in rows
+            )
+        else:
+            writer = csv.writer(Echo())
+            header = (writer.writerow(encoder.fields),)
+            content = chain(header, (writer.writerow(row.values()) for row in rows))
+
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[output])
+        response['Content-Disposition'] = f'attachment; filename="words.{output}"'
+        return response
+
+    @action(detail=False, methods=['get'])
+    def anki(self, request):
+        """
+        Download the user's words, or those of ?language=, as an Anki deck
+        (.apkg). The deck is built once per vocabulary version and served
+        from disk until the user's words change.
+        """
+        language_code = request.query_params.get('language')
+        if language_code and not Language.objects.filter(code=language_code).exists():
+            raise ValidationError({"language": f"Language with code '{language_code}' does not exist"})
+
+        exporter = AnkiDeckExporter(request.user, language_code)
+        deck = exporter.get_or_build(vocabulary_pages.version(str(request.user.pk)))
+        return FileResponse(
+            deck,
+            as_attachment=True,
+            filename=f"words-{language_code or 'all'}.apkg",
+            content_type='application/apkg',
+        )
+
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_words(self, request):
+        """
+        Import a CSV, JSON lines or JSON array file uploaded as ``file``.
+        Rows are streamed into PostgreSQL with COPY and merged in one
+        statement; words the user already has, or past the quota, are
+        skipped. ``language`` is the default for rows without one.
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError({"file": "A vocabulary file is required"})
+        file_format = request.data.get('file_format') or os.path.splitext(upload.name)[1].lstrip('.').lower()
+        if file_format not in FILE_FORMATS:
+            raise ValidationError({"file_format": f"Expected one of: {', '.join(FILE_FORMATS)}"})
+
+        importer = WordImporter(request.user, default_language=request.data.get('language'))
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            result = importer.run(stream, file_format)
+        except (ValueError, csv.Error) as e:
+            raise ValidationError({"file": f"Could not read the file: {str(e)}"})
+
+        return Response({
+            "message": f"Imported {result['inserted']} words successfully!",
+            **result,
+        }, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        Word counts per language, category, difficulty_level, gender and
+        part_of_speech for the current list filters, from one GROUPING SETS
+        query. Answers over the user's own words are cached until the user's
+        vocabulary changes.
+        """
+        render = partial(self._render_facets, request)
+        if request.user.is_staff or request.query_params.get('core') == 'true':
+            # Spans other users' words, which do not bump this user's version
+            return render()
+        return self.cached_page_response(request, vocabulary_pages, render, scope=str(request.user.pk))
+
+    def _render_facets(self, request):
+        return Response(word_facet_counts(self.filter_queryset(self.get_queryset())))
+
+    @action(detail=False, methods=['get'])
+    def sync(self, request):
+        """
+        Delta sync for offline clients.
+
+        Returns the user's words changed since the ``since`` cursor and the
+        ids of words deleted since then, plus the ``cursor`` to send next
+        time. Without a cursor, or with one older than the tombstone
+        retention, every word is sent and ``reset`` is true: in keyset pages,
+        following ``next`` until it is null.
+        """
+        now = timezone.now()
+        since = request.query_params.get('since')
+        since = decode_sync_cursor(since) if since else None
+        reset = since is None or since < now - timedelta(days=settings.WORD_TOMBSTONE_RETENTION_DAYS)
+        snapshot = request.query_params.get(SyncResetPagination.snapshot_query_param)
+        if reset and snapshot:
+            # Later pages of a reset keep the cursor of the first one
+            cursor = decode_sync_cursor(snapshot)
+        else:
+            cursor = now - timedelta(seconds=settings.WORD_SYNC_OVERLAP_SECONDS)
+
+        words = Word.objects.filter(user=request.user, updated_at__lte=now)
+        tombstones = WordTombstone.objects.filter(user=request.user, deleted_at__lte=now)
+        language_code = request.query_params.get('language')
+        if language_code:
+            words = words.filter(language__code=language_code)
+            tombstones = tombstones.filter(language__code=language_code)
+
+        deleted = []
+        if not reset:
+            words = words.filter(updated_at__gt=since)
+            deleted = list(tombstones.filter(deleted_at__gt=since).values_list('word_id', flat=True))
+
+        encoder = self.get_row_encoder()
+        next_link = None
+        if reset:
+            paginator = SyncResetPagination(snapshot=encode_sync_cursor(cursor))
+            columns = dict.fromkeys(encoder.columns + self.pagination_columns)
+            changed = encoder.encode_many(paginator.paginate_queryset(words.values(*columns), request, self))
+            next_link = paginator.get_next_link()
+        else:
+            changed = encoder.encode_many(words.order_by('updated_at', 'id').values(*encoder.columns).iterator())
+        return Response({
+            "cursor": encode_sync_cursor(cursor),
+            "reset": reset,
+            "changed": changed,
+            "deleted": deleted,
+            "next": next_link,
+        })
+
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
     def suggestions(self, request):
         query = request.query_params.get('query', '').strip()
@@ -144,21 +538,16 @@ class WordViewSet(viewsets.ModelViewSet):
         if not query:
             return Response([])
 
-        queryset = Word.objects.select_related('language')
-        
-        if language_code:
-            queryset = queryset.filter(language__code=language_code)
-        
-        # Get full word objects instead of just the word field
-        suggestions = (
-            queryset.filter(word__istartswith=query)
-            .distinct()
-            [:limit]
-        )
-
-        # Serialize the word objects
-        serializer = self.get_serializer(suggestions, many=True)
-        return Response(serializer.data)
+        # Both modes are served from the in-process index, no query needed
+        results = word_suggestion_index.suggest(query, language_code, limit)
+        if request.query_params.get('fuzzy') == 'true' and len(results) < limit:
+            # Fill up with misspelling matches after the prefix matches
+            seen = {payload['id'] for payload in results}
+            results = results + [
+                payload for payload in word_suggestion_index.suggest_fuzzy(query, language_code, limit)
+                if payload['id'] not in seen
+            ][:limit - len(results)]
+        return Response(results)
     
     def update(self, request, *args, **kwargs):
         data = request.data.copy()
@@ -188,9 +577,15 @@ LANGUAGE_MAP = {"en": "English", "de": "German", "jp": "Japanese"}
 MODEL = "gpt-4-turbo"
 TEMPERATURE = 0.6
 MAX_TOKENS = 1500
+WORDS_PER_CATEGORY = 5
 
 
 class GenerateWordsView(APIView):
+    """
+    Add words for 1 to 3 categories to the user's vocabulary. Words the
+    translation memory already knows are used first; the model is only
+    asked for the shortfall, and what it returns is remembered.
+    """
     authentication_classes = [authentication.TokenAuthentication]
     permission_classes = [IsAuthenticated]
     def post(self, request):
@@ -207,77 +602,33 @@ class GenerateWordsView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            total_words = len(categories) * 5
-            language_chosen = LANGUAGE_MAP.get(language, "English")
-
-            # Build prompt
-            if len(categories) == 1:
-                distribution = "5 words"
-            elif len(categories) == 2:
-                distribution = "5 words per category (10 total)"
-            else:
-                distribution = "5 words per category (15 total)"
-
-            prompt = f"""
-            Generate exactly {total_words} {language_chosen} words in total, distributed as follows:
-            - {distribution} 
-            for each category: {', '.join(categories)}.
-
-            Return a clean JSON array with exactly {total_words} objects. Each object must follow this structure:
-            {{
-              "language": "{language}",
-              "word": "The {language_chosen} word",
-              "translation": "English translation",
-              "category": "category name",
-              "difficulty_level": "{proficiency}",
-              "gender": "der/die/das or n/a for non-nouns or English words",
-              "example_sentence": "{language_chosen} example sentence",
-              "plural_form": "plural form if any",
-              "part_of_speech": "noun/verb/adjective/adverb/preposition"
-            }}
-            """
-
-            response = client.chat.completions.create(
-                model=MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"Respond with a valid JSON array only—exactly {total_words} items, no extra text.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=TEMPERATURE,
-                max_tokens=MAX_TOKENS,
-            )
-
-            content = response.choices[0].message.content.strip() if response.choices else None
-            if not content:
-                raise ValueError("No content received from OpenAI.")
-
-            # Try to parse OpenAI response
             try:
-                generated_words = json.loads(content)
-                if not isinstance(generated_words, list) or len(generated_words) != total_words:
-                    raise ValueError(
-                        f"Expected {total_words} items but received {len(generated_words)}"
-                    )
-            except json.JSONDecodeError as e:
-                print("Parse error:", e, "\nContent:", content)
-                raise ValueError("Failed to parse generated words")
-            
-            successful_words = []
-            language_code = generated_words[0].get("language")
-
-            try:
-                language_obj = Language.objects.get(code=language_code)
+                language_obj = Language.objects.get(code=language)
                 language_id = language_obj.id
             except Language.DoesNotExist:
-                raise ValidationError(f"Language with code '{language_code}' does not exist")
+                raise ValidationError(f"Language with code '{language}' does not exist")
 
             user = request.user
-            for word_data in generated_words:
-                word_data["user"] = user.id
-                word_data["language"] = language_id
+            memory = TranslationMemory(language_obj)
+            remembered_words = []
+            missing = {}
+            for category in categories:
+                known = memory.for_category(category, proficiency, user, WORDS_PER_CATEGORY)
+                remembered_words += known
+                if len(known) < WORDS_PER_CATEGORY:
+                    missing[category] = WORDS_PER_CATEGORY - len(known)
+
+            generated_words = []
+            if missing:
+                generated_words = self.validated(self.generate(
+                    missing, language, proficiency, exclude=[word["word"] for word in remembered_words]
+                ), language)
+                # Only words that validate are shared with other users
+                memory.remember(generated_words)
+
+            successful_words = []
+            for word_data in remembered_words + generated_words:
+                word_data = {**word_data, "user": user.id, "language": language_id}
 
                 if not Word.objects.filter(
                     user=user,
@@ -300,15 +651,84 @@ class GenerateWordsView(APIView):
             return Response(
                 {
                     "message": f"Generated and added {len(successful_words)} words successfully!",
-                    "data": generated_words,
+                    "data": remembered_words + generated_words,
+                    "from_memory": len(remembered_words),
                 },
                 status=status.HTTP_201_CREATED,
             )
 
-            return Response(generated_words, status=status.HTTP_200_OK)
-
         except Exception as e:
             print("Error:", str(e))
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    def validated(self, items, language):
+        """The generated items that are valid words of the language, as validated data"""
+        words = []
+        for item in items:
+            if not isinstance(item, dict) or item.get("language") not in (None, "", language):
+                continue
+            serializer = WordBatchSerializer(data=item, context={"language_code": language})
+            if serializer.is_valid():
+                words.append({**serializer.validated_data, "language": language})
+        return words
+
+    def generate(self, missing, language, proficiency, exclude):
+        """Ask the model for ``missing[category]`` new words per category."""
+        total_words = sum(missing.values())
+        language_chosen = LANGUAGE_MAP.get(language, "English")
+
+        # Build prompt
+        distribution = "\n".join(
+            f"            - {count} words for the category {category}" for category, count in missing.items()
+        )
+        exclusion = f"Do not include any of these words: {', '.join(exclude)}." if exclude else ""
+
+        prompt = f"""
+            Generate exactly {total_words} {language_chosen} words in total, distributed as follows:
+{distribution}
+            {exclusion}
+
+            Return a clean JSON array with exactly {total_words} objects. Each object must follow this structure:
+            {{
+              "language": "{language}",
+              "word": "The {language_chosen} word",
+              "translation": "English translation",
+              "category": "category name",
+              "difficulty_level": "{proficiency}",
+              "gender": "der/die/das or n/a for non-nouns or English words",
+              "example_sentence": "{language_chosen} example sentence",
+              "plural_form": "plural form if any",
+              "part_of_speech": "noun/verb/adjective/adverb/preposition"
+            }}
+            """
+
+        response = client.chat.completions.create(
+            model=MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"Respond with a valid JSON array only—exactly {total_words} items, no extra text.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=TEMPERATURE,
+            max_tokens=MAX_TOKENS,
+        )
+
+        content = response.choices[0].message.content.strip() if response.choices else None
+        if not content:
+            raise ValueError("No content received from OpenAI.")
+
+        # Try to parse OpenAI response
+        try:
+            generated_words = json.loads(content)
+            if not isinstance(generated_words, list) or len(generated_words) != total_words:
+                raise ValueError(
+                    f"Expected {total_words} items but received {len(generated_words)}"
+                )
+        except json.JSONDecodeError as e:
+            print("Parse error:", e, "\nContent:", content)
+            raise ValueError("Failed to parse generated words")
+        return generated_words
@@ -13,6 +13,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 import os
+import tempfile
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -42,6 +43,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework.authtoken',
     'api',
@@ -121,6 +123,17 @@ DATABASES = {
 }
 
 
+# Cache shared by request handlers. Set CACHE_BACKEND/CACHE_LOCATION to Redis
+# or Memcached in production so every worker sees the same entries; the
+# default only lives inside one process.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -188,6 +201,45 @@ AUTHENTICATION_BACKENDS = (
     'django.contrib.auth.backends.ModelBackend',
 )
 
+# Seconds before a worker rebuilds its in-memory word suggestion index, which
+# is how words saved through other workers reach its autocomplete.
+WORD_SUGGESTION_INDEX_MAX_AGE = int(os.getenv('WORD_SUGGESTION_INDEX_MAX_AGE', 900))
+
+# ?random=true word lists: how long a shuffled id permutation is reused for
+# paging, and the most ids shuffled per permutation.
+RANDOM_WORDS_TTL = int(os.getenv('RANDOM_WORDS_TTL', 300))
+RANDOM_WORDS_MAX_POOL = int(os.getenv('RANDOM_WORDS_MAX_POOL', 20000))
+
+# /api/words/sync/: deletes are remembered this long; older cursors get a full
+# resync. Each cursor is backdated by the overlap so rows committed late by
+# slow transactions are sent again rather than missed.
+WORD_TOMBSTONE_RETENTION_DAYS = int(os.getenv('WORD_TOMBSTONE_RETENTION_DAYS', 90))
+WORD_SYNC_OVERLAP_SECONDS = int(os.getenv('WORD_SYNC_OVERLAP_SECONDS', 10))
+
+# Seconds a rendered catalog page (e.g. ?core=true words) is kept in the shared
+# cache; changes invalidate pages sooner through a version bump.
+PAGE_CACHE_TTL = int(os.getenv('PAGE_CACHE_TTL', 3600))
+
+# Cache-Control max-age of /api/words/featured/, which proxies may cache publicly
+FEATURED_WORDS_MAX_AGE = int(os.getenv('FEATURED_WORDS_MAX_AGE', 300))
+
+# Staff word lists and the admin show planner row estimates instead of an exact
+# COUNT(*) once a table or filter is estimated at this many rows or more.
+ESTIMATED_COUNT_THRESHOLD = int(os.getenv('ESTIMATED_COUNT_THRESHOLD', 50000))
+
+# German noun lexicon (articles and plurals) used to fill in and check new
+# German words; build it with `manage.py build_german_lexicon`.
+GERMAN_LEXICON_PATH = os.getenv('GERMAN_LEXICON_PATH', str(BASE_DIR / 'api' / 'data' / 'german_nouns.lex'))
+
+# MeCab tagger arguments (e.g. "-d /path/to/dictionary") and the dictionary's
+# feature layout, 'unidic' (unidic-lite, the default dictionary) or 'ipadic'
+MECAB_ARGS = os.getenv('MECAB_ARGS', '')
+MECAB_DICTIONARY = os.getenv('MECAB_DICTIONARY', 'unidic')
+
+# Directory of generated Anki decks (/api/words/anki/). A deck is rebuilt only
+# after the user's vocabulary changes; older builds are removed then.
+ANKI_EXPORT_DIR = os.getenv('ANKI_EXPORT_DIR', os.path.join(tempfile.gettempdir(), 'be_lernen_anki'))
+
 # Hugging Face API key
 HF_API_KEY = os.getenv('HF_API_KEY')
 MODEL_URL = os.getenv('MODEL_URL')
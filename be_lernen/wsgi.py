@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'be_lernen.settings')
 
 application = get_wsgi_application()
+
+# Build the in-memory autocomplete index before the first request hits it
+from api.services.word_index import word_suggestion_index  # noqa: E402
+
+word_suggestion_index.warm()